@@ -0,0 +1,217 @@
+"""
+Benchmark of installing a compatibility tool: fetch_project_release_data -> download_file -> checksum -> extract.
+Release information and archives are served by a local server mimicking GitHub/GitLab (see fakeupstream.py),
+so it measures ProtonUp-Qt and not the network. Each ctmod is also installed end-to-end using get_tool.
+
+    python benchmarks/bench_install_pipeline.py --size-mb 256 --files 2000
+    python benchmarks/bench_install_pipeline.py --quick --json -
+"""
+
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import zipfile
+import importlib
+import contextlib
+
+from benchutil import BenchmarkResults
+from fakeupstream import FakeUpstreamServer, FakeUpstreamAdapter, create_tool_archive, get_sha512sum, use_fake_upstream
+
+import requests
+
+from PySide6.QtCore import QCoreApplication
+
+from pupgui2 import ciutil
+from pupgui2.cacheutil import JsonFileCache
+from pupgui2.ciutil import get_workflow_run_artifacts
+from pupgui2.mirrorutil import verify_checksum
+from pupgui2.networkutil import download_file
+from pupgui2.util import fetch_project_release_data, extract_tar, extract_tar_zst, extract_zip
+
+
+GITLAB_RELEASES_URL = 'https://gitlab.com/api/v4/projects/12345/releases'
+TKG_REPO = 'Frogging-Family/wine-tkg-git'
+TKG_RUN_ID = 9876543210
+
+
+class _MainWindow:
+    """ The ctmods only need the access tokens of the main window """
+    web_access_tokens: dict[str, str] = {}
+
+
+def create_scenarios(server: FakeUpstreamServer, archive_dir: str, size: int, file_count: int, seed: int) -> list[dict]:
+    """
+    Generate the archives and register the releases for each scenario on server.
+    Return Type: list[dict]
+    """
+    def _archive(name: str, archive_format: str, top_dir: str) -> str:
+        return create_tool_archive(os.path.join(archive_dir, name), archive_format, top_dir, size, file_count, seed)
+
+    def _checksum_file(archive: str) -> str:
+        checksum_file = archive.rsplit('.tar', 1)[0] + '.sha512sum'
+        with open(checksum_file, 'w') as f:
+            f.write(get_sha512sum(archive))
+        return checksum_file
+
+    ge_archive = _archive('GE-Proton9-5.tar.gz', 'tar.gz', 'GE-Proton9-5')
+    server.add_github_release('GloriousEggroll/proton-ge-custom', 'GE-Proton9-5', [ge_archive, _checksum_file(ge_archive)])
+
+    dxvk_archive = _archive('dxvk-2.4.tar.gz', 'tar.gz', 'dxvk-2.4')
+    server.add_github_release('doitsujin/dxvk', 'v2.4', [dxvk_archive])
+
+    # GitHub Actions artifacts of wine-tkg-git are zip files containing a .tar.zst with a 'usr' directory
+    tkg_dir = os.path.join(archive_dir, 'tkg')
+    os.makedirs(tkg_dir)
+    tkg_zst = create_tool_archive(os.path.join(tkg_dir, 'wine-tkg-valve-exp-bleeding.tar.zst'), 'tar.zst', 'usr', size, file_count, seed)
+    tkg_zip = os.path.join(archive_dir, 'wine-tkg-build.zip')
+    with zipfile.ZipFile(tkg_zip, 'w') as zf:
+        zf.write(tkg_zst, os.path.basename(tkg_zst))
+    server.add_github_artifact(TKG_REPO, TKG_RUN_ID, 'wine-tkg-build', tkg_zip)
+
+    gitlab_archive = _archive('tool-1.0.tar.xz', 'tar.xz', 'tool-1.0')
+    server.add_gitlab_release(GITLAB_RELEASES_URL, 'v1.0', [gitlab_archive, _checksum_file(gitlab_archive)])
+
+    def _extract_tkg(archive: str, extract_dir: str) -> bool:
+        zip_dir = os.path.join(extract_dir, 'zip')
+        if not extract_zip(archive, zip_dir):
+            return False
+        return extract_tar_zst(os.path.join(zip_dir, os.path.basename(tkg_zst)), extract_dir)
+
+    def _tkg_metadata(rs: requests.Session) -> dict:
+        artifact = get_workflow_run_artifacts(rs, f'https://api.github.com/repos/{TKG_REPO}/actions/runs/{TKG_RUN_ID}/artifacts')[0]
+        return { 'download': f'https://nightly.link/{TKG_REPO}/actions/runs/{artifact["workflow_run"]["id"]}/{artifact["name"]}.zip' }
+
+    return [
+        {
+            'name': 'ctmod_00protonge', 'ctmod': 'ctmod_00protonge', 'tag': 'GE-Proton9-5',
+            'metadata': lambda rs: fetch_project_release_data('https://api.github.com/repos/GloriousEggroll/proton-ge-custom/releases', 'tar.gz', rs, tag='GE-Proton9-5', checksum_suffix='.sha512sum'),
+            'extract': lambda archive, extract_dir: extract_tar(archive, extract_dir, mode='gz'),
+        },
+        {
+            'name': 'ctmod_z0dxvk', 'ctmod': 'ctmod_z0dxvk', 'tag': 'v2.4',
+            'metadata': lambda rs: fetch_project_release_data('https://api.github.com/repos/doitsujin/dxvk/releases', 'tar.gz', rs, tag='v2.4'),
+            'extract': lambda archive, extract_dir: extract_tar(archive, extract_dir, mode='gz'),
+        },
+        {
+            'name': 'ctmod_protontkg', 'ctmod': 'ctmod_protontkg', 'tag': str(TKG_RUN_ID),
+            'metadata': _tkg_metadata,
+            'extract': _extract_tkg,
+        },
+        {
+            'name': 'gitlab tar.xz', 'ctmod': None, 'tag': 'v1.0',
+            'metadata': lambda rs: fetch_project_release_data(GITLAB_RELEASES_URL, 'tar.xz', rs, tag='v1.0', checksum_suffix='.sha512sum'),
+            'extract': lambda archive, extract_dir: extract_tar(archive, extract_dir, mode='xz'),
+        },
+    ]
+
+
+def create_session(server: FakeUpstreamServer) -> requests.Session:
+    rs = requests.Session()
+    rs.mount('https://', FakeUpstreamAdapter(server.base_url))
+    return rs
+
+
+def run_scenario(results: BenchmarkResults, scenario: dict, server: FakeUpstreamServer, work_dir: str, cache_dir: str, repeat: int):
+    """ Measure the stages of a scenario, and get_tool of its ctmod if it has one """
+    name = scenario['name']
+    rs = create_session(server)
+    artifact_cache = os.path.join(cache_dir, 'ci_artifacts.json')
+
+    def _clear_caches():
+        # Measure fetching the metadata, not reading it from the artifact cache of an earlier run
+        _remove(artifact_cache)
+        ciutil._artifact_cache = JsonFileCache(artifact_cache)  # Restored by use_fake_upstream
+
+    data = results.measure(f'{name}: metadata', lambda: scenario['metadata'](rs), repeat=repeat, setup=_clear_caches)
+
+    archive = os.path.join(work_dir, data['download'].split('/')[-1])
+    results.measure(f'{name}: download', lambda: download_file(data['download'], archive), repeat=repeat, setup=lambda: _remove(archive))
+    archive_size = os.path.getsize(archive)
+    results.stages[-1]['bytes'] = archive_size  # Not known before the download
+
+    if 'checksum' in data:
+        checksum = rs.get(data['checksum']).text
+        if not results.measure(f'{name}: hash', lambda: verify_checksum(archive, checksum), repeat=repeat, bytes=archive_size):
+            raise RuntimeError(f'{name}: checksum of {archive} does not match')
+
+    extract_dir = os.path.join(work_dir, 'extract')
+    if not results.measure(f'{name}: extract', lambda: scenario['extract'](archive, extract_dir), repeat=repeat, setup=lambda: _recreate(extract_dir), bytes=archive_size):
+        raise RuntimeError(f'{name}: could not extract {archive}')
+
+    if not scenario['ctmod']:
+        return
+
+    ctmod = importlib.import_module(f'pupgui2.resources.ctmods.{scenario["ctmod"]}')
+    installer = ctmod.CtInstaller(_MainWindow())
+    installer.rs.mount('https://', FakeUpstreamAdapter(server.base_url))
+
+    install_dir, temp_dir = os.path.join(work_dir, 'install'), os.path.join(work_dir, 'tmp')
+    def _setup_install():
+        _clear_caches()
+        _recreate(install_dir)
+        _recreate(temp_dir)
+
+    if not results.measure(f'{name}: get_tool', lambda: installer.get_tool(scenario['tag'], install_dir, temp_dir), repeat=repeat, setup=_setup_install, bytes=archive_size):
+        raise RuntimeError(f'{name}: get_tool failed')
+
+
+def _remove(path: str):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _recreate(path: str):
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+
+
+def run_benchmark(size: int, file_count: int, repeat: int, seed: int, scenarios: list[str] | None = None) -> BenchmarkResults:
+    results = BenchmarkResults('install_pipeline', { 'size': size, 'files': file_count, 'repeat': repeat, 'seed': seed })
+
+    app = QCoreApplication.instance() or QCoreApplication([])  # The ctmods translate their descriptions on import
+    with tempfile.TemporaryDirectory(prefix='bench_install_pipeline_') as root, FakeUpstreamServer() as server:
+        archive_dir, cache_dir = os.path.join(root, 'archives'), os.path.join(root, 'cache')
+        os.makedirs(archive_dir)
+        os.makedirs(cache_dir)
+
+        with use_fake_upstream(server, cache_dir):
+            for scenario in create_scenarios(server, archive_dir, size, file_count, seed):
+                if scenarios and scenario['name'] not in scenarios:
+                    continue
+                work_dir = os.path.join(root, 'work', scenario['name'].replace(' ', '_'))
+                os.makedirs(work_dir)
+                run_scenario(results, scenario, server, work_dir, cache_dir, repeat)
+                shutil.rmtree(work_dir)
+
+    del app
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark downloading and extracting compatibility tools from a local fake GitHub/GitLab')
+    parser.add_argument('--size-mb', type=float, default=64, help='Uncompressed size of each generated tool')
+    parser.add_argument('--files', type=int, default=500, help='Number of files in each generated tool')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs per stage, the median is reported')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the content of the generated tools')
+    parser.add_argument('--scenario', action='append', help='Only run the given scenario, e.g. ctmod_00protonge (can be given multiple times)')
+    parser.add_argument('--quick', action='store_true', help='Tiny archives and a single run, to test the benchmark itself')
+    parser.add_argument('--json', metavar='PATH', help="Write the results as JSON to PATH ('-' for stdout)")
+    args = parser.parse_args()
+
+    size, file_count, repeat = int(args.size_mb * 1024 * 1024), args.files, args.repeat
+    if args.quick:
+        size, file_count, repeat = 64 * 1024, 16, 1
+
+    # Keep stdout clean for the JSON results, ProtonUp-Qt prints warnings
+    with contextlib.redirect_stdout(sys.stderr if args.json == '-' else sys.stdout):
+        results = run_benchmark(size, file_count, repeat, args.seed, args.scenario)
+        results.print_table()
+
+    if args.json:
+        results.write_json(args.json)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark for util.py#sort_compatibility_tool_names with generated compatibility tool names.
+Run from the repository root: python benchmarks/bench_sort_compatibility_tool_names.py
+"""
+
+import os
+import sys
+import random
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pupgui2.util import sort_compatibility_tool_names, get_compatibility_tool_sort_key
+
+
+def generate_ctool_names(count: int, seed: int = 0) -> list[str]:
+    """ Generate count unique compatibility tool names of different formats """
+    rnd = random.Random(seed)
+    formats = [
+        lambda: f'GE-Proton{rnd.randint(7, 30)}-{rnd.randint(1, 99)}',
+        lambda: f'Proton-{rnd.randint(5, 30)}.{rnd.randint(0, 99)}',
+        lambda: f'Wine-GE-Proton{rnd.randint(7, 30)}-{rnd.randint(1, 99)}',
+        lambda: f'wine-tkg-git-{rnd.randint(7, 30)}.{rnd.randint(0, 22)}.r{rnd.randint(0, 99)}.g{rnd.getrandbits(28):07x}',
+        lambda: f'dxvk-{rnd.randint(1, 9)}.{rnd.randint(0, 99)}.{rnd.randint(0, 9)}',
+    ]
+
+    names = set()
+    while len(names) < count:
+        names.add(rnd.choice(formats)())
+
+    return list(names)
+
+
+def main():
+    for count in [100, 1000, 10000]:
+        names = generate_ctool_names(count)
+
+        get_compatibility_tool_sort_key.cache_clear()
+        cold = timeit.timeit(lambda: sort_compatibility_tool_names(names), number=1)
+        warm = min(timeit.repeat(lambda: sort_compatibility_tool_names(names), number=1, repeat=5))
+
+        print(f'{count:>6} names: {cold * 1000:8.2f} ms (cold), {warm * 1000:8.2f} ms (cached keys)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+"""
+Benchmark for parsing a Steam library (steamutil.py and the game index) with a generated Steam root.
+Run from the repository root: python benchmarks/bench_steamutil.py [--apps 500] [--json results.json]
+
+The generated Steam root contains library folders with appmanifests and install directories, a binary appinfo.vdf
+(installed apps are mixed with many apps which are not installed, like a real one), a large config.vdf and shortcuts.vdf.
+"cold" runs clear the caches of ProtonUp-Qt before each run (the operating system file cache stays warm).
+"""
+
+import os
+import sys
+import random
+import shutil
+import struct
+import argparse
+import contextlib
+import tempfile
+
+from benchutil import BenchmarkResults
+
+import vdf
+
+from pupgui2 import steamutil
+from pupgui2.datastructures import SteamApp
+from pupgui2.gameindex import GameIndex
+
+
+COMPAT_TOOLS = { 'proton_9': 2805730, 'proton_8': 2348590, 'proton_experimental': 1493710, 'proton_hotfix': 2180100 }
+CUSTOM_COMPAT_TOOLS = [ 'GE-Proton9-5', 'GE-Proton9-20', 'GE-Proton10-1', 'Proton-stl' ]
+STEAM_COMPAT_TOOLS_APPID = 891390
+
+
+def write_appinfo(path: str, apps: list[dict]) -> int:
+    """
+    Write a binary appinfo.vdf (format 0x07564428 with data SHA1) with the given app data.
+    Return Type: int (file size)
+    """
+    with open(path, 'wb') as f:
+        f.write(b'(DV\x07')
+        f.write(struct.pack('<I', 1))  # Universe
+        for app in apps:
+            data = vdf.binary_dumps({'appinfo': app})
+            header = struct.pack('<IIQ', 2, 1700000000, 0) + b'\x00' * 20 + struct.pack('<I', 12345) + b'\x00' * 20
+            f.write(struct.pack('<II', app['appid'], len(header) + len(data)))
+            f.write(header)
+            f.write(data)
+        f.write(struct.pack('<I', 0))
+
+    return os.path.getsize(path)
+
+
+def create_appinfo_app(rnd: random.Random, appid: int, installed: bool) -> dict:
+    """ Generate the appinfo data of an app, with the sections read by steamutil and some filler like a real appinfo.vdf """
+    app = {
+        'appid': appid,
+        'common': {
+            'name': f'Generated Game {appid}',
+            'type': 'Game',
+            'oslist': rnd.choice(['windows', 'windows,linux', 'windows,macos,linux']),
+            'steam_deck_compatibility': { 'category': str(rnd.randint(0, 3)), 'test_timestamp': str(rnd.randint(1600000000, 1700000000)) },
+            'associations': { str(i): { 'type': 'developer', 'name': f'Studio {rnd.randint(1, 500)}' } for i in range(2) },
+        },
+        'extended': { 'developer': 'Studio', 'homepage': f'https://example.com/{appid}' },
+        'config': { 'installdir': f'Game{appid}', 'launch': { str(i): { 'executable': f'game{i}.exe', 'type': 'default' } for i in range(rnd.randint(1, 4)) } },
+        'depots': { str(appid + i): { 'manifests': { 'public': { 'gid': str(rnd.getrandbits(63)), 'size': str(rnd.getrandbits(32)) } } } for i in range(1, rnd.randint(2, 6)) },
+    }
+    if installed and rnd.random() < 0.1:
+        app['extended']['additional_dependencies'] = { '0': { 'src_os': 'windows', 'dest_os': 'linux', 'appid': rnd.choice([1826330, 1161040]), 'comment': 'Anti-Cheat runtime' } }
+
+    return app
+
+
+def create_steam_root(root: str, libraries: int, apps: int, appinfo_apps: int, shortcuts: int, config_entries: int, seed: int = 0) -> dict[str, int]:
+    """
+    Generate a Steam root directory at root.
+    Return Type: dict[str, int] (generated file -> size in bytes)
+    """
+    rnd = random.Random(seed)
+    config_dir = os.path.join(root, 'config')
+    os.makedirs(config_dir)
+
+    installed_appids = rnd.sample(range(10, appinfo_apps * 10), apps)
+
+    # Library folders with appmanifests and install directories
+    library_paths = [root] + [os.path.join(root, 'libraries', f'lib{i}') for i in range(1, libraries)]
+    library_folders = {}
+    for i, library_path in enumerate(library_paths):
+        library_appids = installed_appids[i::len(library_paths)]
+        steamapps_dir = os.path.join(library_path, 'steamapps')
+        os.makedirs(os.path.join(steamapps_dir, 'common'))
+        for appid in library_appids:
+            os.makedirs(os.path.join(steamapps_dir, 'common', f'Game{appid}'))
+            with open(os.path.join(steamapps_dir, f'appmanifest_{appid}.acf'), 'w') as f:
+                vdf.dump({'AppState': { 'appid': str(appid), 'name': f'Generated Game {appid}', 'installdir': f'Game{appid}', 'SizeOnDisk': str(rnd.getrandbits(34)), 'StateFlags': '4' }}, f, pretty=True)
+        library_folders[str(i)] = { 'path': library_path, 'label': '', 'apps': { str(appid): str(rnd.getrandbits(32)) for appid in library_appids } }
+
+    with open(os.path.join(config_dir, 'libraryfolders.vdf'), 'w') as f:
+        vdf.dump({'libraryfolders': library_folders}, f, pretty=True)
+
+    # config.vdf, compatibility tools for part of the installed apps and many other entries
+    compat_tool_names = list(COMPAT_TOOLS) + CUSTOM_COMPAT_TOOLS
+    compat_tool_mapping = { '0': { 'name': 'proton_9', 'config': '', 'priority': '75' } }
+    config_appids = range(10, appinfo_apps * 10)
+    config_entries = min(config_entries, len(config_appids))
+    for appid in rnd.sample(installed_appids, apps // 2) + rnd.sample(config_appids, config_entries):
+        compat_tool_mapping[str(appid)] = { 'name': rnd.choice(compat_tool_names), 'config': '', 'priority': '250' }
+    steam_apps = { str(appid): { 'LastPlayed': str(rnd.randint(1600000000, 1700000000)), 'cloud': { 'last_sync_state': 'synchronized' } } for appid in rnd.sample(config_appids, config_entries) }
+    with open(os.path.join(config_dir, 'config.vdf'), 'w') as f:
+        vdf.dump({'InstallConfigStore': { 'Software': { 'Valve': { 'Steam': { 'CompatToolMapping': compat_tool_mapping, 'apps': steam_apps } } } } }, f, pretty=True)
+
+    # appinfo.vdf, installed apps are mixed with apps which are not installed
+    appcache_dir = os.path.join(root, 'appcache')
+    os.makedirs(appcache_dir)
+    installed = set(installed_appids)
+    appinfo_appids = list(installed | set(rnd.sample(range(10, appinfo_apps * 10), appinfo_apps - apps)))
+    rnd.shuffle(appinfo_appids)
+    appinfo = [create_appinfo_app(rnd, appid, appid in installed) for appid in appinfo_appids]
+    appinfo.insert(rnd.randint(0, len(appinfo)), {
+        'appid': STEAM_COMPAT_TOOLS_APPID,
+        'common': { 'name': 'Steam Play' },
+        'extended': { 'compat_tools': { name: { 'appid': appid, 'from_oslist': 'windows', 'to_oslist': 'linux', 'display_name': name } for name, appid in COMPAT_TOOLS.items() } },
+    })
+    write_appinfo(os.path.join(appcache_dir, 'appinfo.vdf'), appinfo)
+
+    # Non-Steam games
+    shortcuts_file = os.path.join(root, 'userdata', '12345678', 'config', 'shortcuts.vdf')
+    os.makedirs(os.path.dirname(shortcuts_file))
+    with open(shortcuts_file, 'wb') as f:
+        f.write(vdf.binary_dumps({'shortcuts': { str(i): {
+            'appid': rnd.randint(-2 ** 31, -1),
+            'AppName': f'Shortcut {i}',
+            'Exe': f'"/home/user/Games/shortcut{i}/game.exe"',
+            'StartDir': f'"/home/user/Games/shortcut{i}/"',
+            'icon': '',
+            'LaunchOptions': '',
+            'tags': {},
+        } for i in range(shortcuts) }}))
+
+    files = [os.path.join(config_dir, 'libraryfolders.vdf'), os.path.join(config_dir, 'config.vdf'), os.path.join(appcache_dir, 'appinfo.vdf'), shortcuts_file]
+    return { os.path.relpath(path, root): os.path.getsize(path) for path in files }
+
+
+def clear_steamutil_caches():
+    steamutil._cached_app_lists.clear()
+    steamutil._cached_steam_ctool_id_map = None
+
+
+def create_installed_steam_apps(steam_config_folder: str) -> list[SteamApp]:
+    """ SteamApps with only the information from libraryfolders.vdf, like get_steam_app_list creates them """
+    libraryfolders = steamutil.vdf_safe_load(os.path.join(steam_config_folder, 'libraryfolders.vdf')).get('libraryfolders', {})
+    apps = []
+    for fid, folder in libraryfolders.items():
+        for appid in folder.get('apps', {}):
+            app = SteamApp()
+            app.app_id = int(appid)
+            app.libraryfolder_id = fid
+            apps.append(app)
+
+    return apps
+
+
+def run_benchmark(args: argparse.Namespace, root: str) -> BenchmarkResults:
+    parameters = { 'libraries': args.libraries, 'apps': args.apps, 'appinfo_apps': args.appinfo_apps, 'shortcuts': args.shortcuts, 'config_entries': args.config_entries, 'seed': args.seed }
+    results = BenchmarkResults('steamutil', parameters)
+
+    file_sizes = create_steam_root(root, args.libraries, args.apps, args.appinfo_apps, args.shortcuts, args.config_entries, args.seed)
+    results.parameters['file_sizes'] = file_sizes
+
+    steam_config_folder = os.path.join(root, 'config')
+    install_loc = { 'install_dir': os.path.join(root, 'compatibilitytools.d'), 'launcher': 'steam', 'vdf_dir': steam_config_folder }
+
+    apps = results.measure('get_steam_app_list (cold)', lambda: steamutil.get_steam_app_list(steam_config_folder), repeat=args.repeat, setup=clear_steamutil_caches)
+    results.measure('get_steam_app_list (warm)', lambda: steamutil.get_steam_app_list(steam_config_folder), repeat=args.repeat)
+    results.measure('get_steam_app_list (cached)', lambda: steamutil.get_steam_app_list(steam_config_folder, cached=True), repeat=args.repeat)
+
+    installed_apps: list[SteamApp] = []
+    def _setup_installed_apps():
+        installed_apps[:] = create_installed_steam_apps(steam_config_folder)
+    results.measure('update_steamapp_info', lambda: steamutil.update_steamapp_info(steam_config_folder, installed_apps), repeat=args.repeat, setup=_setup_installed_apps)
+    results.measure('get_steam_shortcuts_list', lambda: steamutil.get_steam_shortcuts_list(steam_config_folder), repeat=args.repeat)
+
+    game_index = GameIndex()
+    results.measure('game index snapshot (cold)', lambda: game_index.get_snapshot(install_loc, refresh=True), repeat=args.repeat, setup=lambda: (clear_steamutil_caches(), game_index.invalidate()))
+    results.measure('game index snapshot (unchanged)', lambda: game_index.get_snapshot(install_loc, refresh=True), repeat=args.repeat)
+
+    games = len([app for app in apps if app.app_type == 'game' and not app.shortcut_id])
+    if games == 0:
+        print('Warning: No game names were read from appinfo.vdf, the installed steam module may not support this format', file=sys.stderr)
+    results.parameters['games_found'] = games
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Steam library parsing with a generated Steam root.')
+    parser.add_argument('--libraries', type=int, default=4, help='number of library folders')
+    parser.add_argument('--apps', type=int, default=500, help='number of installed apps (appmanifests)')
+    parser.add_argument('--appinfo-apps', type=int, default=20000, help='number of apps in appinfo.vdf, including the installed ones')
+    parser.add_argument('--shortcuts', type=int, default=200, help='number of Non-Steam games in shortcuts.vdf')
+    parser.add_argument('--config-entries', type=int, default=5000, help='additional entries in config.vdf (at most 10 per app in appinfo.vdf)')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs per stage, the median is reported')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the generated Steam root')
+    parser.add_argument('--json', metavar='PATH', help="write the results as JSON to PATH ('-' for stdout)")
+    parser.add_argument('--keep', metavar='DIR', help='generate the Steam root in DIR and keep it')
+    args = parser.parse_args()
+
+    if min(args.libraries, args.apps, args.appinfo_apps, args.shortcuts, args.config_entries, args.repeat) < 0:
+        parser.error('the numbers must not be negative')
+    if args.apps > args.appinfo_apps:
+        parser.error('--appinfo-apps must be at least --apps, appinfo.vdf contains all installed apps')
+
+    root = args.keep or tempfile.mkdtemp(prefix='pupgui2-bench-steam-')
+    try:
+        with contextlib.redirect_stdout(sys.stderr if args.json == '-' else sys.stdout):  # Keep messages of steamutil out of the JSON
+            results = run_benchmark(args, os.path.join(root, 'Steam') if args.keep else root)
+    finally:
+        if not args.keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+    if args.json:
+        results.write_json(args.json)
+    if args.json != '-':
+        results.print_table()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Helpers shared by the benchmarks: timing of stages and machine-readable results.
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import statistics
+
+from typing import Any, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class BenchmarkResults:
+    """ Timings of a benchmark run, printed as a table and optionally written as JSON """
+
+    def __init__(self, name: str, parameters: dict[str, Any]):
+        self.name = name
+        self.parameters = parameters
+        self.stages: list[dict[str, Any]] = []
+
+    def measure(self, stage: str, func: Callable[[], Any], repeat: int = 1, setup: Callable[[], Any] = lambda: None, **extra) -> Any:
+        """
+        Run func repeat times (calling setup before each run, not timed) and record the timings as stage.
+        Extra values are recorded with the timings, 'bytes' adds the throughput to the table.
+        Return Type: Any (result of the last run)
+        """
+        timings = []
+        result = None
+        for _ in range(max(repeat, 1)):
+            setup()
+            start = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+
+        self.add(stage, timings, **extra)
+        return result
+
+    def add(self, stage: str, timings: list[float], **extra):
+        """ Record timings (seconds) measured outside of measure() """
+        self.stages.append({
+            'stage': stage,
+            'runs': len(timings),
+            'min_ms': min(timings) * 1000,
+            'median_ms': statistics.median(timings) * 1000,
+            'max_ms': max(timings) * 1000,
+            **extra,
+        })
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'benchmark': self.name,
+            'parameters': self.parameters,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'stages': self.stages,
+        }
+
+    def print_table(self):
+        print(f'{self.name} ({", ".join(f"{k}={v}" for k, v in self.parameters.items())})')
+        for s in self.stages:
+            throughput = f', {s["bytes"] / s["median_ms"] / 1000:.1f} MB/s' if s.get('bytes') and s['median_ms'] else ''
+            print(f'  {s["stage"]:<32} {s["median_ms"]:10.2f} ms (min {s["min_ms"]:.2f} ms, {s["runs"]} runs{throughput})')
+
+    def write_json(self, path: str):
+        """ Write the results to path, '-' writes to stdout """
+        if path == '-':
+            json.dump(self.to_dict(), sys.stdout, indent=2)
+            print()
+            return
+
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
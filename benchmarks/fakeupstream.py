@@ -0,0 +1,213 @@
+"""
+Local HTTP server that mimics the GitHub/GitLab release APIs and serves generated compatibility tool archives.
+It uses the layout of a mirror (<base_url>/<host>/<path>, see mirrorutil.py#get_mirror_url), so ProtonUp-Qt is pointed
+at it like at a mirror. Used by benchmarks/bench_install_pipeline.py and the install pipeline tests.
+"""
+
+import io
+import os
+import json
+import random
+import hashlib
+import tarfile
+import zipfile
+import threading
+import contextlib
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from unittest import mock
+from urllib.parse import urlsplit
+
+import requests
+import zstandard
+
+from pupgui2.cacheutil import JsonFileCache
+
+
+ARCHIVE_FORMATS = [ 'tar.gz', 'tar.xz', 'tar.zst', 'tar', 'zip' ]
+
+
+def generate_file_content(rnd: random.Random, size: int) -> bytes:
+    """ Half random, half zero bytes, compresses roughly like the binaries in a compatibility tool """
+    return rnd.randbytes(size // 2) + bytes(size - size // 2)
+
+
+def create_tool_archive(path: str, archive_format: str, top_dir: str, size: int, file_count: int, seed: int = 0) -> str:
+    """
+    Create an archive with file_count files of about size bytes in total below top_dir, e.g. GE-Proton9-5/files/lib/file12.so
+    Return Type: str (path)
+    """
+    rnd = random.Random(seed)
+    file_size = max(size // max(file_count, 1), 1)
+    files = [(f'{top_dir}/files/{rnd.choice(["bin", "lib", "lib64", "share"])}/file{i}', generate_file_content(rnd, file_size)) for i in range(file_count)]
+
+    if archive_format == 'zip':
+        with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            for name, content in files:
+                zf.writestr(name, content)
+        return path
+
+    def _write_tar(tf: tarfile.TarFile):
+        for name, content in files:
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            info.mode = 0o755
+            tf.addfile(info, io.BytesIO(content))
+
+    if archive_format == 'tar.zst':
+        with open(path, 'wb') as f, zstandard.ZstdCompressor().stream_writer(f) as zf, tarfile.open(fileobj=zf, mode='w|') as tf:
+            _write_tar(tf)
+    else:
+        with tarfile.open(path, {'tar.gz': 'w:gz', 'tar.xz': 'w:xz', 'tar': 'w'}[archive_format]) as tf:
+            _write_tar(tf)
+
+    return path
+
+
+def get_sha512sum(path: str) -> str:
+    """
+    Return the content of a .sha512sum file for path, like published with GE-Proton releases.
+    Return Type: str
+    """
+    sha512 = hashlib.sha512()
+    with open(path, 'rb') as f:
+        while data := f.read(1024 * 1024):
+            sha512.update(data)
+
+    return f'{sha512.hexdigest()}  {os.path.basename(path)}\n'
+
+
+class FakeUpstreamServer:
+    """ Serves registered JSON responses and files, e.g. /api.github.com/repos/<owner>/<repo>/releases/latest """
+
+    def __init__(self):
+        self.routes: dict[str, tuple[bytes | str, str]] = {}  # '/<host>/<path>' -> (content or file path, content type)
+        self.requested_paths: list[str] = []
+        self._releases: dict[str, list[dict]] = {}  # release list url -> releases, newest first
+
+        server = self
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                server.requested_paths.append(path)
+                if path not in server.routes:
+                    self.send_error(404)
+                    return
+
+                content, content_type = server.routes[path]
+                size = len(content) if isinstance(content, bytes) else os.path.getsize(content)
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(size))
+                self.end_headers()
+
+                if isinstance(content, bytes):
+                    self.wfile.write(content)
+                else:
+                    with open(content, 'rb') as f:
+                        while data := f.read(1024 * 1024):
+                            self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), _RequestHandler)
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.httpd.server_address[1]}'
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def add_json(self, url: str, data: dict | list):
+        split_url = urlsplit(url)
+        self.routes[f'/{split_url.netloc}{split_url.path}'] = (json.dumps(data).encode(), 'application/json')
+
+    def add_file(self, url: str, path: str):
+        split_url = urlsplit(url)
+        self.routes[f'/{split_url.netloc}{split_url.path}'] = (path, 'application/octet-stream')
+
+    def add_github_release(self, repo: str, tag: str, asset_paths: list[str], date: str = '2024-06-01T12:00:00Z') -> dict:
+        """
+        Register a release of a GitHub repository (e.g. 'GloriousEggroll/proton-ge-custom') with the files at asset_paths as assets.
+        Return Type: dict (release as returned by the API)
+        """
+        assets = []
+        for path in asset_paths:
+            download_url = f'https://github.com/{repo}/releases/download/{tag}/{os.path.basename(path)}'
+            self.add_file(download_url, path)
+            assets.append({ 'name': os.path.basename(path), 'size': os.path.getsize(path), 'browser_download_url': download_url })
+
+        release = { 'tag_name': tag, 'name': tag, 'published_at': date, 'assets': assets }
+        return self._add_release(f'https://api.github.com/repos/{repo}/releases', f'tags/{tag}', release)
+
+    def add_gitlab_release(self, releases_url: str, tag: str, asset_paths: list[str], date: str = '2024-06-01T12:00:00Z') -> dict:
+        """
+        Register a release for a GitLab releases API url (e.g. 'https://gitlab.com/api/v4/projects/<id>/releases').
+        Return Type: dict (release as returned by the API)
+        """
+        links = []
+        project_url = releases_url.split('/api/')[0]
+        for path in asset_paths:
+            download_url = f'{project_url}/-/releases/{tag}/downloads/{os.path.basename(path)}'
+            self.add_file(download_url, path)
+            links.append({ 'name': os.path.basename(path), 'url': download_url })
+
+        release = { 'tag_name': tag, 'name': tag, 'released_at': date, 'assets': { 'links': links } }
+        return self._add_release(releases_url, tag, release)
+
+    def add_github_artifact(self, repo: str, run_id: int, name: str, zip_path: str, head_sha: str = '0123456789abcdef') -> dict:
+        """
+        Register a GitHub Actions artifact of a workflow run, downloaded from nightly.link like the ctmods do.
+        Return Type: dict (artifact as returned by the API)
+        """
+        artifact = {
+            'id': run_id * 10, 'name': name, 'size_in_bytes': os.path.getsize(zip_path), 'updated_at': '2024-06-01T12:00:00Z', 'expired': False,
+            'workflow_run': { 'id': run_id, 'head_sha': head_sha, 'head_branch': 'master' },
+        }
+        self.add_json(f'https://api.github.com/repos/{repo}/actions/runs/{run_id}/artifacts', { 'total_count': 1, 'artifacts': [artifact] })
+        self.add_file(f'https://nightly.link/{repo}/actions/runs/{run_id}/{name}.zip', zip_path)
+        return artifact
+
+    def _add_release(self, releases_url: str, tag_path: str, release: dict) -> dict:
+        releases = self._releases.setdefault(releases_url, [])
+        releases.insert(0, release)
+        self.add_json(f'{releases_url}/{tag_path}', release)
+        self.add_json(f'{releases_url}/latest', releases[0])
+        self.add_json(releases_url, releases)
+        return release
+
+
+class FakeUpstreamAdapter(requests.adapters.HTTPAdapter):
+    """ Sends requests for https://<host>/<path> to the fake server, mounted on the requests.Session of a ctmod """
+
+    def __init__(self, base_url: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base_url = base_url
+
+    def send(self, request, **kwargs):
+        split_url = urlsplit(request.url)
+        request.url = f'{self.base_url}/{split_url.netloc}{split_url.path}' + (f'?{split_url.query}' if split_url.query else '')
+        return super().send(request, **kwargs)
+
+
+@contextlib.contextmanager
+def use_fake_upstream(server: FakeUpstreamServer, cache_dir: str):
+    """
+    Use server as mirror for release information and downloads, without touching the config file or the caches in the home directory.
+    Sessions of ctmods still need a FakeUpstreamAdapter for the requests they make themselves (e.g. checksum files).
+    """
+    with mock.patch('pupgui2.util.config_mirror_url', return_value=server.base_url), \
+            mock.patch('pupgui2.networkutil.config_mirror_url', return_value=server.base_url), \
+            mock.patch('pupgui2.networkutil.config_archive_cache_size', return_value=0), \
+            mock.patch('pupgui2.ciutil._artifact_cache', JsonFileCache(os.path.join(cache_dir, 'ci_artifacts.json'))):
+        yield
@@ -0,0 +1,334 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+
+class JsonFileCache:
+    """
+    Persistent key-value cache stored in a JSON file.
+    Each entry remembers when it was written and is considered stale after 'ttl' seconds (never if ttl=None),
+    entries can have their own ttl (see set).
+    The file is read lazily on first access. Changes are only written to disk when calling save().
+    """
+
+    def __init__(self, cache_file: str, ttl: float | None = None) -> None:
+        self.cache_file = cache_file
+        self.ttl = ttl
+
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """ Load the cache file if it was not loaded yet. Must be called with self._lock held. """
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if os.path.isfile(self.cache_file):
+            try:
+                with open(self.cache_file, 'r') as f:
+                    entries = json.load(f)
+                if isinstance(entries, dict):
+                    self._entries = entries
+            except Exception as e:
+                print(f'Warning: Could not read cache file {self.cache_file}, starting with an empty cache: {e}')
+
+        return self._entries
+
+    def _is_fresh(self, entry: dict[str, Any]) -> bool:
+        ttl = entry.get('ttl', self.ttl)
+        if ttl is None:
+            return True
+        return time.time() - entry.get('time', 0) < ttl
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return the cached value for key, or default if there is no entry or the entry is stale.
+        Return Type: Any
+        """
+        with self._lock:
+            entry = self._load().get(str(key))
+
+        if entry is None or not self._is_fresh(entry):
+            return default
+
+        return entry.get('value', default)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """ Store value for key, stale after ttl seconds instead of the ttl of the cache if given. Call save() to write the cache to disk. """
+        entry = {'time': time.time(), 'value': value}
+        if ttl is not None:
+            entry['ttl'] = ttl
+
+        with self._lock:
+            self._load()[str(key)] = entry
+            self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Write the cache to disk if anything changed. Stale entries are dropped.
+        The file is replaced atomically so a crash never leaves a half-written cache behind.
+        Return Type: bool
+        """
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return True
+
+            entries = {k: v for k, v in self._entries.items() if self._is_fresh(v)}
+            tmp_file = f'{self.cache_file}.tmp'
+            try:
+                os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+                with open(tmp_file, 'w') as f:
+                    json.dump(entries, f)
+                os.replace(tmp_file, self.cache_file)
+            except OSError as e:
+                print(f'Warning: Could not write cache file {self.cache_file}: {e}')
+                return False
+
+            self._entries = entries
+            self._dirty = False
+
+        return True
+
+
+class ArchiveCache:
+    """
+    Persistent cache for downloaded archives, so installing the same version again (e.g. for another launcher) needs no download.
+    Archives are stored by a hash of their download url and checksum. The least recently used archives are removed
+    when the size of all archives exceeds max_size bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int) -> None:
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+
+    def get_cache_path(self, url: str, checksum: str = '') -> str:
+        """
+        Return the path an archive is (or would be) stored at, e.g. <cache_dir>/<sha256>-GE-Proton9-5.tar.gz
+        Return Type: str
+        """
+        key = hashlib.sha256(f'{url}\n{checksum.strip()}'.encode()).hexdigest()
+        file_name = os.path.basename(urlsplit(url).path)[-64:]
+        return os.path.join(self.cache_dir, f'{key}-{file_name}')
+
+    def get(self, url: str, checksum: str = '') -> str | None:
+        """
+        Return the path of the cached archive for url, or None if it is not cached.
+        Return Type: str | None
+        """
+        cache_path = self.get_cache_path(url, checksum)
+        with self._lock:
+            if not os.path.isfile(cache_path):
+                return None
+            try:
+                os.utime(cache_path)  # Mark as recently used
+            except OSError:
+                pass
+        return cache_path
+
+    def put(self, url: str, file_path: str, checksum: str = '') -> bool:
+        """
+        Add a downloaded archive to the cache and remove the least recently used archives if the cache is too large.
+        Return Type: bool
+        """
+        try:
+            file_size = os.path.getsize(file_path)
+        except OSError:
+            return False
+
+        if self.max_size <= 0 or file_size > self.max_size:
+            return False
+
+        cache_path = self.get_cache_path(url, checksum)
+        with self._lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = f'{cache_path}.tmp'
+                link_or_copy_file(file_path, tmp_path)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f'Warning: Could not add {file_path} to the archive cache: {e}')
+                return False
+
+            self._evict(keep=cache_path)
+
+        return True
+
+    def _evict(self, keep: str = '') -> None:
+        """ Remove least recently used archives until all archives fit into max_size. Must be called with self._lock held. """
+        try:
+            entries = [entry for entry in os.scandir(self.cache_dir) if entry.is_file(follow_symlinks=False)]
+        except OSError:
+            return
+
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        total_size = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total_size <= self.max_size:
+                break
+            if entry.path == keep:
+                continue
+            try:
+                os.remove(entry.path)
+                total_size -= entry.stat().st_size
+            except OSError as e:
+                print(f'Warning: Could not remove {entry.path} from the archive cache: {e}')
+
+
+def link_or_copy_file(src: str, dst: str) -> None:
+    """
+    Hardlink src to dst, or copy it if they are on different file systems.
+    Raises: OSError
+    """
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+class DirectoryIndex:
+    """
+    Parsed content of all files with a given suffix in a directory, e.g. all Lutris game configs in 'lutris/games'.
+    When refreshing, only files that were added or changed since the last refresh (by mtime and size) are parsed again.
+    """
+
+    def __init__(self, suffix: str, load_file: Callable[[str], Any]) -> None:
+        self.suffix = suffix
+        self.load_file = load_file
+
+        self._file_versions: dict[str, dict[str, tuple[int, int]]] = {}  # directory -> file name -> (mtime, size)
+        self._contents: dict[str, dict[str, Any]] = {}  # directory -> file name -> parsed content
+        self._lock = threading.Lock()
+
+    def get(self, directory: str, cached: bool = True) -> dict[str, Any]:
+        """
+        Return file name -> parsed content for all files in directory. The returned dict must not be modified.
+        If cached is False or the directory was not indexed yet, the index is refreshed first.
+        Return Type: dict[str, Any]
+        """
+        with self._lock:
+            if not cached or directory not in self._contents:
+                self._refresh(directory)
+            return self._contents[directory]
+
+    def _refresh(self, directory: str) -> None:
+        """ Index directory again, reusing unchanged entries. Must be called with self._lock held. """
+        file_versions = self._file_versions.get(directory, {})
+        contents = self._contents.get(directory, {})
+
+        new_file_versions: dict[str, tuple[int, int]] = {}
+        new_contents: dict[str, Any] = {}
+        try:
+            entries = [entry for entry in os.scandir(directory) if entry.name.endswith(self.suffix) and entry.is_file()]
+        except OSError:
+            entries = []
+
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+
+            file_version = (stat.st_mtime_ns, stat.st_size)
+            if file_versions.get(entry.name) == file_version:
+                new_contents[entry.name] = contents[entry.name]
+            else:
+                try:
+                    new_contents[entry.name] = self.load_file(entry.path)
+                except Exception as e:
+                    print(f'Warning: Could not read {entry.path}: {e}')
+                    continue
+            new_file_versions[entry.name] = file_version
+
+        self._file_versions[directory] = new_file_versions
+        self._contents[directory] = new_contents
+
+
+def load_json_file(path: str) -> Any:
+    """
+    Parse a JSON file, can be used as load_file for DirectoryIndex and ParsedFileCache.
+    Return Type: Any
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+class ParsedFileCache:
+    """
+    Parsed content of single files (e.g. JSON files of a launcher), parsed again only when their mtime or size changes.
+    """
+
+    def __init__(self, load_file: Callable[[str], Any]) -> None:
+        self.load_file = load_file
+
+        self._files: dict[str, tuple[tuple[int, int], Any]] = {}  # path -> ((mtime, size), parsed content)
+        self._lock = threading.Lock()
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """
+        Return the parsed content of the file at path, or default if it does not exist or cannot be parsed.
+        The returned value must not be modified.
+        Return Type: Any
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return default
+
+        file_version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._files.get(path)
+            if cached and cached[0] == file_version:
+                return cached[1]
+
+            try:
+                content = self.load_file(path)
+            except Exception as e:
+                print(f'Warning: Could not read {path}: {e}')
+                return default
+
+            self._files[path] = (file_version, content)
+            return content
+
+
+def get_path_stamp(paths: list[str]) -> tuple:
+    """
+    Return a value that changes when one of the files in paths changes (by mtime and size).
+    For directories, the files directly inside them are included as well. Missing paths are allowed.
+    Return Type: tuple
+    """
+    stamp = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamp.append((path, None))
+            continue
+
+        stamp.append((path, stat.st_mtime_ns, stat.st_size))
+        if not os.path.isdir(path):
+            continue
+
+        try:
+            entries = sorted(os.scandir(path), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                entry_stat = entry.stat()
+            except OSError:
+                continue
+            stamp.append((entry.path, entry_stat.st_mtime_ns, entry_stat.st_size))
+
+    return tuple(stamp)
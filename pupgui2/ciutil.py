@@ -0,0 +1,111 @@
+import time
+import threading
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pupgui2.cacheutil import JsonFileCache
+from pupgui2.constants import CI_ARTIFACT_CACHE_FILE, CI_ARTIFACT_CACHE_TTL, CI_WORKFLOW_CACHE_TTL, CI_MAX_WORKERS
+from pupgui2.util import ghapi_rlcheck
+
+
+# Only these fields of a GitHub Actions artifact are used by the ctmods, so only these are cached
+ARTIFACT_FIELDS = ('id', 'name', 'size_in_bytes', 'updated_at', 'expired')
+ARTIFACT_WORKFLOW_RUN_FIELDS = ('id', 'head_sha', 'head_branch')
+
+_artifact_cache = JsonFileCache(CI_ARTIFACT_CACHE_FILE, ttl=CI_ARTIFACT_CACHE_TTL)  # run artifacts url -> list of artifacts
+
+_workflows_cache: dict[str, tuple[float, list[dict]]] = {}  # workflows url -> (time, workflows)
+_workflows_cache_lock = threading.Lock()
+
+
+def get_workflows(rs: requests.Session, workflows_url: str) -> list[dict]:
+    """
+    List the GitHub Actions workflows of a repository, e.g. https://api.github.com/repos/<owner>/<repo>/actions/workflows
+    The list is kept in memory for CI_WORKFLOW_CACHE_TTL seconds, as several ctmods use the workflows of the same repository.
+    Return Type: list[dict]
+    """
+    with _workflows_cache_lock:
+        cached = _workflows_cache.get(workflows_url)
+        if cached and time.time() - cached[0] < CI_WORKFLOW_CACHE_TTL:
+            return cached[1]
+
+    response = rs.get(workflows_url, params={'per_page': 100})
+    workflows = ghapi_rlcheck(response.json()).get('workflows', [])
+    if response.status_code == 200:
+        with _workflows_cache_lock:
+            _workflows_cache[workflows_url] = (time.time(), workflows)
+
+    return workflows
+
+
+def fetch_successful_workflow_runs(rs: requests.Session, workflows_url: str, workflow_path: str, branch: str = '', count: int = 30) -> list[dict]:
+    """
+    List the latest successful runs of all active workflows whose path contains workflow_path.
+    GitHub filters the runs by status (and branch if given), so failed runs never need to be paged through.
+    Runs of different workflows are fetched at the same time.
+
+    Parameters:
+        workflows_url: str
+            e.g. https://api.github.com/repos/<owner>/<repo>/actions/workflows
+        workflow_path: str
+            Part of the workflow file path, e.g. 'proton-arch-nopackage.yml'
+        branch: str
+            Only list runs for this branch, e.g. 'master'. All branches if empty.
+        count: int
+            Maximum number of runs per workflow
+
+    Return Type: list[dict]
+    """
+    workflows = [workflow for workflow in get_workflows(rs, workflows_url) if workflow.get('state') == 'active' and workflow_path in workflow.get('path', '')]
+
+    params = {'status': 'success', 'per_page': count}
+    if branch:
+        params['branch'] = branch
+
+    def fetch_runs(workflow: dict) -> list[dict]:
+        try:
+            return ghapi_rlcheck(rs.get(f'{workflow["url"]}/runs', params=params).json()).get('workflow_runs', [])
+        except (requests.RequestException, ValueError) as e:
+            print(f'Error: Could not fetch workflow runs for {workflow.get("path")}: {e}')
+            return []
+
+    if len(workflows) <= 1:
+        runs_per_workflow = [fetch_runs(workflow) for workflow in workflows]
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(workflows), CI_MAX_WORKERS)) as executor:
+            runs_per_workflow = list(executor.map(fetch_runs, workflows))
+
+    return [run for runs in runs_per_workflow for run in runs if run.get('conclusion') == 'success']
+
+
+def get_workflow_run_artifacts(rs: requests.Session, artifacts_url: str) -> list[dict] | None:
+    """
+    List the artifacts of a workflow run, e.g. https://api.github.com/repos/<owner>/<repo>/actions/runs/<run_id>/artifacts
+    Artifacts of a finished run never change, so they are cached on disk for CI_ARTIFACT_CACHE_TTL seconds.
+    Returns None if the artifacts could not be fetched.
+    Return Type: list[dict] | None
+    """
+    if (artifacts := _artifact_cache.get(artifacts_url)) is not None:
+        return artifacts
+
+    try:
+        response = rs.get(artifacts_url, params={'per_page': 100})
+        artifact_info = ghapi_rlcheck(response.json())
+    except (requests.RequestException, ValueError) as e:
+        print(f'Error: Could not fetch artifacts from {artifacts_url}: {e}')
+        return None
+
+    if response.status_code != 200 or 'artifacts' not in artifact_info:
+        return None
+
+    artifacts = []
+    for artifact in artifact_info['artifacts']:
+        trimmed_artifact = {field: artifact.get(field) for field in ARTIFACT_FIELDS}
+        trimmed_artifact['workflow_run'] = {field: artifact.get('workflow_run', {}).get(field) for field in ARTIFACT_WORKFLOW_RUN_FIELDS}
+        artifacts.append(trimmed_artifact)
+
+    _artifact_cache.set(artifacts_url, artifacts)
+    _artifact_cache.save()
+
+    return artifacts
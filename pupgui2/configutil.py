@@ -0,0 +1,161 @@
+import os
+import atexit
+import threading
+
+from configparser import ConfigParser
+
+from pupgui2.constants import CONFIG_FILE, CONFIG_SAVE_DELAY
+
+
+class ConfigStore:
+    """
+    In-memory view of an ini config file which is shared by the whole process.
+    The file is parsed once and only parsed again if it was changed on disk (e.g. by another ProtonUp-Qt instance).
+    Changes are kept in memory and written to disk atomically after 'save_delay' seconds, so multiple
+    changes in a row only result in one write.
+    """
+
+    def __init__(self, config_file: str, save_delay: float = CONFIG_SAVE_DELAY) -> None:
+        self.config_file = config_file
+        self.save_delay = save_delay
+
+        self._config = ConfigParser()
+        self._file_stat: tuple[int, int] | None = None  # (mtime_ns, size) of the file when it was last read/written
+        self._pending: dict[tuple[str, str], str | None] = {}  # unsaved changes, None means remove
+        self._save_timer: threading.Timer | None = None
+        self._lock = threading.RLock()
+
+    def _get_file_stat(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.config_file)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _reload_if_changed(self) -> None:
+        """ Parse the config file again if it changed on disk. Must be called with self._lock held. """
+        file_stat = self._get_file_stat()
+        if file_stat == self._file_stat:
+            return
+
+        config = ConfigParser()
+        if file_stat is not None:
+            try:
+                config.read(self.config_file)
+            except Exception as e:
+                print(f'Warning: Could not read config file {self.config_file}: {e}')
+                config = ConfigParser()
+
+        # Keep changes which were not written yet on top of the file contents
+        for (section, option), value in self._pending.items():
+            self._apply(config, section, option, value)
+
+        self._config = config
+        self._file_stat = file_stat
+
+    @staticmethod
+    def _apply(config: ConfigParser, section: str, option: str, value: str | None) -> None:
+        if value is None:
+            if config.has_option(section, option):
+                config.remove_option(section, option)
+            return
+
+        if not config.has_section(section):
+            config.add_section(section)
+        config[section][option] = value
+
+    def get(self, section: str, option: str, fallback: str | None = None) -> str | None:
+        """
+        Return the value of option in section, or fallback if it does not exist.
+        Return Type: str | None
+        """
+        with self._lock:
+            self._reload_if_changed()
+            if self._config.has_option(section, option):
+                return self._config[section][option]
+        return fallback
+
+    def has_option(self, section: str, option: str) -> bool:
+        return self.get(section, option) is not None
+
+    def set(self, section: str, option: str, value: str) -> None:
+        """ Set option in section to value. The config file is written after save_delay seconds. """
+        self._change(section, option, value)
+
+    def remove(self, section: str, option: str) -> None:
+        """ Remove option from section. The config file is written after save_delay seconds. """
+        self._change(section, option, None)
+
+    def _change(self, section: str, option: str, value: str | None) -> None:
+        with self._lock:
+            self._reload_if_changed()
+            self._apply(self._config, section, option, value)
+            self._pending[(section, option)] = value
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """ (Re)start the timer for writing the config file. Must be called with self._lock held. """
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+
+        self._save_timer = threading.Timer(self.save_delay, self.save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def save(self) -> bool:
+        """
+        Write pending changes to the config file now.
+        The file is replaced atomically so other readers never see a half-written config.
+        Return Type: bool
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+
+            if len(self._pending) == 0:
+                return True
+
+            self._reload_if_changed()  # Don't overwrite changes other processes made in the meantime
+
+            tmp_file = f'{self.config_file}.tmp'
+            try:
+                os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+                with open(tmp_file, 'w') as cfg:
+                    self._config.write(cfg)
+                os.replace(tmp_file, self.config_file)
+            except OSError as e:
+                print(f'Error: Could not write config file {self.config_file}: {e}')
+                return False
+
+            self._pending = {}
+            self._file_stat = self._get_file_stat()
+
+        return True
+
+
+_config_stores: dict[str, ConfigStore] = {}
+_config_stores_lock = threading.Lock()
+
+
+def get_config_store(config_file: str = CONFIG_FILE) -> ConfigStore:
+    """
+    Return the shared ConfigStore for config_file (CONFIG_FILE by default)
+    Return Type: ConfigStore
+    """
+    with _config_stores_lock:
+        if config_file not in _config_stores:
+            _config_stores[config_file] = ConfigStore(config_file)
+        return _config_stores[config_file]
+
+
+def flush_config_stores() -> None:
+    """ Write all pending config changes to disk, e.g. before the application exits """
+    with _config_stores_lock:
+        config_stores = list(_config_stores.values())
+
+    for config_store in config_stores:
+        config_store.save()
+
+
+atexit.register(flush_config_stores)
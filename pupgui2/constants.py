@@ -1,5 +1,5 @@
 import os
-from xdg.BaseDirectory import xdg_config_home
+from xdg.BaseDirectory import xdg_config_home, xdg_cache_home
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor, QPalette
@@ -20,9 +20,12 @@ Copyright (C) 2021-2024 DavidoTek, licensed under GPLv3
 BUILD_INFO = 'built from source'
 
 CONFIG_FILE = os.path.join(xdg_config_home, 'pupgui/config.ini')
+CONFIG_SAVE_DELAY = 0.5  # Seconds to wait for further config changes before writing CONFIG_FILE
 CACHE_DIR = os.path.join(xdg_cache, 'tmp') if (xdg_cache := os.getenv('XDG_CACHE_HOME', '')) else ''
 TEMP_DIR = os.path.join(CACHE_DIR, 'pupgui2.a70200/') if CACHE_DIR and os.path.exists(CACHE_DIR) else '/tmp/pupgui2.a70200/'
 HOME_DIR = os.path.expanduser('~')
+# Unlike TEMP_DIR, this is kept between sessions (e.g. for the ProtonDB summaries)
+PERSISTENT_CACHE_DIR = os.path.join(xdg_cache_home, 'pupgui')
 
 IS_FLATPAK: bool = os.path.exists('/.flatpak-info')
 
@@ -114,10 +117,21 @@ AWACY_WEB_URL = 'https://areweanticheatyet.com/?search={GAMENAME}&sortOrder=&sor
 LOCAL_AWACY_GAME_LIST = os.path.join(TEMP_DIR, 'awacy_games.json')
 PROTONDB_API_URL = 'https://www.protondb.com/api/v1/reports/summaries/{game_id}.json'
 PROTONDB_APP_PAGE_URL = 'https://protondb.com/app/'
+PROTONDB_CACHE_FILE = os.path.join(PERSISTENT_CACHE_DIR, 'protondb_summaries.json')
+PROTONDB_CACHE_TTL = 60 * 60 * 24  # Re-fetch cached ProtonDB summaries after one day
+PROTONDB_ERROR_CACHE_TTL = 60 * 10  # Retry failed ProtonDB requests after ten minutes
+PROTONDB_NOT_FOUND = 'not found'  # 'error' of the cached summary of games which are not listed on protondb.com
+PROTONDB_REQUEST_FAILED = 'request failed'  # 'error' of the cached summary of failed requests
+PROTONDB_MAX_WORKERS = 4  # Maximum number of concurrent requests to protondb.com
+
+SEARCH_DEBOUNCE_MSEC = 150  # Wait for the user to stop typing before filtering game lists
 
 STEAM_BOXTRON_FLATPAK_APPSTREAM = 'appstream://com.valvesoftware.Steam.CompatibilityTool.Boxtron'
 STEAM_STL_FLATPAK_APPSTREAM = 'appstream://com.valvesoftware.Steam.Utility.steamtinkerlaunch'
 
+STEAM_PID_FILES = [ os.path.join(HOME_DIR, '.steam', 'steam.pid') ]  # Written by the Steam client on start
+STEAM_PROCESS_POLL_INTERVAL = 5000  # ms, how often the Steam pid files are checked for a newly started client
+INSTALL_LOCATION_POLL_INTERVAL = 10000  # ms, how often missing launcher root directories are checked for a newly installed launcher
 STEAM_STL_INSTALL_PATH = os.path.join(HOME_DIR, 'stl')
 STEAM_STL_CONFIG_PATH = os.path.join(HOME_DIR, '.config', 'steamtinkerlaunch')
 STEAM_STL_CACHE_PATH = os.path.join(HOME_DIR, '.cache', 'steamtinkerlaunch')
@@ -129,6 +143,24 @@ LUTRIS_WEB_URL = 'https://lutris.net/games/'
 EPIC_STORE_URL = 'https://store.epicgames.com/p/'
 
 GITHUB_API = 'https://api.github.com/'
+GITHUB_GRAPHQL_API = 'https://api.github.com/graphql'
+GITHUB_GRAPHQL_RELEASES_COUNT = 50  # Releases per repository fetched by one GraphQL query, matches RELEASES_PER_PAGE of the install dialog
+GITHUB_GRAPHQL_CACHE_TTL = 60 * 5
+CI_ARTIFACT_CACHE_FILE = os.path.join(PERSISTENT_CACHE_DIR, 'ci_artifacts.json')
+CI_ARTIFACT_CACHE_TTL = 60 * 60 * 24 * 7  # GitHub deletes artifacts after some time, so don't keep them forever
+CI_WORKFLOW_CACHE_TTL = 60 * 5  # Workflow lists are shared between ctmods using the same repository
+CI_MAX_WORKERS = 4  # Maximum number of workflows to fetch runs for at the same time
+ARCHIVE_CACHE_DIR = os.path.join(PERSISTENT_CACHE_DIR, 'archives')
+CTOOL_TRASH_DIR_NAME = '.pupgui2-trash'  # Created next to an install directory, removed tools are moved there and deleted in the background
+CTOOL_STAGING_DIR_NAME = '.pupgui2-staging'  # Created next to an install directory, tools installed to several locations are extracted there first
+DISK_USAGE_MAX_WORKERS = 4  # Maximum number of compatibility tools scanned for their disk usage at the same time
+ARCHIVE_CACHE_DEFAULT_SIZE_MB = 4096  # Enough for a few Proton versions, configurable with 'archive_cache_size_mb', 0 disables the cache
+MIRROR_CACHE_DIR = os.path.join(PERSISTENT_CACHE_DIR, 'mirror')  # Used by 'protonup-qt serve-cache'
+MIRROR_DEFAULT_PORT = 8484
+MIRROR_CONNECT_TIMEOUT = 3  # Fall back to upstream quickly if the mirror is not reachable
+MIRROR_METADATA_TTL = 60 * 10  # Release information (API responses) is re-fetched by the mirror after this time, archives are kept
+MIRROR_UPSTREAM_HOSTS = [ 'api.github.com', 'github.com', 'gitlab.com', 'nightly.link' ]  # The mirror only fetches from these hosts
+MIRROR_METADATA_PREFIXES = [ 'api.github.com/', 'gitlab.com/api/' ]  # Responses for these are not stored on disk
 # GitLab can have any self-hosted instance, so we store a list of known GitLab instances
 GITLAB_API = [
     'https://gitlab.com/api/'
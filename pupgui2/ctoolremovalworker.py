@@ -0,0 +1,160 @@
+import os
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from pupgui2.constants import CTOOL_TRASH_DIR_NAME
+
+
+class TrashedCtool:
+    """ A compatibility tool moved into a trash directory by move_ctool_to_trash, waiting to be deleted """
+
+    def __init__(self, trash_entry: str, original_path: str = ''):
+        self.trash_entry = trash_entry  # e.g. '.../.pupgui2-trash/GE-Proton9-5.abc123', contains the tool folder
+        self.original_path = original_path  # Where the tool was installed, empty for leftovers of an earlier session
+
+
+def count_tree_entries(path: str) -> int:
+    """
+    Count the files and directories in path (not following symlinks).
+    Return Type: int
+    """
+    count = 0
+    for _, dirs, files in os.walk(path):
+        count += len(dirs) + len(files)
+
+    return count
+
+
+def delete_tree(path: str, progress_callback=lambda deleted: None) -> None:
+    """
+    Delete the directory tree at path bottom-up, calling progress_callback with the number of deleted entries so far.
+    Entries which cannot be deleted are skipped (the error is printed).
+    """
+    deleted = 0
+    for root, dirs, files in os.walk(path, topdown=False):
+        for name in files:
+            try:
+                os.unlink(os.path.join(root, name))
+            except OSError as e:
+                print(f'Warning: Could not delete {os.path.join(root, name)}: {e}')
+            deleted += 1
+        for name in dirs:
+            dir_path = os.path.join(root, name)
+            try:
+                if os.path.islink(dir_path):
+                    os.unlink(dir_path)
+                else:
+                    os.rmdir(dir_path)
+            except OSError as e:
+                print(f'Warning: Could not delete {dir_path}: {e}')
+            deleted += 1
+
+        progress_callback(deleted)
+
+    try:
+        os.rmdir(path)
+    except OSError as e:
+        print(f'Warning: Could not delete {path}: {e}')
+
+
+class CtoolRemovalWorker(QObject):
+    """
+    Deletes compatibility tools moved to a trash directory (see move_ctool_to_trash) in a background thread.
+    Tools passed to remove() while the worker is running are added to the current batch.
+    Cancelling leaves the tools that were not deleted yet in the trash, they are deleted by purge() the next time.
+    """
+
+    removal_progress = Signal(int)  # Percent of the current batch
+    removal_finished = Signal(int, bool)  # Number of deleted tools, whether the batch was cancelled
+
+    def __init__(self, parent=None):
+        super(CtoolRemovalWorker, self).__init__(parent)
+        self._queue: list[TrashedCtool] = []
+        self._batch_size = 0
+        self._deleted = 0
+        self._cancelled = False
+        self._current: TrashedCtool | None = None  # Tool being deleted
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def remove(self, trashed_ctools: list[TrashedCtool]) -> None:
+        """ Delete the trashed tools in the background, together with leftovers in their trash directories """
+        with self._lock:
+            trash_dirs = {os.path.dirname(os.path.normpath(tc.trash_entry)) for tc in trashed_ctools}
+            self._enqueue(trashed_ctools + self._get_leftovers(trash_dirs, trashed_ctools))
+
+    def purge(self, trash_dirs: list[str]) -> None:
+        """ Delete the leftovers in trash_dirs in the background, e.g. tools which were not deleted yet when ProtonUp-Qt was closed """
+        with self._lock:
+            if leftovers := self._get_leftovers(set(os.path.normpath(trash_dir) for trash_dir in trash_dirs)):
+                self._enqueue(leftovers)
+
+    def cancel(self) -> list[str]:
+        """
+        Stop after the tool currently being deleted, the remaining tools stay in the trash (see purge).
+        Return Type: list[str] (trash entries which were not deleted)
+        """
+        with self._lock:
+            self._cancelled = True
+            queue, self._queue = self._queue, []
+
+        return [tc.trash_entry for tc in queue]
+
+    def is_running(self) -> bool:
+        """
+        Return whether tools are being deleted.
+        Return Type: bool
+        """
+        with self._lock:
+            return self._thread is not None
+
+    def _get_leftovers(self, trash_dirs: set[str], trashed_ctools: list[TrashedCtool] | None = None) -> list[TrashedCtool]:
+        """ Return the entries in trash_dirs which are not queued or being deleted yet, must be called with self._lock held """
+        known_entries = {os.path.normpath(tc.trash_entry) for tc in self._queue + (trashed_ctools or [])}
+        leftovers = []
+        for trash_dir in trash_dirs:
+            if os.path.basename(trash_dir) != CTOOL_TRASH_DIR_NAME or not os.path.isdir(trash_dir):
+                continue
+            try:
+                for entry in os.scandir(trash_dir):
+                    if os.path.normpath(entry.path) not in known_entries and not self._is_being_deleted(entry.path):
+                        leftovers.append(TrashedCtool(entry.path))
+            except OSError as e:
+                print(f'Warning: Could not list {trash_dir}: {e}')
+
+        return leftovers
+
+    def _enqueue(self, trashed_ctools: list[TrashedCtool]) -> None:
+        """ Must be called with self._lock held """
+        self._queue += trashed_ctools
+        self._batch_size += len(trashed_ctools)
+        self._cancelled = False
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _is_being_deleted(self, path: str) -> bool:
+        """ Must be called with self._lock held """
+        return self._current is not None and os.path.normpath(self._current.trash_entry) == os.path.normpath(path)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._queue:
+                    deleted, cancelled = self._deleted, self._cancelled
+                    self._thread, self._current = None, None
+                    self._batch_size, self._deleted = 0, 0
+                    break
+                self._current = self._queue.pop(0)
+                done, batch_size = self._deleted, self._batch_size
+
+            entry_count = max(count_tree_entries(self._current.trash_entry), 1)
+            delete_tree(self._current.trash_entry, lambda n: self.removal_progress.emit(int((done + min(n / entry_count, 1.0)) / batch_size * 100)))
+
+            with self._lock:
+                self._deleted += 1
+
+        self.removal_finished.emit(deleted, cancelled)
+
@@ -1,10 +1,10 @@
 import os
 import vdf
 import yaml
-import json
 
 from enum import Enum
 
+from pupgui2.cacheutil import DirectoryIndex, load_json_file
 from pupgui2.constants import PROTON_EAC_RUNTIME_APPID, PROTON_BATTLEYE_RUNTIME_APPID, STEAMLINUXRUNTIME_APPID
 
 
@@ -176,13 +176,15 @@ class LutrisGame:
 
     install_loc = None
 
-    def get_game_config(self) -> dict:
-        
+    @staticmethod
+    def get_game_config_dir(install_loc: dict) -> str:
+
         """
-        Get a Lutris game config .yml file from either the config directory or the data directory.
+        Get the Lutris game config directory from either the config directory or the data directory.
         i.e., ~/.config/lutris/games or ~/.local/share/lutris/games
+        Returns an empty string if neither exists.
 
-        Return Type: dict
+        Return Type: str
         """
 
         # Lutris will prefer the config directory if it exists, but will use the data directory if config does not exist.
@@ -190,42 +192,61 @@ class LutrisGame:
         # However, Lutris does not migrate these installations, so we need to check for both and prefer config if it exists.
         #
         # https://github.com/lutris/lutris/blob/6b968e858955c0638bf93b3a72fec5ae650f0932/lutris/settings.py#L20-L25
-        lutris_game_config_dir = os.path.join(os.path.expanduser(self.install_loc.get('config_dir')), 'games')
-        if not lutris_game_config_dir:
-            return {}
-    
-        if not os.path.isdir(lutris_game_config_dir):
-            # Lutris 'install_dir' will be '/path/to/lutris/runners/wine', go two directories up to get the root Lutris install folder
-            lutris_game_config_data_dir = os.path.abspath(
-                os.path.join(
-                    os.path.expanduser(self.install_loc.get('install_dir')),
-                    '..', '..',
-                    'games'
-                )
+        lutris_game_config_dir = os.path.join(os.path.expanduser(install_loc.get('config_dir', '')), 'games')
+        if os.path.isdir(lutris_game_config_dir):
+            return lutris_game_config_dir
+
+        # Lutris 'install_dir' will be '/path/to/lutris/runners/wine', go two directories up to get the root Lutris install folder
+        lutris_game_config_data_dir = os.path.abspath(
+            os.path.join(
+                os.path.expanduser(install_loc.get('install_dir')),
+                '..', '..',
+                'games'
             )
+        )
+
+        return lutris_game_config_data_dir if os.path.isdir(lutris_game_config_data_dir) else ''
 
-            if not os.path.isdir(lutris_game_config_data_dir):
-                return {}
+    def get_game_config(self, cached: bool = True) -> dict:
 
-            lutris_game_config_dir = lutris_game_config_data_dir
+        """
+        Get the Lutris game config .yml file of this game from the game config index (see get_game_config_dir).
+        The index is only read again if cached is False or the config directory was not read before.
+
+        Return Type: dict
+        """
+
+        lutris_game_config_dir = self.get_game_config_dir(self.install_loc)
+        if not lutris_game_config_dir:
+            return {}
+
+        game_configs = lutris_game_config_index.get(lutris_game_config_dir, cached=cached)
 
         # search a *.yml game configuration file that contains either the install_slug+installed_at or, if not found, the game slug
-        fn = ''
-        for game_cfg_file in os.listdir(lutris_game_config_dir):
+        for game_cfg_file, game_cfg in game_configs.items():
             if str(self.installer_slug) in game_cfg_file and str(self.installed_at) in game_cfg_file:
-                fn = game_cfg_file
-                break
-        else:
-            for game_cfg_file in os.listdir(lutris_game_config_dir):
-                if self.slug in game_cfg_file:
-                    fn = game_cfg_file
-                    break
-
-        lutris_game_cfg = os.path.join(lutris_game_config_dir, fn)
-        if not os.path.isfile(lutris_game_cfg):
-            return {}
-        with open(lutris_game_cfg, 'r') as f:
-            return yaml.safe_load(f)
+                return game_cfg
+        for game_cfg_file, game_cfg in game_configs.items():
+            if self.slug in game_cfg_file:
+                return game_cfg
+
+        return {}
+
+
+def load_lutris_game_config(path: str) -> dict:
+
+    """
+    Parse a Lutris game config .yml file, using the LibYAML based loader if PyYAML was built with it.
+    Return Type: dict
+    """
+
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=YAML_SAFE_LOADER) or {}
+
+
+YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+lutris_game_config_index = DirectoryIndex('.yml', load_lutris_game_config)  # Shared by all LutrisGames, file name -> game config
 
 
 # Information for games is stored in a per-storefront 'library.json' - This has most of the information we need
@@ -247,13 +268,39 @@ class HeroicGame:
     executable: str  # Path to game executable, always stored at 'start.sh' for native Linux GOG games 
     is_dlc: bool  # Stored for GOG and legendary, defaults to False for sideloaded
 
-    def get_game_config(self):
-        game_config = os.path.join(self.heroic_path, 'GamesConfig', f'{self.app_name}.json')
-        if not os.path.isfile(game_config):
-            return {}
-        
-        with open(game_config, 'r') as gcf:
-            return json.load(gcf).get(self.app_name, {})
+    def get_game_config(self, cached: bool = True) -> dict:
+        """
+        Get the config of this game from 'GamesConfig/<app_name>.json' using the shared GamesConfig index.
+        The index is only read again if cached is False or the GamesConfig directory was not read before.
+        Return Type: dict
+        """
+        games_config_dir = os.path.abspath(os.path.join(self.heroic_path, 'GamesConfig'))
+        game_config = heroic_games_config_index.get(games_config_dir, cached=cached).get(f'{self.app_name}.json')
+
+        return game_config.get(self.app_name, {}) if isinstance(game_config, dict) else {}
+
+
+heroic_games_config_index = DirectoryIndex('.json', load_json_file)  # Shared by all HeroicGames, file name -> game config
+
+
+class GameRecord:
+    """ Launcher independent information about a game in the game index (see gameindex.py) """
+    launcher = ''  # e.g. 'steam', 'lutris', 'heroicwine'
+    game_id = ''  # Steam AppID, Lutris slug or Heroic appName
+    name = ''
+    compat_tool = ''  # Name of the compatibility tool / Wine version used by the game, empty if unknown
+    install_dir = ''
+    game: SteamApp | LutrisGame | HeroicGame | None = None  # Launcher specific object the record was created from
+
+
+class InstalledCtoolEntry:
+    """ A compatibility tool folder in an install directory, see util.py#get_ctool_inventory """
+
+    def __init__(self, name: str, version: str = '', ct_type: CTType = CTType.CUSTOM, mtime: int = 0):
+        self.name = name  # Folder name, e.g. GE-Proton9-5
+        self.version = version  # Content of VERSION.txt, empty if there is none
+        self.ct_type = ct_type
+        self.mtime = mtime  # st_mtime_ns of the folder
 
 
 class Launcher(Enum):
@@ -0,0 +1,161 @@
+import os
+import stat
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pupgui2.constants import DISK_USAGE_MAX_WORKERS
+from pupgui2.datastructures import BasicCompatTool, CTType
+
+
+class DiskUsage:
+    """
+    Disk space used by a directory tree. Files with more than one hardlink (e.g. tools hardlinked from the staging directory)
+    are tracked separately, they only free space once all of their links are removed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = 0  # Bytes used by entries with a single link
+        self.linked_files: dict[tuple[int, int], tuple[int, int, int]] = {}  # (st_dev, st_ino) -> (bytes, st_nlink, links in this tree)
+
+    def get_total_size(self) -> int:
+        """
+        Return the bytes used by the tree, counting each hardlinked file once.
+        Return Type: int
+        """
+        return self.size + sum(size for size, _, _ in self.linked_files.values())
+
+
+class ReclaimPlan:
+    """ Compatibility tools that can be removed together and the bytes freed by removing them """
+
+    def __init__(self, install_dir: str, ctools: list[BasicCompatTool], size: int):
+        self.install_dir = install_dir
+        self.ctools = ctools
+        self.size = size
+
+
+def get_used_bytes(st: os.stat_result) -> int:
+    """
+    Return the bytes allocated on disk for a stat result, falling back to the apparent size.
+    Return Type: int
+    """
+    if hasattr(st, 'st_blocks'):
+        return st.st_blocks * 512
+    return st.st_size
+
+
+def scan_disk_usage(path: str) -> DiskUsage:
+    """
+    Scan the directory tree at path with os.scandir, symlinks are not followed.
+    Return Type: DiskUsage
+    """
+    usage = DiskUsage(path)
+    pending = [path]
+    while pending:
+        try:
+            entries = list(os.scandir(pending.pop()))
+        except OSError as e:
+            print(f'Warning: Could not scan {path}: {e}')
+            continue
+
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if stat.S_ISDIR(st.st_mode):
+                pending.append(entry.path)
+
+            if st.st_nlink > 1 and not stat.S_ISDIR(st.st_mode):
+                inode = (st.st_dev, st.st_ino)
+                size, nlink, links = usage.linked_files.get(inode, (get_used_bytes(st), st.st_nlink, 0))
+                usage.linked_files[inode] = (size, nlink, links + 1)
+            else:
+                usage.size += get_used_bytes(st)
+
+    return usage
+
+
+_disk_usage_cache: dict[str, tuple[int, DiskUsage]] = {}  # path -> (directory mtime, usage)
+_disk_usage_cache_lock = threading.Lock()
+
+
+def get_disk_usage(path: str) -> DiskUsage:
+    """
+    Return the disk usage of the directory tree at path, scanned again only when the mtime of the directory changes.
+    Return Type: DiskUsage
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return DiskUsage(path)
+
+    with _disk_usage_cache_lock:
+        cached = _disk_usage_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    usage = scan_disk_usage(path)
+    with _disk_usage_cache_lock:
+        _disk_usage_cache[path] = (mtime, usage)
+
+    return usage
+
+
+def get_disk_usages(paths: list[str], max_workers: int = DISK_USAGE_MAX_WORKERS) -> dict[str, DiskUsage]:
+    """
+    Return the disk usage of multiple directory trees, scanned in parallel.
+    Return Type: dict[str, DiskUsage]
+    """
+    if len(paths) <= 1:
+        return {path: get_disk_usage(path) for path in paths}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(get_disk_usage, paths)))
+
+
+def get_reclaimable_size(usages: list[DiskUsage]) -> int:
+    """
+    Return the bytes freed by removing all of the given trees.
+    Hardlinked files are only counted if every link to them is inside the trees.
+    Return Type: int
+    """
+    size = sum(usage.size for usage in usages)
+
+    linked_files: dict[tuple[int, int], list[int]] = {}
+    for usage in usages:
+        for inode, (file_size, nlink, links) in usage.linked_files.items():
+            linked_files.setdefault(inode, [file_size, nlink, 0])[2] += links
+
+    return size + sum(file_size for file_size, nlink, links in linked_files.values() if links >= nlink)
+
+
+def create_reclaim_plan(install_dir: str, ctools: list[BasicCompatTool]) -> ReclaimPlan:
+    """
+    Create a plan to remove all unused compatibility tools (not used by any game, not the global tool) in ctools.
+    Tools of launchers without game usage information are never part of the plan.
+    Return Type: ReclaimPlan
+    """
+    unused_ctools = [
+        ct for ct in ctools
+        if ct.no_games == 0 and not ct.is_global and ct.ct_type == CTType.CUSTOM
+        and 'steamtinkerlaunch' not in ct.get_install_folder().lower()  # Removing it also removes its configuration
+    ]
+
+    usages = get_disk_usages([os.path.join(ct.get_install_dir(), ct.get_install_folder()) for ct in unused_ctools])
+
+    return ReclaimPlan(install_dir, unused_ctools, get_reclaimable_size(list(usages.values())))
+
+
+def format_size(size: int) -> str:
+    """
+    Format a number of bytes for display, e.g. '1.5 GB'.
+    Return Type: str
+    """
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024 or unit == 'GB':
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
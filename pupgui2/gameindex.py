@@ -0,0 +1,330 @@
+import os
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from pupgui2.cacheutil import get_path_stamp
+from pupgui2.datastructures import BasicCompatTool, GameRecord, RuntimeType, SteamApp, LutrisGame, HeroicGame
+from pupgui2.heroicutil import get_heroic_game_list, is_heroic_launcher
+from pupgui2.lutrisutil import get_lutris_game_list, is_lutris_game_using_runner
+from pupgui2.steamutil import get_steam_app_list, get_steam_ct_game_index, get_steam_games_for_ctool
+
+
+class GameIndexSnapshot:
+    """
+    Games of one install location at the time they were loaded, with a compatibility tool name -> games reverse index.
+    Snapshots are shared by all views and must not be modified, a new snapshot is created when the launcher files change.
+    """
+
+    def __init__(self, key: str, launcher: str, stamp: tuple, games: list, records: list[GameRecord], compat_tool_records: dict[str | RuntimeType, list[GameRecord]]):
+        self.key = key
+        self.launcher = launcher
+        self.stamp = stamp
+        self.games = games  # All launcher specific objects, e.g. including Steam runtimes and tools
+        self.records = records
+        self.compat_tool_records = compat_tool_records  # Built by GameIndexLoader.create_compat_tool_index
+
+
+class GameIndexLoader:
+    """ Loads the games of one launcher for the GameIndex, see the subclasses below. """
+
+    def get_source_paths(self, install_loc: dict) -> list[str]:
+        """
+        Files and directories the games are read from. The games are only loaded again when one of them changes.
+        Return Type: list[str]
+        """
+        return []
+
+    def get_watch_paths(self, install_loc: dict) -> list[str]:
+        """
+        Files and directories to watch for changes to the games, by default the same as get_source_paths.
+        Return Type: list[str]
+        """
+        return self.get_source_paths(install_loc)
+
+    def load_games(self, install_loc: dict) -> list:
+        """
+        Load all games for install_loc.
+        Return Type: list[SteamApp | LutrisGame | HeroicGame]
+        """
+        return []
+
+    def create_record(self, game) -> GameRecord | None:
+        """
+        Create the GameRecord for a loaded game, or None if it should not be listed as a game.
+        Return Type: GameRecord | None
+        """
+        return None
+
+    def create_compat_tool_index(self, records: list[GameRecord]) -> dict[str | RuntimeType, list[GameRecord]]:
+        """
+        Build the compatibility tool -> games reverse index of a snapshot in a single pass over the records.
+        Return Type: dict[str | RuntimeType, list[GameRecord]]
+        """
+        compat_tool_records: dict[str | RuntimeType, list[GameRecord]] = {}
+        for record in records:
+            if record.compat_tool:
+                compat_tool_records.setdefault(record.compat_tool, []).append(record)
+
+        return compat_tool_records
+
+    def get_records_for_compat_tool(self, snapshot: GameIndexSnapshot, ctool: BasicCompatTool) -> list[GameRecord]:
+        """
+        Return the records of all games using ctool.
+        Return Type: list[GameRecord]
+        """
+        return snapshot.compat_tool_records.get(ctool.displayname, [])
+
+
+class SteamGameIndexLoader(GameIndexLoader):
+
+    def get_source_paths(self, install_loc: dict) -> list[str]:
+        steam_config_folder = os.path.expanduser(install_loc.get('vdf_dir', ''))
+        userdata_dir = os.path.realpath(os.path.join(steam_config_folder, os.pardir, 'userdata'))
+
+        paths = [
+            os.path.join(steam_config_folder, 'config.vdf'),
+            os.path.join(steam_config_folder, 'libraryfolders.vdf'),
+            os.path.realpath(os.path.join(steam_config_folder, '../appcache/appinfo.vdf')),
+            userdata_dir,
+        ]
+        # Non-Steam games
+        if os.path.isdir(userdata_dir):
+            paths += [os.path.join(userdata_dir, user, 'config', 'shortcuts.vdf') for user in sorted(os.listdir(userdata_dir))]
+
+        return paths
+
+    def get_watch_paths(self, install_loc: dict) -> list[str]:
+        # appinfo.vdf is rewritten all the time while Steam is running, only watch the files with the compatibility tools and installed games
+        steam_config_folder = os.path.expanduser(install_loc.get('vdf_dir', ''))
+        return [os.path.join(steam_config_folder, 'config.vdf'), os.path.join(steam_config_folder, 'libraryfolders.vdf')]
+
+    def load_games(self, install_loc: dict) -> list[SteamApp]:
+        return get_steam_app_list(install_loc.get('vdf_dir'), cached=False)
+
+    def create_record(self, game: SteamApp) -> GameRecord | None:
+        if game.app_type != 'game':
+            return None
+
+        record = GameRecord()
+        record.launcher = 'steam'
+        record.game_id = game.get_app_id_str()
+        record.name = game.game_name
+        record.compat_tool = game.compat_tool
+        record.install_dir = game.libraryfolder_path
+        record.game = game
+        return record
+
+    def create_compat_tool_index(self, records: list[GameRecord]) -> dict[str | RuntimeType, list[GameRecord]]:
+        # Anti-Cheat runtimes are not selected as compatibility tool, they are dependencies of the games and indexed by RuntimeType
+        app_records = {id(record.game): record for record in records}
+        return {key: [app_records[id(app)] for app in apps] for key, apps in get_steam_ct_game_index([record.game for record in records]).items()}
+
+    def get_records_for_compat_tool(self, snapshot: GameIndexSnapshot, ctool: BasicCompatTool) -> list[GameRecord]:
+        return get_steam_games_for_ctool(snapshot.compat_tool_records, ctool)
+
+
+class LutrisGameIndexLoader(GameIndexLoader):
+
+    def get_source_paths(self, install_loc: dict) -> list[str]:
+        lutris_data_dir = os.path.join(os.path.expanduser(install_loc.get('install_dir', '')), os.pardir, os.pardir)
+
+        paths = [os.path.abspath(os.path.join(lutris_data_dir, 'pga.db'))]
+        if lutris_game_config_dir := LutrisGame.get_game_config_dir(install_loc):
+            paths.append(lutris_game_config_dir)
+
+        return paths
+
+    def load_games(self, install_loc: dict) -> list[LutrisGame]:
+        return get_lutris_game_list(install_loc)
+
+    def create_record(self, game: LutrisGame) -> GameRecord | None:
+        record = GameRecord()
+        record.launcher = 'lutris'
+        record.game_id = game.slug
+        record.name = game.name
+        if is_lutris_game_using_runner(game, 'wine'):
+            record.compat_tool = game.get_game_config().get('wine', {}).get('version', '')
+        record.install_dir = game.install_dir
+        record.game = game
+        return record
+
+
+class HeroicGameIndexLoader(GameIndexLoader):
+
+    def get_source_paths(self, install_loc: dict) -> list[str]:
+        heroic_dir = get_heroic_dir(install_loc)
+
+        return [
+            os.path.join(heroic_dir, 'sideload_apps', 'library.json'),
+            os.path.join(heroic_dir, 'gog_store', 'library.json'),
+            os.path.join(heroic_dir, 'gog_store', 'installed.json'),
+            os.path.join(heroic_dir, 'store_cache', 'nile_library.json'),
+            os.path.join(heroic_dir, '..', 'legendary', 'installed.json'),
+            os.path.join(heroic_dir, 'GamesConfig'),
+        ]
+
+    def load_games(self, install_loc: dict) -> list[HeroicGame]:
+        return get_heroic_game_list(get_heroic_dir(install_loc))
+
+    def create_record(self, game: HeroicGame) -> GameRecord | None:
+        record = GameRecord()
+        record.launcher = 'heroic'
+        record.game_id = game.app_name
+        record.name = game.title
+        if game.is_installed:
+            record.compat_tool = game.wine_info.get('name', '')
+        record.install_dir = game.install_path
+        record.game = game
+        return record
+
+    def create_compat_tool_index(self, records: list[GameRecord]) -> dict[str | RuntimeType, list[GameRecord]]:
+        compat_tool_records = super().create_compat_tool_index(records)
+
+        # Heroic stores names like 'Proton - GE-Proton8-1', also index them by the tool folder name after the type
+        for name, name_records in list(compat_tool_records.items()):
+            if ' - ' in name:
+                compat_tool_records.setdefault(name.split(' - ', 1)[1], []).extend(name_records)
+
+        return compat_tool_records
+
+    def get_records_for_compat_tool(self, snapshot: GameIndexSnapshot, ctool: BasicCompatTool) -> list[GameRecord]:
+        if ctool.displayname in snapshot.compat_tool_records:
+            return snapshot.compat_tool_records[ctool.displayname]
+
+        # Names in an unknown format, only compare against the distinct names instead of every game
+        records = {}
+        for name, name_records in snapshot.compat_tool_records.items():
+            if ctool.displayname in name:
+                records.update((id(record), record) for record in name_records)
+
+        return list(records.values())
+
+
+def get_heroic_dir(install_loc: dict) -> str:
+    """
+    Return the Heroic config directory for a Heroic install location, e.g. '~/.config/heroic'.
+    Return Type: str
+    """
+    return os.path.abspath(os.path.join(os.path.expanduser(install_loc.get('install_dir', '')), '../..'))
+
+
+def get_game_index_loader(install_loc: dict) -> GameIndexLoader | None:
+    """
+    Return the loader for the launcher of install_loc, or None if games of the launcher are not supported.
+    Return Type: GameIndexLoader | None
+    """
+    launcher = install_loc.get('launcher', '')
+    if launcher == 'steam' and 'vdf_dir' in install_loc:
+        return SteamGameIndexLoader()
+    if launcher == 'lutris':
+        return LutrisGameIndexLoader()
+    if is_heroic_launcher(launcher):
+        return HeroicGameIndexLoader()
+    return None
+
+
+def get_game_index_watch_paths(install_loc: dict) -> list[str]:
+    """
+    Return the existing files and directories to watch for changes to the games of install_loc.
+    Return Type: list[str]
+    """
+    loader = get_game_index_loader(install_loc)
+    return [path for path in loader.get_watch_paths(install_loc) if os.path.exists(path)] if loader else []
+
+
+class GameIndex(QObject):
+    """
+    Games of all install locations, shared by the main window and the game list / compatibility tool info dialogs.
+    A snapshot is only loaded again if the launcher files it was loaded from changed.
+    """
+
+    changed = Signal(str, object)  # Key of the install location whose snapshot was loaded again, origin passed to get_snapshot
+
+    def __init__(self, parent=None):
+        super(GameIndex, self).__init__(parent)
+        self._snapshots: dict[str, GameIndexSnapshot] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(install_loc: dict) -> str:
+        """
+        Return the key for install_loc, e.g. 'steam:~/.steam/root/config'.
+        Return Type: str
+        """
+        location = install_loc.get('vdf_dir') if install_loc.get('launcher') == 'steam' else install_loc.get('install_dir', '')
+        return f"{install_loc.get('launcher', '')}:{os.path.normpath(os.path.expanduser(location or ''))}"
+
+    def get_snapshot(self, install_loc: dict, refresh: bool = False, origin: object = None) -> GameIndexSnapshot | None:
+        """
+        Return the snapshot for install_loc, or None if the launcher is not supported.
+        The snapshot is loaded if there is none yet. If refresh is True, it is also loaded again if the launcher files changed.
+        changed is emitted with origin when a snapshot was loaded, so views can ignore the snapshots they loaded themselves.
+        May be called from any thread, views should connect to changed with a queued connection.
+        Return Type: GameIndexSnapshot | None
+        """
+        loader = get_game_index_loader(install_loc)
+        if not loader:
+            return None
+
+        key = self.get_key(install_loc)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot and not refresh:
+                return snapshot
+
+            stamp = get_path_stamp(loader.get_source_paths(install_loc))
+            if snapshot and snapshot.stamp == stamp:
+                return snapshot
+
+            games = loader.load_games(install_loc)
+            records = [record for game in games if (record := loader.create_record(game))]
+            snapshot = GameIndexSnapshot(key, install_loc.get('launcher', ''), stamp, games, records, loader.create_compat_tool_index(records))
+            self._snapshots[key] = snapshot
+
+        self.changed.emit(key, origin)
+        return snapshot
+
+    def invalidate(self, install_loc: dict | None = None) -> None:
+        """ Drop the snapshot for install_loc (or all snapshots), it is loaded again the next time it is used """
+        with self._lock:
+            if install_loc is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(self.get_key(install_loc), None)
+
+    def get_games(self, install_loc: dict, refresh: bool = False, origin: object = None) -> list[SteamApp | LutrisGame | HeroicGame]:
+        """
+        Return the games for install_loc, without Steam runtimes and tools.
+        Return Type: list[SteamApp | LutrisGame | HeroicGame]
+        """
+        snapshot = self.get_snapshot(install_loc, refresh=refresh, origin=origin)
+        return [record.game for record in snapshot.records] if snapshot else []
+
+    def get_games_for_compat_tool(self, install_loc: dict, ctool: BasicCompatTool, refresh: bool = False, origin: object = None) -> list[SteamApp | LutrisGame | HeroicGame]:
+        """
+        Return the games for install_loc which use ctool, looked up in the reverse index of the snapshot.
+        Return Type: list[SteamApp | LutrisGame | HeroicGame]
+        """
+        snapshot = self.get_snapshot(install_loc, refresh=refresh, origin=origin)
+        if not snapshot:
+            return []
+
+        return [record.game for record in get_game_index_loader(install_loc).get_records_for_compat_tool(snapshot, ctool)]
+
+
+_game_index: GameIndex | None = None
+_game_index_lock = threading.Lock()
+
+
+def get_game_index() -> GameIndex:
+    """
+    Return the GameIndex shared by all views.
+    Return Type: GameIndex
+    """
+    global _game_index
+
+    with _game_index_lock:
+        if _game_index is None:
+            _game_index = GameIndex()
+        return _game_index
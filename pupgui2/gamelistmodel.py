@@ -0,0 +1,339 @@
+import os
+import pkgutil
+
+from typing import Any, Callable
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QPersistentModelIndex, QCoreApplication, QTimer, Signal
+from PySide6.QtCore import QObject, QSortFilterProxyModel
+from PySide6.QtGui import QPixmap, QBrush, QColor
+from PySide6.QtWidgets import QComboBox, QLineEdit, QStyledItemDelegate, QStyleOptionViewItem, QWidget
+
+from pupgui2.constants import PROTONDB_COLORS, STEAM_APP_PAGE_URL, AWACY_WEB_URL, PROTONDB_APP_PAGE_URL, SEARCH_DEBOUNCE_MSEC
+from pupgui2.constants import PROTONDB_NOT_FOUND
+from pupgui2.datastructures import AWACYStatus, SteamApp
+from pupgui2.util import normalize_search_text
+
+
+SORT_ROLE = Qt.UserRole + 1  # Role used by the proxy model to sort the game list
+
+STEAM_COLUMN_NAME = 0
+STEAM_COLUMN_COMPAT_TOOL = 1
+STEAM_COLUMN_DECK_COMPAT = 2
+STEAM_COLUMN_AWACY = 3
+STEAM_COLUMN_PROTONDB = 4
+
+_pixmap_cache: dict[str, QPixmap] = {}
+
+
+def get_cached_pixmap(image_name: str) -> QPixmap:
+    """
+    Load an image from resources/img only once and return the cached QPixmap afterwards.
+    Return Type: QPixmap
+    """
+    if image_name not in _pixmap_cache:
+        p = QPixmap()
+        p.loadFromData(pkgutil.get_data(__name__, os.path.join('resources/img', image_name)))
+        _pixmap_cache[image_name] = p
+
+    return _pixmap_cache[image_name]
+
+
+def connect_debounced_search(search_box: QLineEdit, search_func: Callable[[str], None], parent: QObject) -> QTimer:
+    """
+    Call search_func with the text of search_box once the user stopped typing for SEARCH_DEBOUNCE_MSEC,
+    instead of filtering on every keystroke.
+    Return Type: QTimer
+    """
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(SEARCH_DEBOUNCE_MSEC)
+    timer.timeout.connect(lambda: search_func(search_box.text()))
+    search_box.textChanged.connect(timer.start)
+    return timer
+
+
+class SearchIndexProxyModel(QSortFilterProxyModel):
+    """
+    Sort/filter proxy which filters rows against a normalized search index (see normalize_search_text).
+    The search key of a source row is built once and reused for every keystroke until the row changes.
+    """
+
+    def __init__(self, parent=None, search_keys: Callable[[int], list[str]] | None = None):
+        """
+        Parameters:
+            search_keys: Callable[[int], list[str]] | None
+                Returns the searchable strings (e.g. name, app id, executable) for a source row.
+                Defaults to the text of all columns of the row.
+        """
+        super(SearchIndexProxyModel, self).__init__(parent)
+
+        self.search_keys = search_keys
+        self._search_index: dict[int, str] = {}  # source row -> normalized search key
+        self._search_text: str = ''
+
+    def setSourceModel(self, source_model: QAbstractTableModel):
+        # Rows may move around, forget the index before the proxy re-evaluates the filter for the new rows
+        self._search_index = {}
+        source_model.modelAboutToBeReset.connect(self.clear_search_index)
+        source_model.rowsAboutToBeInserted.connect(self.clear_search_index)
+        source_model.rowsAboutToBeRemoved.connect(self.clear_search_index)
+        source_model.layoutAboutToBeChanged.connect(self.clear_search_index)
+        source_model.dataChanged.connect(self.update_search_index)
+
+        super(SearchIndexProxyModel, self).setSourceModel(source_model)
+
+    def clear_search_index(self, *args):
+        self._search_index = {}
+
+    def update_search_index(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: list[int] | None = None):
+        """ Rebuild the search key of changed rows and filter again if one of them changed """
+        changed = False
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            if row in self._search_index:
+                old_key = self._search_index.pop(row)
+                changed = changed or old_key != self.get_search_key(row)
+
+        if changed and self._search_text:
+            self.begin_filter_change()
+            self.end_filter_change()
+
+    def get_search_key(self, source_row: int) -> str:
+        if source_row not in self._search_index:
+            if self.search_keys:
+                keys = self.search_keys(source_row)
+            else:
+                model = self.sourceModel()
+                keys = [model.index(source_row, column).data(Qt.DisplayRole) for column in range(model.columnCount())]
+            # Separate keys by a newline so a search never matches across two fields
+            self._search_index[source_row] = '\n'.join(normalize_search_text(key) for key in keys if key is not None)
+
+        return self._search_index[source_row]
+
+    def set_search_text(self, text: str):
+        """ Only show rows whose search key contains text """
+        search_text = normalize_search_text(text)
+        if search_text == self._search_text:
+            return
+
+        self.begin_filter_change()
+        self._search_text = search_text
+        self.end_filter_change()
+
+    def begin_filter_change(self):
+        if hasattr(self, 'beginFilterChange'):  # Qt 6.9+, invalidateRowsFilter is deprecated there
+            self.beginFilterChange()
+
+    def end_filter_change(self):
+        if hasattr(self, 'endFilterChange'):
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        else:
+            self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not self._search_text:
+            return True
+        return self._search_text in self.get_search_key(source_row)
+
+
+class SteamGameListModel(QAbstractTableModel):
+    """
+    Table model for the Steam game list. Cell contents are computed on demand when the view requests them,
+    so opening the game list does not create any widgets per game.
+    """
+
+    compat_tool_changed = Signal(str, SteamApp)
+
+    def __init__(self, deck_compat_text: Callable[[SteamApp], str], awacy_status: Callable[[SteamApp], tuple[str, str]], parent=None):
+        """
+        Parameters:
+            deck_compat_text: Callable[[SteamApp], str]
+                Returns the translated Steam Deck compatibility text for a game
+            awacy_status: Callable[[SteamApp], tuple[str, str]]
+                Returns the translated AreWeAntiCheatYet tooltip and icon name for a game
+        """
+        super(SteamGameListModel, self).__init__(parent)
+
+        self.deck_compat_text = deck_compat_text
+        self.awacy_status = awacy_status
+
+        self.games: list[SteamApp] = []
+        self.ctools: list[str] = []
+        self.header_data: dict[tuple[int, int], Any] = {}  # (section, role) -> value
+
+        self.compat_tool_overrides: dict[int, str | None] = {}  # row -> queued compatibility tool
+        self._rows_by_app_id: dict[int, int] = {}
+        self._deck_compat_text_cache: dict[int, str] = {}
+        self._awacy_status_cache: dict[int, tuple[str, str]] = {}
+
+    def set_games(self, games: list[SteamApp], ctools: list[str]):
+        """ Replace the games shown in the model and the compatibility tools which can be selected """
+        self.beginResetModel()
+        self.games = games
+        self.ctools = ctools
+        self.compat_tool_overrides = {}
+        self._rows_by_app_id = {game.app_id: row for row, game in enumerate(games)}
+        self._deck_compat_text_cache = {}
+        self._awacy_status_cache = {}
+        self.endResetModel()
+
+    def get_game(self, row: int) -> SteamApp:
+        return self.games[row]
+
+    def get_compat_tool(self, row: int) -> str | None:
+        """ Returns the queued compatibility tool for a game if it was changed, otherwise the current one """
+        if row in self.compat_tool_overrides:
+            return self.compat_tool_overrides[row]
+        return self.games[row].compat_tool
+
+    def get_compat_tool_choices(self, row: int) -> list[str]:
+        """ Returns the entries of the compatibility tool combobox for a game """
+        choices = ['-'] + self.ctools
+        compat_tool = self.games[row].compat_tool
+        if compat_tool and compat_tool not in self.ctools:
+            choices.append(compat_tool)
+        return choices
+
+    def update_game(self, game: SteamApp):
+        """ Notify the view that a game (e.g. its ProtonDB status) changed """
+        row = self._rows_by_app_id.get(game.app_id)
+        if row is None or self.games[row] is not game:
+            return
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.games)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 5
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation != Qt.Horizontal:
+            return None
+        return self.header_data.get((section, role))
+
+    def setHeaderData(self, section: int, orientation: Qt.Orientation, value: Any, role: int = Qt.EditRole) -> bool:
+        if orientation != Qt.Horizontal:
+            return False
+        self.header_data[(section, Qt.DisplayRole if role == Qt.EditRole else role)] = value
+        self.headerDataChanged.emit(orientation, section, section)
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        flags = super(SteamGameListModel, self).flags(index)
+        if index.isValid() and index.column() == STEAM_COLUMN_COMPAT_TOOL:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or index.column() != STEAM_COLUMN_COMPAT_TOOL or role != Qt.EditRole:
+            return False
+
+        row = index.row()
+        if value == (self.get_compat_tool(row) or '-'):
+            return False
+
+        self.compat_tool_overrides[row] = None if value in {'-', ''} else value
+        self.dataChanged.emit(index, index)
+        self.compat_tool_changed.emit(value, self.games[row])
+        return True
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        game = self.games[index.row()]
+        column = index.column()
+
+        if column == STEAM_COLUMN_NAME:
+            if role in (Qt.DisplayRole, SORT_ROLE):
+                return game.game_name
+            elif role == Qt.ToolTipRole:
+                return f'{game.game_name} ({game.app_id})'
+            elif role == Qt.UserRole:
+                return f'{STEAM_APP_PAGE_URL}{game.app_id}'  # e.g. https://store.steampowered.com/app/620
+        elif column == STEAM_COLUMN_COMPAT_TOOL:
+            if role in (Qt.DisplayRole, Qt.EditRole, SORT_ROLE):
+                return self.get_compat_tool(index.row()) or '-'
+        elif column == STEAM_COLUMN_DECK_COMPAT:
+            if role in (Qt.DisplayRole, Qt.ToolTipRole, SORT_ROLE):
+                if index.row() not in self._deck_compat_text_cache:
+                    self._deck_compat_text_cache[index.row()] = self.deck_compat_text(game)
+                return self._deck_compat_text_cache[index.row()]
+        elif column == STEAM_COLUMN_AWACY:
+            if role == SORT_ROLE:
+                return game.awacy_status.value
+            elif role in (Qt.DecorationRole, Qt.ToolTipRole):
+                if index.row() not in self._awacy_status_cache:
+                    self._awacy_status_cache[index.row()] = self.awacy_status(game)
+                awacy_tooltip, awacy_icon = self._awacy_status_cache[index.row()]
+                return get_cached_pixmap(awacy_icon) if role == Qt.DecorationRole else awacy_tooltip
+            elif role == Qt.UserRole:
+                search_str = ('' if game.awacy_status == AWACYStatus.UNKNOWN else game.game_name)
+                return AWACY_WEB_URL.format(GAMENAME=search_str)
+        elif column == STEAM_COLUMN_PROTONDB:
+            pdb_error = game.protondb_summary.get('error') if game.protondb_summary else None  # Not listed on ProtonDB.com or request failed, see get_protondb_status_thread
+            pdb_tier = game.protondb_summary.get('tier', '?') if game.protondb_summary and not pdb_error else None
+            if role in (Qt.DisplayRole, SORT_ROLE):
+                if pdb_error == PROTONDB_NOT_FOUND:
+                    return QCoreApplication.instance().translate('PupguiGameListDialog', 'not found')
+                elif pdb_error:
+                    return QCoreApplication.instance().translate('PupguiGameListDialog', 'error')
+                return pdb_tier or QCoreApplication.instance().translate('PupguiGameListDialog', 'click')
+            elif role == Qt.ForegroundRole and pdb_tier:
+                return QBrush(QColor(PROTONDB_COLORS.get(pdb_tier)))
+            elif role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter
+            elif role == Qt.ToolTipRole:
+                if pdb_error == PROTONDB_NOT_FOUND:
+                    return QCoreApplication.instance().translate('PupguiGameListDialog', 'The game is not listed on ProtonDB. Click to try again')
+                elif pdb_error:
+                    return QCoreApplication.instance().translate('PupguiGameListDialog', 'Could not fetch the ProtonDB rating. Click to try again')
+                elif not pdb_tier:
+                    return QCoreApplication.instance().translate('PupguiGameListDialog', 'Click to fetch the ProtonDB rating')
+                return QCoreApplication.instance().translate('PupguiGameListDialog', 'Confidence: {confidence}\nScore: {score}\nTrending: {trending}') \
+                    .format(confidence=game.protondb_summary.get('confidence', '?'),
+                            score=game.protondb_summary.get('score', '?'),
+                            trending=game.protondb_summary.get('trendingTier', '?'))
+            elif role == Qt.UserRole and pdb_tier:
+                return f'{PROTONDB_APP_PAGE_URL}{game.app_id}'  # e.g. https://www.protondb.com/app/412830
+
+        return None
+
+
+class CompatToolComboBoxDelegate(QStyledItemDelegate):
+    """
+    Item delegate which creates a compatibility tool QComboBox only while a cell is edited,
+    instead of keeping one combobox per game alive.
+    """
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> QWidget:
+        source_index = index.model().mapToSource(index) if hasattr(index.model(), 'mapToSource') else index
+
+        combo = QComboBox(parent)
+        combo.addItems(source_index.model().get_compat_tool_choices(source_index.row()))
+        combo.activated.connect(lambda _, combo=combo: self.commit_and_close(combo))
+        QTimer.singleShot(0, combo.showPopup)
+        return combo
+
+    def setEditorData(self, editor: QComboBox, index: QModelIndex):
+        editor.setCurrentText(index.data(Qt.EditRole))
+
+    def setModelData(self, editor: QComboBox, model: QAbstractTableModel, index: QModelIndex):
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
+    def updateEditorGeometry(self, editor: QWidget, option: QStyleOptionViewItem, index: QModelIndex):
+        editor.setGeometry(option.rect)
+
+    def commit_and_close(self, editor: QComboBox):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
+
+class CenteredIconDelegate(QStyledItemDelegate):
+    """ Item delegate which draws the decoration (icon) of a cell centered """
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex):
+        super(CenteredIconDelegate, self).initStyleOption(option, index)
+        option.decorationAlignment = Qt.AlignCenter
+        option.decorationPosition = QStyleOptionViewItem.Top
+        option.displayAlignment = Qt.AlignCenter
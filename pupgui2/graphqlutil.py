@@ -0,0 +1,148 @@
+import re
+import time
+import threading
+import requests
+
+from pupgui2.constants import GITHUB_API, GITHUB_GRAPHQL_API, GITHUB_GRAPHQL_RELEASES_COUNT, GITHUB_GRAPHQL_CACHE_TTL
+
+
+RELEASES_URL_REGEX = re.compile(rf'^{re.escape(GITHUB_API)}repos/(?P<owner>[^/]+)/(?P<name>[^/]+)/releases/?$')
+
+RELEASES_QUERY_FRAGMENT = '''
+  {alias}: repository(owner: "{owner}", name: "{name}") {{
+    releases(first: {count}, orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      nodes {{
+        tagName
+        publishedAt
+        isDraft
+        isPrerelease
+        isLatest
+        releaseAssets(first: 100) {{
+          nodes {{ name downloadUrl size }}
+        }}
+      }}
+    }}
+  }}'''
+
+_releases_cache: dict[str, tuple[float, list[dict]]] = {}  # releases url -> (time, releases in the format of the REST API)
+_releases_cache_lock = threading.Lock()
+
+
+def parse_releases_url(releases_url: str) -> tuple[str, str] | None:
+    """
+    Return owner and name of the repository for a GitHub REST releases url, e.g. https://api.github.com/repos/<owner>/<name>/releases
+    Return Type: tuple[str, str] | None
+    """
+    if match := RELEASES_URL_REGEX.match(releases_url):
+        return match.group('owner'), match.group('name')
+    return None
+
+
+def graphql_release_to_rest(release: dict) -> dict:
+    """
+    Convert a release returned by the GraphQL API to the fields of a release returned by the REST API,
+    so it can be used by fetch_project_releases/fetch_project_release_data and the ctmods.
+    Return Type: dict
+    """
+    return {
+        'tag_name': release.get('tagName'),
+        'published_at': release.get('publishedAt') or '',
+        'prerelease': release.get('isPrerelease', False),
+        'is_latest': release.get('isLatest', False),
+        'assets': [
+            {'name': asset.get('name', ''), 'browser_download_url': asset.get('downloadUrl', ''), 'size': asset.get('size')}
+            for asset in (release.get('releaseAssets') or {}).get('nodes', [])
+        ]
+    }
+
+
+def prefetch_github_releases(releases_urls: list[str], github_token: str, count: int = GITHUB_GRAPHQL_RELEASES_COUNT) -> bool:
+    """
+    Fetch the latest releases of several GitHub repositories in one GraphQL query and keep them in memory
+    for GITHUB_GRAPHQL_CACHE_TTL seconds, see get_prefetched_releases.
+    The GraphQL API can only be used with a GitHub token. Without one, nothing is fetched.
+
+    Parameters:
+        releases_urls: list[str]
+            GitHub REST releases urls, e.g. https://api.github.com/repos/<owner>/<name>/releases
+        github_token: str
+            GitHub access token
+        count: int
+            Number of releases to fetch per repository
+
+    Return Type: bool
+    """
+    if not github_token:
+        return False
+
+    repositories: dict[str, tuple[str, str]] = {}
+    for releases_url in dict.fromkeys(releases_urls):  # unique urls, keep order
+        if get_prefetched_releases(releases_url) is None and (repository := parse_releases_url(releases_url)):
+            repositories[releases_url] = repository
+
+    if len(repositories) == 0:
+        return True
+
+    aliases = {f'r{i}': releases_url for i, releases_url in enumerate(repositories)}
+    query = '{' + ''.join(
+        RELEASES_QUERY_FRAGMENT.format(alias=alias, owner=repositories[releases_url][0], name=repositories[releases_url][1], count=count)
+        for alias, releases_url in aliases.items()
+    ) + '\n}'
+
+    try:
+        response = requests.post(GITHUB_GRAPHQL_API, json={'query': query}, headers={'Authorization': f'bearer {github_token}'}, timeout=15)
+        data = response.json().get('data') or {}
+    except (requests.RequestException, ValueError) as e:
+        print(f'Warning: Could not fetch releases using the GitHub GraphQL API: {e}')
+        return False
+
+    if response.status_code != 200 or not data:
+        print(f'Warning: Could not fetch releases using the GitHub GraphQL API: {response.status_code} {response.text[:200]}')
+        return False
+
+    now = time.time()
+    with _releases_cache_lock:
+        for alias, releases_url in aliases.items():
+            if not (repository := data.get(alias)):  # e.g. repository was renamed, the REST API is used for it
+                continue
+            releases = [graphql_release_to_rest(release) for release in repository.get('releases', {}).get('nodes', []) if not release.get('isDraft')]
+            _releases_cache[releases_url] = (now, releases)
+
+    return True
+
+
+def get_prefetched_releases(releases_url: str) -> list[dict] | None:
+    """
+    Return the releases fetched by prefetch_github_releases for a GitHub REST releases url, newest first.
+    Returns None if they were not prefetched or are outdated.
+    Return Type: list[dict] | None
+    """
+    with _releases_cache_lock:
+        cached = _releases_cache.get(releases_url.rstrip('/'))
+        if cached is None:
+            cached = _releases_cache.get(releases_url)
+
+    if cached is None or time.time() - cached[0] >= GITHUB_GRAPHQL_CACHE_TTL:
+        return None
+    return cached[1]
+
+
+def get_prefetched_release(releases_url: str, tag: str = '') -> dict | None:
+    """
+    Return a single prefetched release by its tag, or the latest release if no tag is given.
+    Returns None if the release was not prefetched.
+    Return Type: dict | None
+    """
+    if not (releases := get_prefetched_releases(releases_url)):
+        return None
+
+    for release in releases:
+        if (tag and release.get('tag_name') == tag) or (not tag and release.get('is_latest')):
+            return release
+    return None
+
+
+def clear_prefetched_releases() -> None:
+    """ Forget all prefetched releases """
+    with _releases_cache_lock:
+        _releases_cache.clear()
@@ -0,0 +1,124 @@
+import os
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from pupgui2.datastructures import BasicCompatTool
+from pupgui2.gameindex import get_game_index
+from pupgui2.heroicutil import is_heroic_launcher
+from pupgui2.steamutil import get_steam_acruntime_list, get_steam_global_ctool_name
+from pupgui2.util import get_installed_ctools, get_install_location_from_directory_name
+
+
+class InstalledCtoolsSnapshot:
+    """
+    Installed compatibility tools of an install directory and the number of games using them, collected by InstalledCtoolsWorker.
+    The snapshot belongs to the GUI thread once it was emitted and is not modified by the worker anymore.
+    """
+
+    def __init__(self, generation: int, install_dir: str, ctools: tuple[BasicCompatTool, ...]):
+        self.generation = generation
+        self.install_dir = install_dir
+        self.ctools = ctools
+
+
+def get_installed_versions(ctool_name: str, ctool_dir: str) -> list[BasicCompatTool]:
+    """
+    Return the tools installed in a launcher specific directory (e.g. DXVK for Lutris), prefixed with ctool_name.
+    Return Type: list[BasicCompatTool]
+    """
+    ctools = get_installed_ctools(ctool_dir)
+    for ct in ctools:
+        if ctool_name not in ct.get_displayname().lower():
+            ct.displayname = f'{ctool_name} {ct.displayname}'
+
+    return ctools
+
+
+def collect_installed_ctools(install_dir: str, origin: object = None) -> list[BasicCompatTool]:
+    """
+    List the installed compatibility tools for install_dir, including launcher specific tools and runtimes,
+    with the number of games using them. The global Steam compatibility tool is moved to the top.
+    origin is passed to the GameIndex when the games are loaded again (see GameIndex.changed).
+    Does not access any widgets, so it can be called from a worker thread.
+    Return Type: list[BasicCompatTool]
+    """
+    install_loc = get_install_location_from_directory_name(install_dir)
+    game_index = get_game_index()
+
+    ctools = get_installed_ctools(install_dir)
+
+    # Launcher specific (Lutris): Show DXVK and vkd3d-proton
+    if install_loc.get('launcher') == 'lutris':
+        ctools += get_installed_versions('dxvk', os.path.join(install_dir, '../../runtime/dxvk'))
+        ctools += get_installed_versions('vkd3d', os.path.join(install_dir, '../../runtime/vkd3d'))
+        ctools += get_installed_versions('proton', os.path.join(install_dir, '../../runners/proton'))
+    # Launcher specific (Steam): Number of games using the compatibility tool
+    elif install_loc.get('launcher') == 'steam' and 'vdf_dir' in install_loc:
+        game_index.get_snapshot(install_loc, refresh=True, origin=origin)  # load the games again if the Steam files changed
+        global_ctool_name: str = get_steam_global_ctool_name(install_loc.get('vdf_dir'))
+        ctools += get_steam_acruntime_list(install_loc.get('vdf_dir'), cached=True)
+        for ct in ctools:
+            # Includes games using a runtime, runtimes are dependencies of apps and not selected compatibility tools
+            ct.no_games = len(game_index.get_games_for_compat_tool(install_loc, ct))
+            if ct.get_internal_name() == global_ctool_name:
+                ct.set_global()  # Set (global) text
+
+        ctools.sort(key=lambda ct: not ct.is_global)  # Move global ctool to top of list
+    # Launcher specific (Heroic): Set number of installed games using compat tool
+    elif is_heroic_launcher(install_loc.get('launcher')):
+        game_index.get_snapshot(install_loc, refresh=True, origin=origin)
+        for ct in ctools:
+            ct.no_games = len(game_index.get_games_for_compat_tool(install_loc, ct))
+
+        # Get DXVK/VKD3D installs for Heroic
+        ctools += get_installed_versions('dxvk', os.path.join(install_dir, '../dxvk'))
+        ctools += get_installed_versions('vkd3d', os.path.join(install_dir, '../vkd3d'))
+
+    return ctools
+
+
+class InstalledCtoolsWorker(QObject):
+    """
+    Collects the installed compatibility tools (see collect_installed_ctools) in a background thread.
+    Every request gets a new generation, snapshots of older requests are not emitted.
+    """
+
+    snapshot_ready = Signal(InstalledCtoolsSnapshot)
+
+    def __init__(self, parent=None):
+        super(InstalledCtoolsWorker, self).__init__(parent)
+        self.generation = 0
+        self._lock = threading.Lock()
+
+    def request(self, install_dir: str) -> int:
+        """
+        Start collecting the installed compatibility tools for install_dir, snapshot_ready is emitted when done.
+        Return Type: int (generation of the request)
+        """
+        with self._lock:
+            self.generation += 1
+            generation = self.generation
+
+        t = threading.Thread(target=self._collect, args=[generation, install_dir], daemon=True)
+        t.start()
+        return generation
+
+    def is_current(self, snapshot: InstalledCtoolsSnapshot) -> bool:
+        """
+        Return whether snapshot belongs to the latest request.
+        Return Type: bool
+        """
+        with self._lock:
+            return snapshot.generation == self.generation
+
+    def _collect(self, generation: int, install_dir: str):
+        try:
+            ctools = collect_installed_ctools(install_dir, origin=self)
+        except Exception as e:
+            print(f'Warning: Could not list the installed compatibility tools in {install_dir}: {e}')
+            ctools = []
+
+        snapshot = InstalledCtoolsSnapshot(generation, install_dir, tuple(ctools))
+        if self.is_current(snapshot):
+            self.snapshot_ready.emit(snapshot)
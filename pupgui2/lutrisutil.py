@@ -1,7 +1,10 @@
 import os
+import pathlib
 import sqlite3
 
-from pupgui2.datastructures import LutrisGame
+from contextlib import closing
+
+from pupgui2.datastructures import LutrisGame, lutris_game_config_index
 
 
 LUTRIS_PGA_GAMELIST_QUERY = 'SELECT slug, name, runner, installer_slug, installed_at, directory FROM games'
@@ -16,11 +19,15 @@ def get_lutris_game_list(install_loc) -> list[LutrisGame]:
     lutris_data_dir = os.path.join(install_dir, os.pardir, os.pardir)
     pga_db_file = os.path.join(lutris_data_dir, 'pga.db')
     lgs = []
+
+    # Read all game configs once, LutrisGame.get_game_config only looks them up afterwards
+    if lutris_game_config_dir := LutrisGame.get_game_config_dir(install_loc):
+        lutris_game_config_index.get(lutris_game_config_dir, cached=False)
+
     try:
-        con = sqlite3.connect(pga_db_file)
-        cur = con.cursor()
-        cur.execute(LUTRIS_PGA_GAMELIST_QUERY)
-        res = cur.fetchall()
+        # Open read-only, Lutris may be running and using the database
+        with closing(sqlite3.connect(f'{pathlib.Path(os.path.abspath(pga_db_file)).as_uri()}?mode=ro', uri=True)) as con:
+            res = con.execute(LUTRIS_PGA_GAMELIST_QUERY).fetchall()
         for g in res:
             lg = LutrisGame()
             lg.install_loc = install_loc
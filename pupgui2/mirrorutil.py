@@ -0,0 +1,221 @@
+import os
+import re
+import time
+import shutil
+import hashlib
+import argparse
+import threading
+import requests
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+
+from pupgui2.constants import MIRROR_CACHE_DIR, MIRROR_DEFAULT_PORT, MIRROR_CONNECT_TIMEOUT, MIRROR_METADATA_TTL
+from pupgui2.constants import MIRROR_UPSTREAM_HOSTS, MIRROR_METADATA_PREFIXES
+
+
+CHECKSUM_REGEX = re.compile(r'\b([0-9a-fA-F]{128}|[0-9a-fA-F]{64})\b')
+
+
+def get_mirror_url(url: str, mirror_base: str) -> str:
+    """
+    Return the url of a file on the mirror, e.g. https://github.com/<owner>/<repo>/releases/download/<tag>/<file>
+    becomes <mirror_base>/github.com/<owner>/<repo>/releases/download/<tag>/<file>
+    Returns an empty string if no mirror is configured or the mirror does not fetch from the host of url.
+    Return Type: str
+    """
+    if not mirror_base or url.startswith(mirror_base):
+        return ''
+
+    split_url = urlsplit(url)
+    if split_url.scheme != 'https' or split_url.netloc not in MIRROR_UPSTREAM_HOSTS:
+        return ''
+
+    return f'{mirror_base.rstrip("/")}/{split_url.netloc}{split_url.path}' + (f'?{split_url.query}' if split_url.query else '')
+
+
+def fetch_json_from_mirror(url: str, mirror_base: str) -> dict | list | None:
+    """
+    Fetch a JSON response (e.g. release information) for url from the mirror.
+    Returns None if there is no mirror or it cannot provide the response, so the caller can ask upstream instead.
+    Return Type: dict | list | None
+    """
+    if not (mirror_url := get_mirror_url(url, mirror_base)):
+        return None
+
+    try:
+        response = requests.get(mirror_url, timeout=(MIRROR_CONNECT_TIMEOUT, 30))
+        if response.status_code == 200:
+            return response.json()
+    except (requests.RequestException, ValueError) as e:
+        print(f'Warning: Could not fetch {url} from mirror {mirror_base}, using upstream: {e}')
+
+    return None
+
+
+def verify_checksum(file_path: str, checksum: str, buffer_size: int = 65536) -> bool:
+    """
+    Check a file against a checksum as published upstream, e.g. the content of a .sha512sum/.sha256sum file.
+    SHA512 and SHA256 are detected by the length of the checksum.
+    Returns True if checksum contains no known checksum.
+    Return Type: bool
+    """
+    if not (match := CHECKSUM_REGEX.search(checksum)):
+        return True
+
+    expected_checksum = match.group(1).lower()
+    file_hash = hashlib.sha512() if len(expected_checksum) == 128 else hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        while data := f.read(buffer_size):
+            file_hash.update(data)
+
+    return file_hash.hexdigest() == expected_checksum
+
+
+class MirrorCache:
+    """
+    Pull-through cache for compatibility tool archives and release information, used by 'protonup-qt serve-cache'.
+    Archives are stored in cache_dir and never fetched twice, release information is kept in memory for MIRROR_METADATA_TTL seconds.
+    """
+
+    def __init__(self, cache_dir: str = MIRROR_CACHE_DIR, github_token: str = '') -> None:
+        self.cache_dir = cache_dir
+        self.github_token = github_token
+
+        self._metadata: dict[str, tuple[float, bytes]] = {}  # url -> (time, response body)
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def _get_lock(self, key: str) -> threading.Lock:
+        """ One lock per file, so that clients requesting the same file at the same time only download it once """
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _upstream_headers(self, upstream_url: str) -> dict[str, str]:
+        if self.github_token and upstream_url.startswith('https://api.github.com/'):
+            return {'Authorization': f'token {self.github_token}'}
+        return {}
+
+    def get_upstream_url(self, path: str) -> str:
+        """
+        Return the upstream url for a request path of the mirror, e.g. /github.com/<owner>/<repo>/...
+        Returns an empty string if the path is not allowed.
+        Return Type: str
+        """
+        host, _, upstream_path = path.lstrip('/').partition('/')
+        if host not in MIRROR_UPSTREAM_HOSTS or '..' in upstream_path.split('?')[0].split('/'):
+            return ''
+        return f'https://{host}/{upstream_path}'
+
+    def is_metadata(self, upstream_url: str) -> bool:
+        return any(upstream_url.startswith(f'https://{prefix}') for prefix in MIRROR_METADATA_PREFIXES)
+
+    def get_metadata(self, upstream_url: str) -> bytes | None:
+        """
+        Return the body of an API response, fetched from upstream if not cached.
+        Return Type: bytes | None
+        """
+        with self._get_lock(upstream_url):
+            cached = self._metadata.get(upstream_url)
+            if cached and time.time() - cached[0] < MIRROR_METADATA_TTL:
+                return cached[1]
+
+            response = requests.get(upstream_url, headers=self._upstream_headers(upstream_url), timeout=30)
+            if response.status_code != 200:
+                return None
+
+            self._metadata[upstream_url] = (time.time(), response.content)
+            return response.content
+
+    def get_file(self, upstream_url: str) -> str | None:
+        """
+        Return the path to a cached archive, downloaded from upstream if not cached.
+        Return Type: str | None
+        """
+        split_url = urlsplit(upstream_url)
+        file_path = os.path.join(self.cache_dir, split_url.netloc, split_url.path.lstrip('/'))
+
+        with self._get_lock(file_path):
+            if os.path.isfile(file_path):
+                return file_path
+
+            print(f'Mirror: Fetching {upstream_url}')
+            response = requests.get(upstream_url, stream=True, timeout=30)
+            if response.status_code != 200:
+                return None
+
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            tmp_file_path = f'{file_path}.part'
+            with open(tmp_file_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+            os.replace(tmp_file_path, file_path)
+
+            return file_path
+
+
+class MirrorRequestHandler(BaseHTTPRequestHandler):
+    """ Serves files of a MirrorCache (set as server.mirror_cache) """
+
+    def do_GET(self) -> None:
+        mirror_cache: MirrorCache = self.server.mirror_cache
+
+        if not (upstream_url := mirror_cache.get_upstream_url(self.path)):
+            self.send_error(404)
+            return
+
+        try:
+            if mirror_cache.is_metadata(upstream_url):
+                if (content := mirror_cache.get_metadata(upstream_url)) is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+                return
+
+            if not (file_path := mirror_cache.get_file(upstream_url)):
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/octet-stream')
+            self.send_header('Content-Length', str(os.path.getsize(file_path)))
+            self.end_headers()
+            with open(file_path, 'rb') as f:
+                shutil.copyfileobj(f, self.wfile)
+        except (OSError, requests.RequestException) as e:
+            print(f'Mirror: Could not serve {upstream_url}: {e}')
+            self.send_error(502)
+
+
+def create_mirror_server(bind: str = '', port: int = MIRROR_DEFAULT_PORT, cache_dir: str = MIRROR_CACHE_DIR, github_token: str = '') -> ThreadingHTTPServer:
+    """
+    Create (but do not start) the HTTP server of the LAN mirror.
+    Return Type: ThreadingHTTPServer
+    """
+    server = ThreadingHTTPServer((bind, port), MirrorRequestHandler)
+    server.mirror_cache = MirrorCache(cache_dir=cache_dir, github_token=github_token)
+    return server
+
+
+def serve_cache(args: list[str], github_token: str = '') -> None:
+    """
+    Run 'protonup-qt serve-cache': Serve compatibility tools to other devices in the local network.
+    Other devices use it by setting 'mirror_url' in the [pupgui2] section of their config.ini to http://<host>:<port>
+    """
+    parser = argparse.ArgumentParser(prog='protonup-qt serve-cache', description='Cache compatibility tools for other devices in the local network.')
+    parser.add_argument('--bind', default='', help='Address to listen on (default: all)')
+    parser.add_argument('--port', type=int, default=MIRROR_DEFAULT_PORT, help=f'Port to listen on (default: {MIRROR_DEFAULT_PORT})')
+    parser.add_argument('--cache-dir', default=MIRROR_CACHE_DIR, help=f'Directory to store archives in (default: {MIRROR_CACHE_DIR})')
+    parsed_args = parser.parse_args(args)
+
+    server = create_mirror_server(parsed_args.bind, parsed_args.port, parsed_args.cache_dir, github_token=github_token)
+    print(f'Serving compatibility tool cache from {parsed_args.cache_dir} on port {parsed_args.port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
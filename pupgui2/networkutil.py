@@ -6,8 +6,25 @@ from PySide6.QtCore import Property
 
 from typing import Callable
 
+from pupgui2.cacheutil import ArchiveCache, link_or_copy_file
+from pupgui2.constants import ARCHIVE_CACHE_DIR, MIRROR_CONNECT_TIMEOUT
+from pupgui2.mirrorutil import get_mirror_url, verify_checksum
+from pupgui2.util import config_mirror_url, config_archive_cache_size
 
-def download_file(url: str, destination: str, progress_callback: Callable[[int], None] | Callable[..., None] = lambda *args, **kwargs: None, download_cancelled: Property | None = None, buffer_size: int = 65536, stream: bool = True, known_size: int = 0):
+
+_archive_cache = ArchiveCache(ARCHIVE_CACHE_DIR, max_size=0)
+
+
+def get_archive_cache() -> ArchiveCache:
+    """
+    Return the shared download archive cache, with the size limit from the config.
+    Return Type: ArchiveCache
+    """
+    _archive_cache.max_size = config_archive_cache_size() * 1024 * 1024
+    return _archive_cache
+
+
+def download_file(url: str, destination: str, progress_callback: Callable[[int], None] | Callable[..., None] = lambda *args, **kwargs: None, download_cancelled: Property | None = None, buffer_size: int = 65536, stream: bool = True, known_size: int = 0, checksum: str = '', use_archive_cache: bool = False):
     """
     Download a file from a given URL using `requests` to a destination directory with download progress, with some optional parameters:
     * `progress_callback`: Function or Lambda that gets called with the download progress each time it changes
@@ -15,6 +32,12 @@ def download_file(url: str, destination: str, progress_callback: Callable[[int],
     * `buffer_size`: Size of chunks to download the file in
     * `stream`: Lazily parse response - If response headers won't contain `'Content-Length'` and the file size is not known ahead of time, set this to `False` to get file size from response content length
     * `known_size`: If size is known ahead of time, this can be given to calculate download progress in place of Content-Length header (e.g. where it may be missing)
+    * `checksum`: Upstream checksum (e.g. content of a .sha512sum file) a file downloaded from the mirror is verified against
+    * `use_archive_cache`: Take the file from the archive cache if it was downloaded before, and add it to the cache after downloading.
+                           Only use this if the file at `url` never changes (e.g. release assets, but not branch archives).
+
+    If a mirror is configured (see `config_mirror_url`), the file is downloaded from the mirror first.
+    If the mirror does not have the file, is not reachable or the file does not match `checksum`, it is downloaded from `url`.
 
     Returns `True` if download succeeds, `False` otherwise.
 
@@ -22,6 +45,46 @@ def download_file(url: str, destination: str, progress_callback: Callable[[int],
     Return Type: bool
     """
 
+    archive_cache = get_archive_cache() if use_archive_cache else None
+    if archive_cache and (cached_file := archive_cache.get(url, checksum)):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(os.path.expanduser(destination))), exist_ok=True)
+            link_or_copy_file(cached_file, os.path.expanduser(destination))
+            progress_callback(99)  # 99 = Download completed successfully
+            return True
+        except OSError as e:
+            print(f"Warning: Could not use cached archive '{cached_file}', downloading it again. Reason: {e}")
+
+    if not _download_file(url, destination, progress_callback, download_cancelled, buffer_size, stream, known_size, checksum):
+        return False
+
+    # Don't cache files that don't match the checksum, they would be used over and over again
+    if archive_cache and (not checksum or verify_checksum(destination, checksum)):
+        archive_cache.put(url, os.path.expanduser(destination), checksum)
+
+    return True
+
+
+def _download_file(url: str, destination: str, progress_callback: Callable[..., None], download_cancelled: Property | None, buffer_size: int, stream: bool, known_size: int, checksum: str) -> bool:
+    """
+    Download a file from the mirror or from url, see download_file.
+    Return Type: bool
+    """
+
+    if mirror_url := get_mirror_url(url, config_mirror_url()):
+        try:
+            response: requests.Response = requests.get(mirror_url, stream=stream, timeout=(MIRROR_CONNECT_TIMEOUT, 60))
+            response.raise_for_status()
+
+            if not _download_response(response, destination, progress_callback, download_cancelled, buffer_size, stream, known_size):
+                return False  # Cancelled
+            if not checksum or verify_checksum(destination, checksum, buffer_size=max(buffer_size, 65536)):
+                return True
+
+            print(f"Warning: File '{mirror_url}' from mirror does not match the upstream checksum, downloading from upstream")
+        except (OSError, requests.RequestException) as e:
+            print(f"Warning: Could not download '{url}' from mirror, downloading from upstream. Reason: {e}")
+
     # Try to get the data for the file we want
     try:
         response: requests.Response = requests.get(url, stream=stream)
@@ -29,6 +92,15 @@ def download_file(url: str, destination: str, progress_callback: Callable[[int],
         print(f"Error: Failed to make request to URL '{url}', cannot complete download! Reason: {e}")
         raise e
 
+    return _download_response(response, destination, progress_callback, download_cancelled, buffer_size, stream, known_size)
+
+
+def _download_response(response: requests.Response, destination: str, progress_callback: Callable[..., None], download_cancelled: Property | None, buffer_size: int, stream: bool, known_size: int) -> bool:
+    """
+    Write the content of a response to destination and report the download progress, see download_file.
+    Return Type: bool
+    """
+
     progress_callback(1)  # 1 = download started
 
     # Figure out file size for reporting download progress    
@@ -66,7 +138,7 @@ def download_file(url: str, destination: str, progress_callback: Callable[[int],
     #       Content-Length, or len(response.content) is 0), then then the progress bar will stall at 1% until
     #       the download finishes where it will jump to 99%, until extraction completes.
     try:
-        chunk_count = math.ceil(file_size / buffer_size)
+        chunk_count = max(math.ceil(file_size / buffer_size), 1)  # file_size may be 0 if it is unknown
     except ZeroDivisionError as e:
         print(f'Error: Could not calculate chunk_count, {e}')
         print('Defaulting to chunk count of 1')
@@ -85,6 +157,10 @@ def download_file(url: str, destination: str, progress_callback: Callable[[int],
         print(f'Error: Failed to create path to destination directory, cannot complete download! Reason: {e}')
         raise e
     
+    # Replace instead of overwrite, the destination may be a hardlink to a cached archive
+    if os.path.lexists(destination_file_path):
+        os.remove(destination_file_path)
+
     # Download file and return progress to any given callback
     with open(destination, 'wb') as destination_file:
         for chunk in response.iter_content(chunk_size=buffer_size):
@@ -6,7 +6,7 @@ import subprocess
 import threading
 
 from PySide6.QtCore import Qt, QCoreApplication, QObject, QThread, QWaitCondition, QMutex, QDataStream
-from PySide6.QtCore import QByteArray, QEvent, Signal, Slot, QTranslator, QLocale, QLibraryInfo
+from PySide6.QtCore import QByteArray, QEvent, Signal, Slot, QTranslator, QLocale, QLibraryInfo, QFileSystemWatcher, QTimer
 from PySide6.QtGui import QIcon, QKeyEvent, QKeySequence, QShortcut
 from PySide6.QtWidgets import QApplication, QDialog, QMessageBox, QLabel, QPushButton, QCheckBox
 from PySide6.QtWidgets import QProgressBar, QVBoxLayout, QSpacerItem, QSizePolicy
@@ -14,26 +14,36 @@ from PySide6.QtUiTools import QUiLoader
 from PySide6.QtDBus import QDBusConnection
 
 from pupgui2.constants import APP_NAME, APP_VERSION, APP_ID, BUILD_INFO, TEMP_DIR, STEAM_STL_INSTALL_PATH
-from pupgui2.constants import STEAM_BOXTRON_FLATPAK_APPSTREAM, STEAM_STL_FLATPAK_APPSTREAM, IS_FLATPAK
+from pupgui2.constants import STEAM_BOXTRON_FLATPAK_APPSTREAM, STEAM_STL_FLATPAK_APPSTREAM, IS_FLATPAK, INSTALL_LOCATION_POLL_INTERVAL
 from pupgui2 import ctloader
 from pupgui2.datastructures import CTType, MsgBoxType, MsgBoxResult
+from pupgui2.diskusage import ReclaimPlan, create_reclaim_plan, format_size
+from pupgui2.gameindex import GameIndex, get_game_index, get_game_index_watch_paths
 from pupgui2.gamepadinputworker import GamepadInputWorker
+from pupgui2.ctoolremovalworker import CtoolRemovalWorker, TrashedCtool
+from pupgui2.installedctoolsworker import InstalledCtoolsWorker, InstalledCtoolsSnapshot
 from pupgui2.pupgui2aboutdialog import PupguiAboutDialog
 from pupgui2.pupgui2ctinfodialog import PupguiCtInfoDialog
 from pupgui2.pupgui2customiddialog import PupguiCustomInstallDirectoryDialog
 from pupgui2.pupgui2exceptionhandler import PupguiExceptionHandler
 from pupgui2.pupgui2gamelistdialog import PupguiGameListDialog
 from pupgui2.pupgui2installdialog import PupguiInstallDialog
-from pupgui2.steamutil import get_steam_acruntime_list, get_steam_app_list, get_steam_ct_game_map, get_steam_global_ctool_name, ctool_is_runtime_for_app
-from pupgui2.heroicutil import is_heroic_launcher, get_heroic_game_list
+from pupgui2.steamutil import cancel_protondb_requests
+from pupgui2.heroicutil import is_heroic_launcher
 from pupgui2.dbusutil import dbus_progress_message
-from pupgui2.util import apply_dark_theme, create_compatibilitytools_folder, get_installed_ctools, remove_ctool
+from pupgui2.mirrorutil import serve_cache
+from pupgui2.systemprofile import preload_system_profile
+from pupgui2.util import apply_dark_theme, create_compatibilitytools_folder, remove_ctool, move_ctool_to_trash, get_ctool_trash_dir
 from pupgui2.util import install_directory, available_install_directories, get_install_location_from_directory_name
+from pupgui2.util import invalidate_available_install_directories, get_install_location_watch_dirs, get_missing_install_location_dirs, install_tool_to_locations
+from pupgui2.util import update_list_widget_texts
 from pupgui2.util import print_system_information, single_instance, download_awacy_gamelist, is_online, config_advanced_mode, config_github_access_token, config_gitlab_access_token, compat_tool_available
 
 
 class InstallWineThread(QThread):
 
+    download_progress_percent = Signal(float)  # Progress reported by the thread itself, e.g. after installing to several locations
+
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
@@ -61,13 +71,18 @@ class InstallWineThread(QThread):
         tool_name = compat_tool['name']
         tool_ver = compat_tool['version']
         install_dir = compat_tool['install_dir']
+        install_dirs = compat_tool.get('install_dirs', [install_dir])
 
         for ctobj in self.main_window.ct_loader.get_ctobjs():
             if ctobj['name'] == tool_name:
                 if not ctobj['installer'].is_system_compatible():
-                    self.main_window.set_download_progress_percent(-1)
+                    self.download_progress_percent.emit(-1)
                     break
-                ctobj['installer'].get_tool(tool_ver, os.path.expanduser(install_dir), TEMP_DIR)
+                if len(install_dirs) > 1:
+                    installed = install_tool_to_locations(ctobj['installer'], tool_ver, install_dirs, TEMP_DIR)
+                    self.download_progress_percent.emit(100 if installed else -1)  # Files were added to the install locations after the ctmod finished
+                else:
+                    ctobj['installer'].get_tool(tool_ver, os.path.expanduser(install_dir), TEMP_DIR)
                 break
 
     def stop(self):
@@ -78,6 +93,7 @@ class InstallWineThread(QThread):
 class MainWindow(QObject):
 
     update_statusbar_message = Signal(str)
+    reclaim_plan_ready = Signal(ReclaimPlan)
 
     def __init__(self):
         super(MainWindow, self).__init__()
@@ -96,16 +112,25 @@ class MainWindow(QObject):
                 cti.message_box_message.connect(self.show_msgbox)
             if hasattr(cti, 'question_box_message'):
                 cti.question_box_message.connect(self.show_msgbox_question, Qt.BlockingQueuedConnection)
-            cti.download_progress_percent.connect(self.set_download_progress_percent)
+            cti.download_progress_percent.connect(self.ctmod_download_progress_percent)
 
         self.combo_install_location_index_map = []
         self.updating_combo_install_location = False
         self.pending_downloads = []
         self.current_compat_tool_name = ""
         self.compat_tool_index_map = []
+        self.installed_ctools_install_dir = ''  # install directory of the tools in compat_tool_index_map
         self.msgcb_answer : MsgBoxResult = None
         self.msgcb_answer_lock = QMutex()
 
+        self.installed_ctools_worker = InstalledCtoolsWorker(self)
+        self.installed_ctools_worker.snapshot_ready.connect(self.apply_installed_ctools_snapshot)
+        get_game_index().changed.connect(self.game_index_changed, Qt.QueuedConnection)  # Emitted by worker threads
+        self.ctool_removal_worker = CtoolRemovalWorker(self)
+        self.removing_ctools = False  # Whether the user removed tools, the worker also deletes leftovers of earlier sessions
+        self.ctool_removal_worker.removal_progress.connect(self.ctool_removal_progress)
+        self.ctool_removal_worker.removal_finished.connect(self.ctool_removal_finished)
+
         self.dbus_session_bus = QDBusConnection.sessionBus()
         _ = dbus_progress_message(-1, 0)  # Reset any previously set download information to be blank
 
@@ -134,6 +159,28 @@ class MainWindow(QObject):
 
         self.update_combo_install_location()
 
+        # Look for new/removed launchers only when a launcher root directory changes
+        self.install_location_watcher = QFileSystemWatcher(self)
+        self.install_location_watcher_timer = QTimer(self)
+        self.install_location_watcher_timer.setSingleShot(True)
+        self.install_location_watcher_timer.setInterval(500)
+        self.install_location_watcher_timer.timeout.connect(self.refresh_install_locations)
+        self.install_location_watcher.directoryChanged.connect(self.install_location_watcher_timer.start)
+        self.missing_install_location_dirs: list[str] = []
+        self.install_location_poll_timer = QTimer(self)
+        self.install_location_poll_timer.setInterval(INSTALL_LOCATION_POLL_INTERVAL)
+        self.install_location_poll_timer.timeout.connect(self.poll_missing_install_locations)
+        self.update_install_location_watcher()
+
+        # Update the list when tools are (un)installed or games change outside of ProtonUp-Qt, once per burst of changes
+        self.install_dir_watcher = QFileSystemWatcher(self)
+        self.install_dir_watcher_timer = QTimer(self)
+        self.install_dir_watcher_timer.setSingleShot(True)
+        self.install_dir_watcher_timer.setInterval(500)
+        self.install_dir_watcher_timer.timeout.connect(self.update_ui)
+        self.install_dir_watcher.directoryChanged.connect(self.install_dir_watcher_timer.start)
+        self.install_dir_watcher.fileChanged.connect(self.install_dir_watcher_timer.start)
+
         self.ui.comboInstallLocation.currentIndexChanged.connect(self.combo_install_location_current_index_changed)
         self.ui.btnManageInstallLocations.clicked.connect(self.btn_manage_install_locations_clicked)
         self.ui.btnAddVersion.clicked.connect(self.btn_add_version_clicked)
@@ -146,6 +193,8 @@ class MainWindow(QObject):
         self.ui.listInstalledVersions.setStyleSheet('QListWidget::item { padding: 3px; }')
         self.ui.btnShowCtInfo.clicked.connect(self.btn_show_ct_info_clicked)
         self.ui.btnSteamFlatpakCtools.clicked.connect(self.btn_steam_flatpak_ctools_clicked)
+        self.ui.txtUnusedVersions.linkActivated.connect(self.txt_unused_versions_link_activated)
+        self.reclaim_plan_ready.connect(self.confirm_reclaim_plan)
 
         self.ui.btnRemoveSelected.setEnabled(False)
         self.ui.btnShowCtInfo.setEnabled(False)
@@ -179,8 +228,12 @@ class MainWindow(QObject):
         QApplication.instance().aboutToQuit.connect(self.giw.stop)
 
         self.install_thread = InstallWineThread(self)
+        self.install_thread.download_progress_percent.connect(self.set_download_progress_percent, Qt.QueuedConnection)
         self.install_thread.start()
         QApplication.instance().aboutToQuit.connect(self.install_thread.stop)
+        QApplication.instance().aboutToQuit.connect(self.ctool_removal_worker.cancel)  # Tools not deleted yet stay in the trash
+        self.ctool_removal_worker.purge([get_ctool_trash_dir(install_dir) for install_dir in available_install_directories()])
+        QApplication.instance().aboutToQuit.connect(cancel_protondb_requests)
 
     def set_default_statusbar(self):
         """ Show the default text in the status bar - non-blocking using update_statusbar_message Signal """
@@ -230,55 +283,58 @@ class MainWindow(QObject):
         if custom_install_dir is not None and len(custom_install_dir) <= 0:
             self.ui.comboInstallLocation.currentIndexChanged.emit(self.ui.comboInstallLocation.currentIndex())
 
+    def update_install_location_watcher(self):
+        """ Watch the launcher root directories (see get_install_location_watch_dirs), missing ones are polled """
+        if old_dirs := self.install_location_watcher.directories():
+            self.install_location_watcher.removePaths(old_dirs)
+        if watch_dirs := get_install_location_watch_dirs():
+            self.install_location_watcher.addPaths(watch_dirs)
+
+        self.missing_install_location_dirs = get_missing_install_location_dirs()
+        if self.missing_install_location_dirs:
+            self.install_location_poll_timer.start()
+        else:
+            self.install_location_poll_timer.stop()
+
+    def poll_missing_install_locations(self):
+        """ Search the install locations again if a missing launcher root directory was created """
+        if any(os.path.isdir(root_dir) for root_dir in self.missing_install_location_dirs):
+            self.install_location_watcher_timer.start()
+
+    def update_install_dir_watcher(self, install_loc: dict[str, str]):
+        """ Watch the install directory and the game files of the launcher (see get_game_index_watch_paths) """
+        watch_paths = [path for path in [os.path.expanduser(install_loc.get('install_dir', ''))] if os.path.isdir(path)]
+        watch_paths += get_game_index_watch_paths(install_loc)
+
+        old_paths = self.install_dir_watcher.directories() + self.install_dir_watcher.files()
+        if removed_paths := [path for path in old_paths if path not in watch_paths]:
+            self.install_dir_watcher.removePaths(removed_paths)
+        # Files replaced by a rename (e.g. when Steam saves config.vdf) are no longer watched, add them again
+        if added_paths := [path for path in watch_paths if path not in old_paths]:
+            self.install_dir_watcher.addPaths(added_paths)
+
+    def refresh_install_locations(self):
+        """ Search the install locations again and update the combobox if a launcher was (un)installed """
+        invalidate_available_install_directories()
+        self.update_install_location_watcher()
+
+        if available_install_directories() != self.combo_install_location_index_map:
+            self.update_combo_install_location()
+            self.update_ui()
+
     def update_ui(self):
-        """ update ui contents """
-        install_loc = get_install_location_from_directory_name(install_directory())
-        unused_ctools = 0
-
-        self.ui.listInstalledVersions.clear()
-        self.compat_tool_index_map = get_installed_ctools(install_directory())
-
-        # Launcher specific (Lutris): Show DXVK and vkd3d-proton
-        if install_loc.get('launcher') == 'lutris':
-            dxvk_dir = os.path.join(install_directory(), '../../runtime/dxvk')
-            vkd3d_dir = os.path.join(install_directory(), '../../runtime/vkd3d')
-            proton_dir = os.path.join(install_directory(), '../../runners/proton')
-
-            self.get_installed_versions('dxvk', dxvk_dir)
-            self.get_installed_versions('vkd3d', vkd3d_dir)
-            self.get_installed_versions('proton', proton_dir)
-        # Launcher specific (Steam): Number of games using the compatibility tool
-        elif install_loc.get('launcher') == 'steam' and 'vdf_dir' in install_loc:
-            steam_app_list = get_steam_app_list(install_loc.get('vdf_dir'), cached=False)  # update app list cache
-            global_ctool_name: str = get_steam_global_ctool_name(install_loc.get('vdf_dir'))
-            self.compat_tool_index_map += get_steam_acruntime_list(install_loc.get('vdf_dir'), cached=True)
-            ct_game_map = get_steam_ct_game_map(install_loc.get('vdf_dir'), self.compat_tool_index_map, cached=True)
-            for ct in self.compat_tool_index_map:
-                ct.no_games = len(ct_game_map.get(ct, []))
-                ct_name = ct.get_internal_name()
-                if ct_name == global_ctool_name:
-                    ct.set_global()  # Set (global) text
-                    self.compat_tool_index_map.insert(0, self.compat_tool_index_map.pop(self.compat_tool_index_map.index(ct)))  # Move global ctool to top of list
-                # Runtime length has to be calculated separately as they are not stored in the compat_tool_index_map, runtimes are dependencies of apps and not selected compatibility tools
-                if ct.ct_type == CTType.STEAM_RT:
-                    ct.no_games += len([game for game in steam_app_list if ctool_is_runtime_for_app(game, ct)])
-        # Launcher specific (Heroic): Set number of installed games using compat tool
-        elif is_heroic_launcher(install_loc.get('launcher')):
-            heroic_dir = os.path.join(os.path.expanduser(install_loc.get('install_dir')), '../..')
-            heroic_game_list = get_heroic_game_list(heroic_dir)
-            for ct in self.compat_tool_index_map:
-                ct.no_games = len([game for game in heroic_game_list if game.is_installed and ct.displayname in game.wine_info.get('name', '')])
-            
-            # Get DXVK/VKD3D installs for Heroic
-            dxvk_dir = os.path.join(install_directory(), '../dxvk')
-            vkd3d_dir = os.path.join(install_directory(), '../vkd3d')
-            self.get_installed_versions('dxvk', dxvk_dir)
-            self.get_installed_versions('vkd3d', vkd3d_dir)
+        """ update ui contents, the installed compatibility tools are collected in the background (see apply_installed_ctools_snapshot) """
+        install_dir = install_directory()
+        install_loc = get_install_location_from_directory_name(install_dir)
 
-        for ct in self.compat_tool_index_map:
-            self.ui.listInstalledVersions.addItem(ct.get_displayname(unused_tr=self.tr('unused'), global_tr=self.tr('global')))
-            if ct.no_games == 0:
-                unused_ctools += 1
+        self.update_install_dir_watcher(install_loc)
+        self.installed_ctools_worker.request(install_dir)
+
+        # Show that the list is loading if it still shows the tools of another install location
+        if install_dir != self.installed_ctools_install_dir:
+            self.ui.listInstalledVersions.setEnabled(False)
+            self.ui.txtInstalledVersions.setText('...')
+            self.ui.txtUnusedVersions.setText('')
 
         self.ui.txtActiveDownloads.setText(str(len(self.pending_downloads)))
         if len(self.pending_downloads) == 0:
@@ -286,7 +342,7 @@ class MainWindow(QObject):
             self.progressBarDownload.setVisible(False)
             self.ui.comboInstallLocation.setEnabled(True)
 
-        self.show_launcher_specific_information()
+        self.show_launcher_specific_information(install_loc)
 
         if install_loc.get('launcher') == 'steam' and 'vdf_dir' in install_loc:
             self.ui.btnShowGameList.setVisible(True)
@@ -297,18 +353,35 @@ class MainWindow(QObject):
         else:
             self.ui.btnShowGameList.setVisible(False)
 
-        self.ui.txtUnusedVersions.setText(self.tr('Unused: {unused_ctools}').format(unused_ctools=unused_ctools) if unused_ctools > 0 else '')
-        self.ui.txtInstalledVersions.setText(f'{len(self.compat_tool_index_map)}')
-
         combo_install_location_val: str = self.ui.comboInstallLocation.currentText()
         if len(combo_install_location_val) > 0:
             self.ui.comboInstallLocation.setToolTip(combo_install_location_val)
 
-    def get_installed_versions(self, ctool_name, ctool_dir):
-        for ct in get_installed_ctools(ctool_dir):
-            if ctool_name not in ct.get_displayname().lower():
-                ct.displayname = f'{ctool_name} {ct.displayname}'
-            self.compat_tool_index_map.append(ct)
+    @Slot(InstalledCtoolsSnapshot)
+    def apply_installed_ctools_snapshot(self, snapshot: InstalledCtoolsSnapshot):
+        """ Show the installed compatibility tools collected by installed_ctools_worker, ignoring results of older requests """
+        if not self.installed_ctools_worker.is_current(snapshot):
+            return
+
+        self.installed_ctools_install_dir = snapshot.install_dir
+        self.compat_tool_index_map = list(snapshot.ctools)
+        unused_ctools = len([ct for ct in self.compat_tool_index_map if ct.no_games == 0])
+
+        update_list_widget_texts(self.ui.listInstalledVersions, [ct.get_displayname(unused_tr=self.tr('unused'), global_tr=self.tr('global')) for ct in self.compat_tool_index_map])
+        self.ui.listInstalledVersions.setEnabled(True)
+
+        self.ui.txtUnusedVersions.setText(f'<a href="#">{self.tr("Unused: {unused_ctools}").format(unused_ctools=unused_ctools)}</a>' if unused_ctools > 0 else '')
+        self.ui.txtUnusedVersions.setToolTip(self.tr('Remove all unused versions') if unused_ctools > 0 else '')
+        self.ui.txtInstalledVersions.setText(f'{len(self.compat_tool_index_map)}')
+
+    @Slot(str, object)
+    def game_index_changed(self, key: str, origin: object):
+        """ Count the games using the tools again if a dialog loaded the games of the current install location again """
+        if origin is self.installed_ctools_worker:
+            return
+
+        if key == GameIndex.get_key(get_install_location_from_directory_name(install_directory())):
+            self.install_dir_watcher_timer.start()
 
     def install_compat_tool(self, compat_tool):
         """ install compatibility tool (called by install dialog signal) """
@@ -328,6 +401,13 @@ class MainWindow(QObject):
         else:
             self.set_default_statusbar()
 
+    @Slot(float)
+    def ctmod_download_progress_percent(self, value):
+        """ Progress of a ctmod, a tool installed to several locations is only installed once InstallWineThread copied it to all of them """
+        if value == 100 and len(self.pending_downloads) > 0 and len(self.pending_downloads[0].get('install_dirs', [])) > 1:
+            value = 99.5  # Still copying to the other locations
+        self.set_download_progress_percent(value)
+
     def set_download_progress_percent(self, value):
         """ set download progress bar value and update status bar text """
         self.progressBarDownload.setValue(value)
@@ -380,12 +460,63 @@ class MainWindow(QObject):
             if ret == QMessageBox.StandardButton.No:
                 return
 
+        self.remove_ctools(ctools_to_remove)
+
+    def remove_ctools(self, ctools_to_remove: list):
+        """ Move the tools out of the install directory right away and delete them in the background """
+        trashed_ctools: list[TrashedCtool] = []
         for ct in ctools_to_remove:
-            remove_ctool(ct.get_install_folder(), ct.get_install_dir())
+            if 'steamtinkerlaunch' in ct.get_install_folder().lower():
+                remove_ctool(ct.get_install_folder(), ct.get_install_dir())  # Also removes the SteamTinkerLaunch installation and config
+                continue
 
-        self.ui.statusBar().showMessage(self.tr('Removed selected versions.'))
+            try:
+                if trash_entry := move_ctool_to_trash(ct.get_install_folder(), ct.get_install_dir()):
+                    trashed_ctools.append(TrashedCtool(trash_entry, os.path.join(ct.get_install_dir(), ct.get_install_folder())))
+            except OSError as e:
+                print(f'Warning: Could not move {ct.get_install_folder()} to the trash, removing it directly. Reason: {e}')
+                trashed_ctools.append(TrashedCtool(os.path.join(ct.get_install_dir(), ct.get_install_folder())))
+
+        if trashed_ctools:
+            self.ui.statusBar().showMessage(self.tr('Removing selected versions...'))
+            self.removing_ctools = True
+            self.ctool_removal_worker.remove(trashed_ctools)
+        else:
+            self.ui.statusBar().showMessage(self.tr('Removed selected versions.'))
         self.update_ui()
 
+    def txt_unused_versions_link_activated(self, link: str = ''):
+        """ Calculate the space used by the unused tools in the background (see confirm_reclaim_plan) """
+        def _create_reclaim_plan_thread(install_dir: str, ctools: list, reclaim_plan_ready: Signal):
+            reclaim_plan_ready.emit(create_reclaim_plan(install_dir, ctools))
+
+        self.ui.statusBar().showMessage(self.tr('Calculating disk usage...'))
+        t = threading.Thread(target=_create_reclaim_plan_thread, args=[self.installed_ctools_install_dir, list(self.compat_tool_index_map), self.reclaim_plan_ready], daemon=True)
+        t.start()
+
+    @Slot(ReclaimPlan)
+    def confirm_reclaim_plan(self, plan: ReclaimPlan):
+        """ Ask whether to remove all tools of the plan at once, ignoring plans of another install location """
+        self.set_default_statusbar()
+        if plan.install_dir != self.installed_ctools_install_dir or len(plan.ctools) == 0:
+            return
+
+        ctool_names = '\n'.join(ct.get_displayname() for ct in plan.ctools)
+        ret = QMessageBox.question(self.ui, self.tr('Remove unused versions?'), self.tr('Remove all unused versions? This frees {size}.\n\n{ctools}').format(size=format_size(plan.size), ctools=ctool_names))
+        if ret == QMessageBox.StandardButton.Yes:
+            self.remove_ctools(plan.ctools)
+
+    @Slot(int)
+    def ctool_removal_progress(self, value: int):
+        if self.removing_ctools and len(self.pending_downloads) == 0:
+            self.ui.statusBar().showMessage(self.tr('Removing selected versions... {percent}%').format(percent=value))
+
+    @Slot(int, bool)
+    def ctool_removal_finished(self, deleted: int, cancelled: bool):
+        removing_ctools, self.removing_ctools = self.removing_ctools, False
+        if removing_ctools and len(self.pending_downloads) == 0:
+            self.ui.statusBar().showMessage(self.tr('Removed selected versions.'))
+
     def btn_show_game_list_clicked(self):
         gl_dialog = PupguiGameListDialog(install_directory(), self.ui)
         gl_dialog.game_property_changed.connect(self.update_ui)
@@ -417,9 +548,9 @@ class MainWindow(QObject):
     def btn_manage_install_locations_clicked(self):
         customid_dialog = PupguiCustomInstallDirectoryDialog(install_directory(), parent=self.ui)
         customid_dialog.custom_id_set.connect(self.update_combo_install_location)
+        customid_dialog.custom_id_set.connect(lambda _: self.update_install_location_watcher())
 
-    def show_launcher_specific_information(self):
-        install_loc = get_install_location_from_directory_name(install_directory())
+    def show_launcher_specific_information(self, install_loc: dict[str, str]):
         self.ui.btnSteamFlatpakCtools.setVisible(
             'steam' in install_loc.get('launcher', '') and 'Flatpak' in install_loc.get('display_name', '')
             )
@@ -552,7 +683,13 @@ class PupguiApp(QApplication):
 def main():
     """ ProtonUp-Qt main function. Called from __main__.py """
     print(f'{APP_NAME} {APP_VERSION} by DavidoTek. Build Info: {BUILD_INFO}.')
-    print_system_information()
+
+    # Headless mode: Serve compatibility tools to other devices in the local network
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve-cache':
+        serve_cache(sys.argv[2:], github_token=config_github_access_token())
+        return
+
+    preload_system_profile(print_system_information)  # Also used by detect_platform and the ctmods
     if not single_instance():
         print("Second instance of ProtonUp-Qt found!")
         return
@@ -1,19 +1,17 @@
 import pkgutil
-import os
 
 from pupgui2.constants import STEAM_APP_PAGE_URL
 from pupgui2.datastructures import BasicCompatTool, CTType, SteamApp, LutrisGame, HeroicGame
-from pupgui2.lutrisutil import get_lutris_game_list, is_lutris_game_using_wine
+from pupgui2.gameindex import GameIndex, get_game_index
+from pupgui2.gamelistmodel import SearchIndexProxyModel, connect_debounced_search
 from pupgui2.pupgui2ctbatchupdatedialog import PupguiCtBatchUpdateDialog
-from pupgui2.steamutil import get_steam_game_list
 from pupgui2.util import open_webbrowser_thread, get_random_game_name
-from pupgui2.heroicutil import get_heroic_game_list, is_heroic_launcher
+from pupgui2.heroicutil import is_heroic_launcher
 
-from PySide6.QtCore import QObject, Signal, QDataStream, QByteArray
-from PySide6.QtWidgets import QTableWidgetItem
+from PySide6.QtCore import QObject, Signal, Slot, QDataStream, QByteArray, QModelIndex
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QShortcut, QKeySequence
+from PySide6.QtGui import QShortcut, QKeySequence, QStandardItemModel, QStandardItem
 
 
 class PupguiCtInfoDialog(QObject):
@@ -28,10 +26,16 @@ class PupguiCtInfoDialog(QObject):
         self.install_loc = install_loc
         self.is_batch_update_available = False
 
+        self.games_model = QStandardItemModel(0, 2, self)
+        self.proxy_model = SearchIndexProxyModel(self, search_keys=self.get_game_search_keys)
+        self.proxy_model.setSourceModel(self.games_model)
+
         self.load_ui()
         self.setup_ui()
         self.ui.show()
 
+        get_game_index().changed.connect(self.game_index_changed, Qt.QueuedConnection)
+
     def load_ui(self):
         data = pkgutil.get_data(__name__, 'resources/ui/pupgui2_ctinfodialog.ui')
         ui_file = QDataStream(QByteArray(data))
@@ -44,14 +48,17 @@ class PupguiCtInfoDialog(QObject):
         self.ui.txtInstallDirectory.setText(self.ctool.get_install_dir())
         self.ui.btnBatchUpdate.setVisible(False)
         self.ui.searchBox.setVisible(False)
+        self.ui.listGames.setModel(self.proxy_model)
 
         self.update_game_list()
 
         self.ui.btnSearch.clicked.connect(self.btn_search_clicked)
         self.ui.btnRefreshGames.clicked.connect(self.btn_refresh_games_clicked)
         self.ui.btnClose.clicked.connect(lambda: self.ui.close())
-        self.ui.listGames.cellDoubleClicked.connect(self.list_games_cell_double_clicked)
-        self.ui.searchBox.textChanged.connect(self.search_ctinfo_games)
+        self.ui.btnBatchUpdate.clicked.connect(self.btn_batch_update_clicked)
+        self.ui.finished.connect(self.dialog_finished)
+        self.ui.listGames.doubleClicked.connect(self.list_games_cell_double_clicked)
+        connect_debounced_search(self.ui.searchBox, self.search_ctinfo_games, self)
 
         QShortcut(QKeySequence.Find, self.ui).activated.connect(self.btn_search_clicked)
 
@@ -61,60 +68,68 @@ class PupguiCtInfoDialog(QObject):
             if 'Proton' in self.ctool.displayname and self.ctool.ct_type == CTType.CUSTOM:  # 'batch update' option for Proton-GE
                 self.is_batch_update_available = True
                 self.ui.btnBatchUpdate.setVisible(not self.ui.searchBox.isVisible())
-                self.ui.btnBatchUpdate.clicked.connect(self.btn_batch_update_clicked)
         elif self.install_loc.get('launcher') == 'lutris':
-            self.update_game_list_lutris()
+            self.update_game_list_lutris(cached=cached)
         elif is_heroic_launcher(self.install_loc.get('launcher')):
-            self.update_game_list_heroic()
+            self.update_game_list_heroic(cached=cached)
         else:
             self.ui.txtNumGamesUsingTool.setText('-')
-            self.ui.listGames.setHorizontalHeaderLabels(['', ''])
+            self.games_model.setHorizontalHeaderLabels(['', ''])
             self.ui.listGames.setEnabled(False)
 
         self.update_game_list_ui()
 
+    @Slot(str, object)
+    def game_index_changed(self, key: str, origin: object):
+        """ Show the games loaded again by another view """
+        if origin is not self and key == GameIndex.get_key(self.install_loc):
+            self.update_game_list(cached=True)
+
+    def dialog_finished(self):
+        """ Stop listening to the game index, it outlives the dialog """
+        get_game_index().changed.disconnect(self.game_index_changed)
+
     def update_game_list_steam(self, cached=True):
         if self.install_loc.get('launcher') == 'steam' and 'vdf_dir' in self.install_loc:
-            self.games = get_steam_game_list(self.install_loc.get('vdf_dir'), self.ctool, cached=cached)
+            self.games = get_game_index().get_games_for_compat_tool(self.install_loc, self.ctool, refresh=not cached, origin=self)
             self.ui.txtNumGamesUsingTool.setText(str(len(self.games)))
 
-        self.ui.listGames.clear()
-        self.ui.listGames.setRowCount(len(self.games))
-        self.ui.listGames.setHorizontalHeaderLabels([self.tr('AppID'), self.tr('Name')])
-        for i, game in enumerate(self.games):
-            dataitem_appid = QTableWidgetItem()
-            dataitem_appid.setData(Qt.DisplayRole, int(game.get_app_id_str()))
+        self.games_model.setRowCount(0)
+        self.games_model.setHorizontalHeaderLabels([self.tr('AppID'), self.tr('Name')])
+        for game in self.games:
+            dataitem_appid = QStandardItem()
+            dataitem_appid.setData(int(game.get_app_id_str()), Qt.DisplayRole)
 
-            self.ui.listGames.setItem(i, 0, dataitem_appid)
-            self.ui.listGames.setItem(i, 1, QTableWidgetItem(game.game_name))
+            self.append_game_row(dataitem_appid, QStandardItem(game.game_name))
 
         self.batch_update_complete.emit(True)
 
-    def update_game_list_lutris(self):
-        self.games = [game for game in get_lutris_game_list(self.install_loc) if is_lutris_game_using_wine(game, self.ctool.displayname)]
+    def update_game_list_lutris(self, cached=True):
+        self.games = get_game_index().get_games_for_compat_tool(self.install_loc, self.ctool, refresh=not cached, origin=self)
 
         self.setup_game_list(len(self.games), [self.tr('Slug'), self.tr('Name')])
 
-        for i, game in enumerate(self.games):
-            self.ui.listGames.setItem(i, 0, QTableWidgetItem(game.slug))
-            self.ui.listGames.setItem(i, 1, QTableWidgetItem(game.name))
+        for game in self.games:
+            self.append_game_row(QStandardItem(game.slug), QStandardItem(game.name))
 
-    def update_game_list_heroic(self):
-        heroic_dir = os.path.join(os.path.expanduser(self.install_loc.get('install_dir')), '../..')
-        self.games = [game for game in get_heroic_game_list(heroic_dir) if game.is_installed and self.ctool.displayname in game.wine_info.get('name', '')]
+    def update_game_list_heroic(self, cached=True):
+        self.games = get_game_index().get_games_for_compat_tool(self.install_loc, self.ctool, refresh=not cached, origin=self)
 
         self.setup_game_list(len(self.games), [self.tr('Runner'), self.tr('Game')])
 
-        for i, game in enumerate(self.games):
-            self.ui.listGames.setItem(i, 0, QTableWidgetItem(game.runner))
-            self.ui.listGames.setItem(i, 1, QTableWidgetItem(game.title))
+        for game in self.games:
+            self.append_game_row(QStandardItem(game.runner), QStandardItem(game.title))
 
     def setup_game_list(self, row_count: int, header_labels: list[str]):
-        self.ui.listGames.clear()
-        self.ui.listGames.setRowCount(row_count)
-        self.ui.listGames.setHorizontalHeaderLabels(header_labels)
+        self.games_model.setRowCount(0)
+        self.games_model.setHorizontalHeaderLabels(header_labels)
         self.ui.txtNumGamesUsingTool.setText(str(row_count))        
 
+    def append_game_row(self, *items: QStandardItem):
+        for item in items:
+            item.setEditable(False)
+        self.games_model.appendRow(list(items))
+
     def update_game_list_ui(self):
         # switch between showing the QTableWidget (listGames) or the QLabel (lblGamesList)
         self.ui.stackTableOrText.setCurrentIndex(0 if len(self.games) > 0 and not self.ctool.is_global else 1)
@@ -127,9 +142,9 @@ class PupguiCtInfoDialog(QObject):
         if len(self.games) < 0 or self.ctool.is_global:
             self.ui.btnClose.setFocus()
 
-    def list_games_cell_double_clicked(self, row):
+    def list_games_cell_double_clicked(self, index: QModelIndex):
         if self.install_loc.get('launcher') == 'steam':
-            steam_game_id = str(self.ui.listGames.item(row, 0).text())
+            steam_game_id = str(index.siblingAtColumn(0).data(Qt.DisplayRole))
             open_webbrowser_thread(STEAM_APP_PAGE_URL + steam_game_id)
 
     def btn_batch_update_clicked(self):
@@ -156,6 +171,13 @@ class PupguiCtInfoDialog(QObject):
         self.search_ctinfo_games(self.ui.searchBox.text() if self.ui.searchBox.isVisible() else '')
 
     def search_ctinfo_games(self, text):
-        for row in range(self.ui.listGames.rowCount()):
-            should_hide: bool = not text.lower() in self.ui.listGames.item(row, 1).text().lower()
-            self.ui.listGames.setRowHidden(row, should_hide)
+        self.proxy_model.set_search_text(text)
+
+    def get_game_search_keys(self, row: int) -> list[str]:
+        """ Return the strings a game can be found by in the search, rows of games_model are in the same order as self.games """
+        game = self.games[row]
+        if isinstance(game, SteamApp):
+            return [game.game_name, str(game.app_id)]
+        elif isinstance(game, LutrisGame):
+            return [game.name, game.slug]
+        return [game.title, game.runner]
@@ -4,19 +4,23 @@ import pkgutil
 from typing import Callable
 from datetime import datetime
 
-from PySide6.QtCore import QObject, Signal, Slot, QDataStream, QByteArray, Qt
-from PySide6.QtGui import QPixmap, QBrush, QColor, QKeySequence, QShortcut
-from PySide6.QtWidgets import QLabel, QComboBox, QPushButton, QTableWidgetItem
+from PySide6.QtCore import QObject, Signal, Slot, QDataStream, QByteArray, Qt, QModelIndex
+from PySide6.QtGui import QKeySequence, QShortcut, QStandardItemModel, QStandardItem
 from PySide6.QtUiTools import QUiLoader
 
-from pupgui2.constants import PROTONDB_COLORS, STEAM_APP_PAGE_URL, AWACY_WEB_URL, PROTONDB_APP_PAGE_URL, LUTRIS_WEB_URL, IS_FLATPAK
+from pupgui2.constants import LUTRIS_WEB_URL, IS_FLATPAK, PROTONDB_REQUEST_FAILED
 from pupgui2.datastructures import AWACYStatus, SteamApp, SteamDeckCompatEnum, LutrisGame, HeroicGame
-from pupgui2.lutrisutil import get_lutris_game_list, is_lutris_game_using_runner
+from pupgui2.gamelistmodel import SORT_ROLE, STEAM_COLUMN_COMPAT_TOOL, STEAM_COLUMN_AWACY, STEAM_COLUMN_PROTONDB
+from pupgui2.gamelistmodel import SteamGameListModel, SearchIndexProxyModel, CompatToolComboBoxDelegate, CenteredIconDelegate
+from pupgui2.gamelistmodel import connect_debounced_search
+from pupgui2.gameindex import GameIndex, get_game_index
+from pupgui2.lutrisutil import is_lutris_game_using_runner
 from pupgui2.pupgui2shortcutdialog import PupguiShortcutDialog
-from pupgui2.steamutil import steam_update_ctools, get_steam_game_list
+from pupgui2.steamutil import steam_update_ctools
 from pupgui2.steamutil import is_steam_running, get_steam_ctool_list
-from pupgui2.steamutil import get_protondb_status
-from pupgui2.heroicutil import get_heroic_game_list, is_heroic_launcher
+from pupgui2.steamprocessmonitor import get_steam_process_monitor
+from pupgui2.steamutil import get_protondb_status, get_protondb_status_list, load_cached_protondb_status
+from pupgui2.heroicutil import is_heroic_launcher
 from pupgui2.util import list_installed_ctools, sort_compatibility_tool_names, open_webbrowser_thread
 from pupgui2.util import get_install_location_from_directory_name, get_random_game_name
 
@@ -32,21 +36,29 @@ class PupguiGameListDialog(QObject):
         self.parent = parent
         self.queued_changes = {}
         self.games: list[SteamApp | LutrisGame | HeroicGame] = []
+        self.game_model: SteamGameListModel | QStandardItemModel | None = None
+        self.proxy_model = SearchIndexProxyModel(self, search_keys=self.get_game_search_keys)
 
         self.install_loc = get_install_location_from_directory_name(install_dir)
         self.launcher = self.install_loc.get('launcher', '')
         self.should_show_steam_warning = (is_steam_running() or IS_FLATPAK) and self.launcher == 'steam'
+        if self.launcher == 'steam':
+            get_steam_process_monitor().running_changed.connect(self.steam_running_changed)
 
         self.load_ui()
         self.setup_ui()
         self.ui.show()
 
+        get_game_index().changed.connect(self.game_index_changed, Qt.QueuedConnection)
+
     def load_ui(self):
         data = pkgutil.get_data(__name__, 'resources/ui/pupgui2_gamelistdialog.ui')
         ui_file = QDataStream(QByteArray(data))
         self.ui = QUiLoader().load(ui_file.device())
 
     def setup_ui(self):
+        self.proxy_model.setSortRole(SORT_ROLE)
+
         if self.launcher == 'steam':
             self.setup_steam_list_ui()
         elif self.launcher == 'lutris':
@@ -55,6 +67,7 @@ class PupguiGameListDialog(QObject):
             self.setup_heroic_list_ui()
 
         self.ui.btnShortcutEditor.setVisible(self.launcher == 'steam')
+        self.ui.btnFetchProtonDB.setVisible(self.launcher == 'steam' and len(self.games) > 0)
 
         self.ui.btnSearch.setVisible(False)
         self.ui.searchBox.setVisible(False)  # Hide searchbox by default
@@ -63,25 +76,44 @@ class PupguiGameListDialog(QObject):
         self.ui.setWindowTitle(self.tr('Game List for {LAUNCHER}').format(LAUNCHER=self.launcher.capitalize() if not is_heroic_launcher(self.launcher) else 'Heroic'))
 
         self.ui.lblSteamRunningWarning.setVisible(self.should_show_steam_warning)  # Only show warning if Steam is running, and make it grey if we're running in Flatpak
-        self.ui.tableGames.horizontalHeaderItem(0).setToolTip(self.tr('Installed games: {NO_INSTALLED}').format(NO_INSTALLED=str(len(self.games))))
+        if self.game_model is not None:
+            self.game_model.setHeaderData(0, Qt.Horizontal, self.tr('Installed games: {NO_INSTALLED}').format(NO_INSTALLED=str(len(self.games))), Qt.ToolTipRole)
 
-        self.ui.tableGames.itemDoubleClicked.connect(self.item_doubleclick_action)
+        self.ui.tableGames.doubleClicked.connect(self.item_doubleclick_action)
         self.ui.btnApply.clicked.connect(self.btn_apply_clicked)
         self.ui.btnSearch.clicked.connect(self.btn_search_clicked)
         self.ui.btnRefreshGames.clicked.connect(self.btn_refresh_games_clicked)
         self.ui.btnShortcutEditor.clicked.connect(self.btn_shortcut_editor_clicked)
-        self.ui.searchBox.textChanged.connect(self.search_gamelist_games)
+        self.ui.btnFetchProtonDB.clicked.connect(self.btn_fetch_protondb_clicked)
+        self.ui.finished.connect(self.dialog_finished)
+        connect_debounced_search(self.ui.searchBox, self.search_gamelist_games, self)
 
         # Hide Search button and disable shortcut if no games
         if len(self.games) > 0:
             self.ui.btnSearch.setVisible(True)
             QShortcut(QKeySequence.Find, self.ui).activated.connect(self.btn_search_clicked)
 
+    def setup_game_model(self, game_model: SteamGameListModel | QStandardItemModel, header_labels: list[str]):
+        """ Show game_model in the games table, sorted and filtered through self.proxy_model """
+        self.game_model = game_model
+        for i, label in enumerate(header_labels):
+            self.game_model.setHeaderData(i, Qt.Horizontal, label)
+
+        self.proxy_model.setSourceModel(self.game_model)
+        self.ui.tableGames.setModel(self.proxy_model)
+
     def setup_steam_list_ui(self):
-        self.ui.tableGames.setHorizontalHeaderLabels([self.tr('Game'), self.tr('Compatibility Tool'), self.tr('Deck Compatibility'), self.tr('Anticheat'), 'ProtonDB'])
-        self.ui.tableGames.horizontalHeaderItem(3).setToolTip('https://areweanticheatyet.com')
+        game_model = SteamGameListModel(self.get_steamdeck_compatibility, self.get_steamapp_awacystatus, self)
+        game_model.compat_tool_changed.connect(self.queue_ctool_change_steam)
+        self.setup_game_model(game_model, [self.tr('Game'), self.tr('Compatibility Tool'), self.tr('Deck Compatibility'), self.tr('Anticheat'), 'ProtonDB'])
+        self.game_model.setHeaderData(STEAM_COLUMN_AWACY, Qt.Horizontal, 'https://areweanticheatyet.com', Qt.ToolTipRole)
         self.ui.lblSteamRunningWarning.setStyleSheet('QLabel { color: grey; }' if IS_FLATPAK else self.ui.lblSteamRunningWarning.styleSheet())
 
+        # Editors and icons are only created by the delegates for cells that are actually shown or edited
+        self.ui.tableGames.setItemDelegateForColumn(STEAM_COLUMN_COMPAT_TOOL, CompatToolComboBoxDelegate(self.ui.tableGames))
+        self.ui.tableGames.setItemDelegateForColumn(STEAM_COLUMN_AWACY, CenteredIconDelegate(self.ui.tableGames))
+        self.ui.tableGames.clicked.connect(self.steam_item_clicked_action)
+
         self.update_game_list_steam()
         self.protondb_status_fetched.connect(self.update_protondb_status)
 
@@ -90,110 +122,53 @@ class PupguiGameListDialog(QObject):
         self.ui.tableGames.setColumnWidth(4, 70)
     
     def setup_lutris_list_ui(self):
-        self.ui.tableGames.setHorizontalHeaderLabels([self.tr('Game'), self.tr('Runner'), self.tr('Install Location'), self.tr('Installed Date'), ''])
+        self.setup_game_model(QStandardItemModel(0, 4, self), [self.tr('Game'), self.tr('Runner'), self.tr('Install Location'), self.tr('Installed Date')])
         self.update_game_list_lutris()
 
         self.ui.tableGames.setColumnWidth(0, 300)
         self.ui.tableGames.setColumnWidth(1, 70)
         self.ui.tableGames.setColumnWidth(2, 280)
         self.ui.tableGames.setColumnWidth(3, 30)
-        self.ui.tableGames.setColumnHidden(4, True)
 
     def setup_heroic_list_ui(self):
-        self.ui.tableGames.setHorizontalHeaderLabels([self.tr('Game'), self.tr('Compatibility Tool'), self.tr('Install Location'), self.tr('Runner'), ''])
+        self.setup_game_model(QStandardItemModel(0, 4, self), [self.tr('Game'), self.tr('Compatibility Tool'), self.tr('Install Location'), self.tr('Runner')])
         self.update_game_list_heroic()
 
         self.ui.tableGames.setColumnWidth(0, 270)
         self.ui.tableGames.setColumnWidth(1, 170)
         self.ui.tableGames.setColumnWidth(2, 250)
         self.ui.tableGames.setColumnWidth(3, 40)
-        self.ui.tableGames.setColumnHidden(4, True)
 
     def update_game_list_steam(self, cached=True):
         """ update the game list for the Steam launcher """
-        self.games: list[SteamApp] = get_steam_game_list(steam_config_folder=self.install_loc.get('vdf_dir'), cached=cached)
+        self.games: list[SteamApp] = get_game_index().get_games(self.install_loc, refresh=not cached, origin=self)
         ctools = [c if c != 'SteamTinkerLaunch' else 'Proton-stl' for c in sort_compatibility_tool_names(list_installed_ctools(self.install_dir, without_version=True), reverse=True)]
         ctools.extend(t.ctool_name for t in get_steam_ctool_list(steam_config_folder=self.install_loc.get('vdf_dir'), cached=True))
 
-        self.ui.tableGames.setRowCount(len(self.games))
-
-        game_id_table_lables = []
-        for i, game in enumerate(self.games):
-            game_item = QTableWidgetItem(game.game_name)
-            game_item.setData(Qt.UserRole, f'{STEAM_APP_PAGE_URL}{game.app_id}')  # e.g. https://store.steampowered.com/app/620
-            game_item.setToolTip(f'{game.game_name} ({game.app_id})')
-
-            self.ui.tableGames.setItem(i, 0, game_item)
-
-            # Compat Tool combobox
-            combo = QComboBox()
-            combo.addItems(['-'] + ctools)
-            if game.compat_tool not in ctools:
-                combo.addItem(game.compat_tool)
-
-            combo.setCurrentText('-' if game.compat_tool is None else game.compat_tool)
-            combo.currentTextChanged.connect(lambda text,game=game: self.queue_ctool_change_steam(text, game))
-
-            compat_item = QTableWidgetItem()
-            compat_item.setData(Qt.DisplayRole, combo.currentText())
+        # Show cached ProtonDB ratings right away, the others are fetched when clicked
+        for game in self.games:
+            load_cached_protondb_status(game)
 
-            self.ui.tableGames.setItem(i, 1, compat_item)
-            self.ui.tableGames.setCellWidget(i, 1, combo)
+        self.game_model.set_games(self.games, ctools)
 
-            # ProtonDB status
-            btn_fetch_protondb = QPushButton(self.tr('click'))
-            btn_fetch_protondb.clicked.connect(lambda checked=False, game=game: get_protondb_status(game, self.protondb_status_fetched))
-
-            self.ui.tableGames.setItem(i, 4, QTableWidgetItem())
-            self.ui.tableGames.setCellWidget(i, 4, btn_fetch_protondb)
-
-            # Steam Deck compatibility 
-            lbltxt = self.get_steamdeck_compatibility(game)
-
-            lbltxt_item = QTableWidgetItem(lbltxt)
-            lbltxt_item.setToolTip(lbltxt_item.text())
-
-            self.ui.tableGames.setItem(i, 2, lbltxt_item)
-
-            # AWACY status
-            lblicon = QLabel()
-            p = QPixmap()
-            awacy_tooltip, awacy_icon = self.get_steamapp_awacystatus(game)
-            p.loadFromData(pkgutil.get_data(__name__, os.path.join('resources/img', awacy_icon)))
-            lblicon.setToolTip(awacy_tooltip)
-            lblicon.setPixmap(p)
-            lblicon.setAlignment(Qt.AlignCenter)
-
-            lblicon_item = QTableWidgetItem()
-            lblicon_item.setData(Qt.DisplayRole, game.awacy_status.value)
-            lblicon_item.setTextAlignment(Qt.AlignCenter)
-
-            search_str = ("" if game.awacy_status == AWACYStatus.UNKNOWN else game.game_name)
-            lblicon_item.setData(Qt.UserRole, AWACY_WEB_URL.format(GAMENAME=search_str))
-
-            self.ui.tableGames.setItem(i, 3, lblicon_item)
-            self.ui.tableGames.setCellWidget(i, 3, lblicon)
-
-            game_id_table_lables.append(game.app_id)
-
-    def update_game_list_lutris(self):
+    def update_game_list_lutris(self, cached=True):
         """ update the game list for the Lutris launcher """
         # Filter blank runners and Steam games, because we can't change any compat tool options for Steam games via Lutris
         # Steam games can be seen from the Steam games list, so no need to duplicate it here
-        self.games: list[LutrisGame] = [game for game in get_lutris_game_list(self.install_loc) if self.is_valid_lutris_gameslist_game(game)]
+        self.games: list[LutrisGame] = [game for game in get_game_index().get_games(self.install_loc, refresh=not cached, origin=self) if self.is_valid_lutris_gameslist_game(game)]
 
-        self.ui.tableGames.setRowCount(len(self.games))
+        self.game_model.setRowCount(0)
 
         # Not sure if we can allow compat tool updating from here, as Lutris allows configuring more than just Wine version
         # It lets you set Wine/DXVK/vkd3d/etc independently, so for now the dialog just displays game information
-        for i, game in enumerate(self.games):
-            name_item = QTableWidgetItem(game.name)
+        for game in self.games:
+            name_item = QStandardItem(game.name)
             name_item.setToolTip(f'{game.name} ({game.slug})')
             if game.installer_slug:
                 # Only games with an installer_slug will have a Lutris web URL - Could be an edge case that runners get removed/updated from lutris.net?
-                name_item.setData(Qt.UserRole, f'{LUTRIS_WEB_URL}{game.slug}')
+                name_item.setData(f'{LUTRIS_WEB_URL}{game.slug}', Qt.UserRole)
 
-            runner_item = QTableWidgetItem(game.runner.capitalize())
+            runner_item = QStandardItem(game.runner.capitalize())
             runner_item.setTextAlignment(Qt.AlignCenter)
             # Display wine runner information in tooltip
             if game.runner == 'wine':
@@ -213,7 +188,7 @@ class PupguiGameListDialog(QObject):
 
             # Some games may be in Lutris but not have a valid install path, though the yml should *usually* have some path
             install_dir_text = game.install_dir
-            install_dir_item = QTableWidgetItem(install_dir_text)
+            install_dir_item = QStandardItem(install_dir_text)
             self.set_item_data_directory(install_dir_item, install_dir_text)
 
             # Populate Install Date column if we have game.install_date
@@ -229,33 +204,29 @@ class PupguiGameListDialog(QObject):
                 install_date_tooltip = self.tr('Install Date is Unknown')
                 install_date_data = 0
 
-            install_date_item = QTableWidgetItem(install_date_short)
-            install_date_item.setData(Qt.UserRole, install_date_data)
+            install_date_item = QStandardItem(install_date_short)
+            install_date_item.setData(install_date_data, Qt.UserRole)
             install_date_item.setToolTip(install_date_tooltip)
             install_date_item.setTextAlignment(Qt.AlignCenter)
 
-            self.ui.tableGames.setItem(i, 0, name_item)
-            self.ui.tableGames.setItem(i, 1, runner_item)
-            self.ui.tableGames.setItem(i, 2, install_dir_item)
-            self.ui.tableGames.setItem(i, 3, install_date_item)
+            self.append_game_row([name_item, runner_item, install_dir_item, install_date_item])
 
-    def update_game_list_heroic(self):
-        heroic_dir = os.path.join(os.path.expanduser(self.install_loc.get('install_dir')), '../..')
-        self.games: list[HeroicGame] = list(filter(lambda heroic_game: (heroic_game.is_installed and len(heroic_game.runner) > 0 and not heroic_game.is_dlc), get_heroic_game_list(heroic_dir)))
+    def update_game_list_heroic(self, cached=True):
+        self.games: list[HeroicGame] = list(filter(lambda heroic_game: (heroic_game.is_installed and len(heroic_game.runner) > 0 and not heroic_game.is_dlc), get_game_index().get_games(self.install_loc, refresh=not cached, origin=self)))
 
-        self.ui.tableGames.setRowCount(len(self.games))
+        self.game_model.setRowCount(0)
 
-        for i, game in enumerate(self.games):
-            title_item = QTableWidgetItem(game.title)
+        for game in self.games:
+            title_item = QStandardItem(game.title)
             if game.store_url:
-                title_item.setData(Qt.UserRole, game.store_url)
+                title_item.setData(game.store_url, Qt.UserRole)
 
             title_tooltip = game.title
             if game.executable:
                 title_tooltip += f' ({game.executable})'
             title_item.setToolTip(title_tooltip)
 
-            compat_item = QTableWidgetItem()
+            compat_item = QStandardItem()
             # Wine games
             if game.platform.lower() == 'windows':
                 compat_item_text = game.wine_info.get('name', '').split('-', 1)[1].strip()
@@ -266,7 +237,7 @@ class PupguiGameListDialog(QObject):
                     compat_tool_tooltip += self.tr('\nPath: {compat_tool_bin_path}').format(compat_tool_bin_path=compat_tool_bin_path)
 
                     compat_tool_folder = os.path.join(compat_tool_bin_path.split(compat_item_text)[0], compat_item_text)  # wine_info name is always "<tool_type> - <tool_folder_name>", compat_text_item is always "<tool_folder_name>" if we have the path
-                    compat_item.setData(Qt.UserRole, lambda path: os.system(f'xdg-open "{compat_tool_folder}"'))
+                    compat_item.setData(lambda path: os.system(f'xdg-open "{compat_tool_folder}"'), Qt.UserRole)
                 compat_tool_tooltip += self.tr('\nType: {wine_type}').format(wine_type=game.wine_info.get("type", "").capitalize()) if game.wine_info.get('type', '') else ''
             else:
                 # Linux/Browser games
@@ -277,20 +248,26 @@ class PupguiGameListDialog(QObject):
             compat_item.setToolTip(compat_tool_tooltip)
             compat_item.setTextAlignment(Qt.AlignCenter)
 
-            install_path_item = QTableWidgetItem(game.install_path)
+            install_path_item = QStandardItem(game.install_path)
             if game.platform.lower() == 'browser':
                 # Browser game paths are browserUrl, so the path won't exist -- Ignore this and set the tooltip and xdg-open action to open the URL 
                 self.set_item_data_directory(install_path_item, game.install_path, tooltip_exists=self.tr('Double-click to open in browser'), ignore_invalid_path=True)
             else:
                 self.set_item_data_directory(install_path_item, game.install_path)
             
-            runner_item = QTableWidgetItem(game.runner)
+            runner_item = QStandardItem(game.runner)
             runner_item.setTextAlignment(Qt.AlignCenter)
 
-            self.ui.tableGames.setItem(i, 0, title_item)
-            self.ui.tableGames.setItem(i, 1, compat_item)
-            self.ui.tableGames.setItem(i, 2, install_path_item)
-            self.ui.tableGames.setItem(i, 3, runner_item)
+            self.append_game_row([title_item, compat_item, install_path_item, runner_item])
+
+    def append_game_row(self, items: list[QStandardItem]):
+        """ Append a row to the Lutris/Heroic game model, sorting by the displayed text like the Steam game list """
+        for item in items:
+            item.setEditable(False)
+            if item.data(SORT_ROLE) is None:
+                item.setData(item.text(), SORT_ROLE)
+
+        self.game_model.appendRow(items)
 
     def set_apply_btn_text(self):
         """ Set text for Apply button to 'Close' if the games list is empty, if the current launcher is not Steam or if there are no queued changes."""
@@ -304,19 +281,40 @@ class PupguiGameListDialog(QObject):
 
     def btn_refresh_games_clicked(self):
         self.queued_changes = {}
+        self.update_game_list(cached=False)
+
+    def update_tooltip(self):
+        # If game is not found, fall back to tooltip defined in UI file
+        if tooltip_game_name := get_random_game_name(self.games):
+            self.ui.searchBox.setToolTip(self.tr('e.g. {GAME_NAME}').format(GAME_NAME=tooltip_game_name))
+
+    def update_game_list(self, cached=True):
         if self.launcher == 'steam':
-            self.update_game_list_steam(cached=False)
+            self.update_game_list_steam(cached=cached)
         elif self.launcher == 'lutris':
-            self.update_game_list_lutris()
+            self.update_game_list_lutris(cached=cached)
         elif is_heroic_launcher(self.launcher):
-            self.update_game_list_heroic()
+            self.update_game_list_heroic(cached=cached)
 
         self.update_tooltip()
 
-    def update_tooltip(self):
-        # If game is not found, fall back to tooltip defined in UI file
-        if tooltip_game_name := get_random_game_name(self.games):
-            self.ui.searchBox.setToolTip(self.tr('e.g. {GAME_NAME}').format(GAME_NAME=tooltip_game_name))
+    @Slot(str, object)
+    def game_index_changed(self, key: str, origin: object):
+        """ Show the games loaded again by another view, unless there are changes which were not applied yet """
+        if origin is self or self.queued_changes or key != GameIndex.get_key(self.install_loc):
+            return
+
+        self.update_game_list(cached=True)
+
+    def dialog_finished(self):
+        """ Stop listening to the Steam process monitor and the game index, they outlive the dialog """
+        get_game_index().changed.disconnect(self.game_index_changed)
+        if self.launcher == 'steam':
+            get_steam_process_monitor().running_changed.disconnect(self.steam_running_changed)
+
+    def steam_running_changed(self, running: bool):
+        self.should_show_steam_warning = (running or IS_FLATPAK) and self.launcher == 'steam'
+        self.ui.lblSteamRunningWarning.setVisible(self.should_show_steam_warning and not self.ui.searchBox.isVisible())
 
     def btn_search_clicked(self):
         self.ui.searchBox.setVisible(not self.ui.searchBox.isVisible())
@@ -333,9 +331,18 @@ class PupguiGameListDialog(QObject):
         PupguiShortcutDialog(self.install_loc.get('vdf_dir'), self.game_property_changed, self.ui)
 
     def search_gamelist_games(self, text):
-        for row in range(self.ui.tableGames.rowCount()):
-            should_hide: bool = not text.lower() in self.ui.tableGames.item(row, 0).text().lower()
-            self.ui.tableGames.setRowHidden(row, should_hide)
+        self.proxy_model.set_search_text(text)
+
+    def get_game_search_keys(self, row: int) -> list[str]:
+        """ Return the strings a game can be found by in the search, e.g. name, app id, compatibility tool and executable """
+        if self.launcher == 'steam':
+            game: SteamApp = self.game_model.get_game(row)
+            return [game.game_name, str(game.app_id), self.game_model.get_compat_tool(row), game.shortcut_exe]
+
+        # Lutris and Heroic: all columns, plus the Lutris slug / Heroic app name shown in the name tooltip
+        keys = [self.game_model.item(row, column).text() for column in range(self.game_model.columnCount())]
+        keys.append(self.game_model.item(row, 0).toolTip())
+        return keys
 
     @Slot(SteamApp)
     def update_protondb_status(self, game: SteamApp):
@@ -343,28 +350,37 @@ class PupguiGameListDialog(QObject):
         if not game:
             print('Warning: update_protondb_status called with game=None')
             return
-        pdb_tier = game.protondb_summary.get('tier', '?')
-
-        if self.games.index(game) != None:
-            # Use QTableWidgetItem to replace Button widget
-            pdb_item = self.ui.tableGames.item(self.ui.tableGames.currentRow(), 4)
-            pdb_item.setData(Qt.DisplayRole, pdb_tier)
-            pdb_item.setData(Qt.UserRole, f'{PROTONDB_APP_PAGE_URL}{game.app_id}')  # e.g. https://www.protondb.com/app/412830
-            pdb_item.setForeground(QBrush(QColor(PROTONDB_COLORS.get(pdb_tier))))
-            pdb_item.setToolTip(self.tr('Confidence: {confidence}\nScore: {score}\nTrending: {trending}')
-                .format(confidence=game.protondb_summary.get('confidence', '?'),
-                        score=game.protondb_summary.get('score', '?'),
-                        trending=game.protondb_summary.get('trendingTier', '?')))
-
-            self.ui.tableGames.removeCellWidget(self.ui.tableGames.currentRow(), 4)
-            pdb_item.setSelected(False)
+
+        # The model looks the row up by app id, the row may have changed because of sorting or a refresh
+        self.game_model.update_game(game)
+
+    def btn_fetch_protondb_clicked(self):
+        """ Fetch the ProtonDB status for all games that are currently visible (i.e. not hidden by the search) """
+        visible_games = []
+        for row in range(self.proxy_model.rowCount()):
+            game = self.game_model.get_game(self.proxy_model.mapToSource(self.proxy_model.index(row, 0)).row())
+            if game.protondb_summary.get('tier'):
+                continue
+            if load_cached_protondb_status(game) and game.protondb_summary.get('error') != PROTONDB_REQUEST_FAILED:
+                continue  # Rating cached or game not listed on ProtonDB, failed requests are tried again
+            visible_games.append(game)
+
+        get_protondb_status_list(visible_games, self.protondb_status_fetched, refresh=True)
+
+    def steam_item_clicked_action(self, index: QModelIndex):
+        """ Open the compatibility tool editor or fetch the ProtonDB status for the clicked Steam game """
+        if index.column() == STEAM_COLUMN_COMPAT_TOOL:
+            self.ui.tableGames.edit(index)
+        elif index.column() == STEAM_COLUMN_PROTONDB:
+            game = self.game_model.get_game(self.proxy_model.mapToSource(index).row())
+            if not game.protondb_summary.get('tier'):
+                get_protondb_status(game, self.protondb_status_fetched, refresh=True)  # Also try again if the game was not found or the request failed
 
     def queue_ctool_change_steam(self, ctool_name: str, game: SteamApp):
         """ add compatibility tool changes to queue (Steam) """
         ctool_name = None if ctool_name in {'-', ''} else ctool_name
 
         self.queued_changes[game] = ctool_name
-        self.ui.tableGames.item(self.ui.tableGames.currentRow(), 1).setData(Qt.DisplayRole, ctool_name)
         self.set_apply_btn_text()
 
     def update_queued_ctools_steam(self):
@@ -373,19 +389,19 @@ class PupguiGameListDialog(QObject):
             steam_update_ctools(self.queued_changes, steam_config_folder=self.install_loc.get('vdf_dir'))
             self.game_property_changed.emit(True)
 
-    def item_doubleclick_action(self, item):
-        """ open link attached for QTableWidgetItem in browser """
-        item_url = item.data(Qt.UserRole)
+    def item_doubleclick_action(self, index: QModelIndex):
+        """ open link attached for game table index in browser """
+        item_url = index.data(Qt.UserRole)
         if isinstance(item_url, str):
             open_webbrowser_thread(item_url)  # Str UserRole should always hold URL
         elif isinstance(item_url, Callable):
-            item_url(item.text())
+            item_url(index.data(Qt.DisplayRole))
 
-    def set_item_data_directory(self, item: QTableWidgetItem, path: str,
+    def set_item_data_directory(self, item: QStandardItem, path: str,
                                     tooltip_exists: str = 'Double click to browse...',
                                     tooltip_invalid: str = 'Install location does not exist!',
                                     ignore_invalid_path: bool = False):
-        """ Set the Qt.UserRole data for a QTableWidgetItem to a lambda which uses xdg-open to open a given path, if it exists. """
+        """ Set the Qt.UserRole data for a QStandardItem to a lambda which uses xdg-open to open a given path, if it exists. """
 
         # (hacky way to) show default tooltips in parameters while allowing translation (make sure they match the default parameters)
         if tooltip_exists == 'Double click to browse...':
@@ -395,7 +411,7 @@ class PupguiGameListDialog(QObject):
 
         if os.path.isdir(path) or ignore_invalid_path:
             item.setToolTip(tooltip_exists)
-            item.setData(Qt.UserRole, lambda path: os.system(f'xdg-open "{path}"'))
+            item.setData(lambda path: os.system(f'xdg-open "{path}"'), Qt.UserRole)
         else:
             item.setToolTip(tooltip_invalid)
 
@@ -4,10 +4,12 @@ import pkgutil
 
 from PySide6.QtCore import Signal, QLocale, QDataStream, QByteArray
 from PySide6.QtGui import QIcon, QPixmap, Qt
-from PySide6.QtWidgets import QDialog
+from PySide6.QtWidgets import QDialog, QListWidgetItem
 from PySide6.QtUiTools import QUiLoader
 
+from pupgui2.graphqlutil import prefetch_github_releases
 from pupgui2.util import open_webbrowser_thread, config_advanced_mode, get_combobox_index_by_value
+from pupgui2.util import available_install_directories, get_install_location_from_directory_name
 
 
 RELEASES_PER_PAGE = 50  # Number of releases to fetch per page
@@ -21,12 +23,17 @@ class PupguiInstallDialog(QDialog):
     def __init__(self, install_location, ct_loader, parent=None):
         super(PupguiInstallDialog, self).__init__(parent)
         self.install_location = install_location
-        advanced_mode = (config_advanced_mode() == 'enabled')
-        self.ct_objs = ct_loader.get_ctobjs(self.install_location, advanced_mode=advanced_mode)
+        self.ct_loader = ct_loader
+        self.advanced_mode = (config_advanced_mode() == 'enabled')
+        self.ct_objs = ct_loader.get_ctobjs(self.install_location, advanced_mode=self.advanced_mode)
         self.current_ct_obj = None
         self.loaded_page = 1
         self.more_releases_loadable = True  # Set to False when no more versions are available
 
+        main_window = getattr(ct_loader, 'main_window', None)
+        self.github_token: str = main_window.web_access_tokens.get('github', '') if main_window else ''
+        self.releases_prefetched = False
+
         self.load_ui()
         self.load_assets()
         self.setup_ui()
@@ -69,10 +76,17 @@ class PupguiInstallDialog(QDialog):
                 return
 
     def btn_install_clicked(self):
+        install_dirs = [self.install_location['install_dir']]
+        for i in range(self.ui.listAdditionalLocations.count()):
+            item = self.ui.listAdditionalLocations.item(i)
+            if item.checkState() == Qt.Checked:
+                install_dirs.append(item.data(Qt.UserRole))
+
         self.compat_tool_selected.emit({
             'name': self.ui.comboCompatTool.currentText(),
             'version': self.ui.comboCompatToolVersion.currentText(),
-            'install_dir': self.install_location['install_dir']
+            'install_dir': self.install_location['install_dir'],
+            'install_dirs': install_dirs
         })
         self.ui.close()
 
@@ -93,6 +107,11 @@ class PupguiInstallDialog(QDialog):
             else:
                 self.ui.comboCompatToolVersion.removeItem(self.ui.comboCompatToolVersion.count() - 1)
 
+            # With a GitHub token, fetch the releases of all tools in a single request using the GraphQL API
+            if self.github_token and not self.releases_prefetched:
+                self.releases_prefetched = True
+                prefetch_github_releases([getattr(ctobj['installer'], 'CT_URL', '') for ctobj in self.ct_objs], self.github_token, count=RELEASES_PER_PAGE)
+
             vers = self.current_ct_obj['installer'].fetch_releases(count=RELEASES_PER_PAGE, page=self.loaded_page)
 
             # If the number of fetched releases is less than RELEASES_PER_PAGE, there are no more releases to fetch
@@ -122,6 +141,7 @@ class PupguiInstallDialog(QDialog):
                 self.more_releases_loadable = True
                 self.update_releases()
                 self.update_description(ctobj)
+                self.update_additional_locations(ctobj)
                 return
 
     def combo_compat_tool_version_current_index_changed(self):
@@ -148,6 +168,30 @@ class PupguiInstallDialog(QDialog):
 
         self.ui.txtDescription.setHtml(desc)
 
+    def update_additional_locations(self, ctobj):
+        """ list the other install locations the selected compatibility tool can be installed to with the same download """
+        self.ui.listAdditionalLocations.clear()
+
+        install_dir = os.path.expanduser(self.install_location['install_dir'])
+        for other_install_dir in available_install_directories():
+            if os.path.expanduser(other_install_dir) == install_dir:
+                continue
+
+            install_loc = get_install_location_from_directory_name(other_install_dir)
+            if not any(other_ctobj['name'] == ctobj['name'] for other_ctobj in self.ct_loader.get_ctobjs(install_loc, advanced_mode=self.advanced_mode)):
+                continue
+
+            item = QListWidgetItem(install_loc.get('display_name', other_install_dir))
+            item.setToolTip(other_install_dir)
+            item.setData(Qt.UserRole, other_install_dir)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Unchecked)
+            self.ui.listAdditionalLocations.addItem(item)
+
+        has_additional_locations = self.ui.listAdditionalLocations.count() > 0
+        self.ui.lblAdditionalLocations.setVisible(has_additional_locations)
+        self.ui.listAdditionalLocations.setVisible(has_additional_locations)
+
     def set_selected_compat_tool(self, ctool_name: str):
         """ Set compat tool dropdown selected index to the index of the compat tool name passed """
         if ctool_name:
@@ -7,9 +7,10 @@ from PySide6.QtUiTools import QUiLoader
 from PySide6.QtGui import QKeySequence, QShortcut
 
 from pupgui2.datastructures import SteamApp
+from pupgui2.gamelistmodel import connect_debounced_search
 from pupgui2.steamutil import calc_shortcut_app_id, get_steam_user_list, determine_most_recent_steam_user
 from pupgui2.steamutil import get_steam_shortcuts_list, write_steam_shortcuts_list
-from pupgui2.util import host_path_exists
+from pupgui2.util import host_path_exists, normalize_search_text
 
 
 class ShortcutDialogLineEdit(QLineEdit):
@@ -68,6 +69,7 @@ class PupguiShortcutDialog(QObject):
 
         self.shortcuts = []
         self.discarded_shortcuts = []
+        self.search_index: list[str] = []  # normalized name and executable for each row, see search_shortcuts
 
         self.load_ui()
         self.setup_ui()
@@ -87,7 +89,7 @@ class PupguiShortcutDialog(QObject):
         self.ui.btnClose.clicked.connect(self.btn_close_clicked)
         self.ui.btnAdd.clicked.connect(self.btn_add_clicked)
         self.ui.btnRemove.clicked.connect(self.btn_remove_clicked)
-        self.ui.searchBox.textChanged.connect(self.search_shortcuts)
+        connect_debounced_search(self.ui.searchBox, self.search_shortcuts, self)
 
         # Keyboard Shortcuts
         QShortcut(QKeySequence.Save, self.ui).activated.connect(self.btn_save_clicked)
@@ -121,6 +123,7 @@ class PupguiShortcutDialog(QObject):
 
     def refresh_shortcut_list(self):
         self.shortcuts = get_steam_shortcuts_list(self.steam_config_folder)
+        self.search_index = [self.get_shortcut_search_key(shortcut) for shortcut in self.shortcuts]
 
         self.ui.tableShortcuts.setRowCount(len(self.shortcuts))
 
@@ -174,6 +177,7 @@ class PupguiShortcutDialog(QObject):
         elif col == 3:
             shortcut.shortcut_icon = text
 
+        self.search_index[index] = self.get_shortcut_search_key(shortcut)
         self.ui.tableShortcuts.cellWidget(index, col).setToolTip(text or self.ui.tableShortcuts.cellWidget(index, col).placeholderText())
 
     def btn_save_clicked(self):
@@ -215,6 +219,7 @@ class PupguiShortcutDialog(QObject):
 
         new_shortcut.shortcut_id = str(highest_id+1)
         self.shortcuts.append(new_shortcut)
+        self.search_index.append(self.get_shortcut_search_key(new_shortcut))
 
         self.ui.tableShortcuts.setRowCount(len(self.shortcuts))
         self.prepare_table_row(len(self.shortcuts) - 1, new_shortcut)
@@ -227,14 +232,14 @@ class PupguiShortcutDialog(QObject):
                     self.discarded_shortcuts.append(sid)
                 self.ui.tableShortcuts.cellWidget(i, 0).setStyleSheet('QLineEdit { color: red; }')
 
+    def get_shortcut_search_key(self, shortcut: SteamApp) -> str:
+        """ Return the normalized text a shortcut can be found by, i.e. its name and executable """
+        return f'{normalize_search_text(shortcut.game_name)}\n{normalize_search_text(shortcut.shortcut_exe)}'
+
     def search_shortcuts(self, text):
-        """ Search based on the shortcut name text (App Name on Row 0) in the QLineEdit widget on each row """
-        for row in range(self.ui.tableShortcuts.rowCount()):
-            if type(row_widget_name := self.ui.tableShortcuts.cellWidget(row, 0)) is not ShortcutDialogLineEdit:
-                continue
-            if type(row_widget_exe := self.ui.tableShortcuts.cellWidget(row, 1)) is not ShortcutDialogLineEdit:
-                row_widget_exe = None
-            search_text_in_name = text.lower() in row_widget_name.text().lower()
-            search_text_in_exe = text.lower() in row_widget_exe.text().lower() if row_widget_exe else False
-            should_hide: bool = not (search_text_in_name or search_text_in_exe)
-            self.ui.tableShortcuts.setRowHidden(row, should_hide)
+        """ Search based on the shortcut name and executable, using the prebuilt search index instead of reading the QLineEdit widgets """
+        search_text = normalize_search_text(text)
+        for row, search_key in enumerate(self.search_index):
+            should_hide: bool = search_text not in search_key
+            if self.ui.tableShortcuts.isRowHidden(row) != should_hide:
+                self.ui.tableShortcuts.setRowHidden(row, should_hide)
@@ -55,7 +55,7 @@ class CtInstaller(QObject):
         self.p_download_progress_percent = value
         self.download_progress_percent.emit(value)
 
-    def __download(self, url: str, destination: str, known_size: int = 0) -> bool:
+    def __download(self, url: str, destination: str, known_size: int = 0, checksum: str = '') -> bool:
         """
         Download files from url to destination
         Return Type: bool
@@ -68,7 +68,9 @@ class CtInstaller(QObject):
                 download_cancelled=self.download_canceled,
                 buffer_size=self.BUFFER_SIZE,
                 stream=True,
-                known_size=known_size
+                known_size=known_size,
+                checksum=checksum,
+                use_archive_cache=True
             )
         except Exception as e:
             print(f"Failed to download tool {CT_NAME} - Reason: {e}")
@@ -162,7 +164,7 @@ class CtInstaller(QObject):
                 return False
 
         proton_tar = os.path.join(temp_dir, data['download'].split('/')[-1])
-        if not self.__download(url=data['download'], destination=proton_tar):
+        if not self.__download(url=data['download'], destination=proton_tar, checksum=source_checksum or ''):
             return False
 
         download_checksum = self.__sha512sum(proton_tar)
@@ -70,7 +70,8 @@ class CtInstaller(QObject):
                 download_cancelled=self.download_canceled,
                 buffer_size=self.BUFFER_SIZE,
                 stream=True,
-                known_size=known_size
+                known_size=known_size,
+                use_archive_cache=True
             )
         except Exception as e:
             print(f"Failed to download tool {CT_NAME} - Reason: {e}")
@@ -9,6 +9,7 @@ import requests
 from PySide6.QtCore import QObject, QCoreApplication, Signal, Property
 from PySide6.QtWidgets import QMessageBox
 
+from pupgui2.ciutil import fetch_successful_workflow_runs, get_workflow_run_artifacts
 from pupgui2.networkutil import download_file
 from pupgui2.util import ghapi_rlcheck, extract_tar, extract_zip, extract_tar_zst, remove_if_exists
 from pupgui2.util import build_headers_with_authorization
@@ -68,7 +69,8 @@ class CtInstaller(QObject):
                 download_cancelled=self.download_canceled,
                 buffer_size=self.BUFFER_SIZE,
                 stream=True,
-                known_size=known_size or 0
+                known_size=known_size or 0,
+                use_archive_cache=True  # nightly.link urls point to a single workflow run, so they never change either
             )
         except Exception as e:
             print(f"Failed to download tool {CT_NAME} - Reason: {e}")
@@ -87,10 +89,13 @@ class CtInstaller(QObject):
         Get artifact from workflow run id.
         Return Type: str
         """
-        artifact_info = self.rs.get(f'{self.CT_ARTIFACT_URL.format(commit)}?per_page=100').json()
-        if artifact_info.get("total_count") != 1:
+        if not str(commit).isdigit():  # Release tags are not workflow run ids, no need to ask GitHub
             return None
-        return artifact_info["artifacts"][0]
+
+        artifacts = get_workflow_run_artifacts(self.rs, self.CT_ARTIFACT_URL.format(commit))
+        if not artifacts or len(artifacts) != 1:
+            return None
+        return artifacts[0]
 
     def __fetch_github_data_ci(self, tag):
         """
@@ -140,24 +145,12 @@ class CtInstaller(QObject):
         return True
 
     def __fetch_workflows(self, count=30):
-        tags = []
-        for workflow in self.rs.get(f'{self.CT_WORKFLOW_URL}?per_page={str(count)}').json().get("workflows", {}):
-            if workflow['state'] != "active" or self.PROTON_PACKAGE_NAME not in workflow['path']:
-                continue
-            page = 1
-            while page != -1 and page < 5:  # fetch more (up to 5 pages) if first releases all failed
-                at_least_one_failed = False  # ensure the reason that len(tags)=0 is that releases failed
-                for run in self.rs.get(workflow["url"] + f"/runs?per_page={str(count)}&page={page}").json()["workflow_runs"]:
-                    if run['conclusion'] == "success":
-                        tags.append(str(run['id']))
-                    elif run['conclusion'] == "failure":
-                        at_least_one_failed = True
-                if len(tags) == 0 and at_least_one_failed:
-                    page += 1
-                else:
-                    page = -1
-
-        return tags
+        """
+        Get the run ids of the latest successful runs of the active Proton-tkg workflows.
+        Return Type: list[str]
+        """
+        runs = fetch_successful_workflow_runs(self.rs, self.CT_WORKFLOW_URL, self.PROTON_PACKAGE_NAME, count=count)
+        return [str(run['id']) for run in runs]
 
     def fetch_releases(self, count=30, page=1):
         """
@@ -10,7 +10,8 @@ from PySide6.QtWidgets import QMessageBox
 from pupgui2 import constants
 from pupgui2.datastructures import MsgBoxType, MsgBoxResult
 from pupgui2.steamutil import get_fish_user_paths, remove_steamtinkerlaunch, get_external_steamtinkerlaunch_intall
-from pupgui2.util import host_which, config_advanced_mode
+from pupgui2.systemprofile import get_system_profile
+from pupgui2.util import host_which_all, config_advanced_mode
 from pupgui2.util import ghapi_rlcheck
 from pupgui2.util import build_headers_with_authorization
 
@@ -66,12 +67,7 @@ class CtInstaller(QObject):
         self.rs.headers.update(rs_headers)
 
         self.allow_git = allow_git
-        proc_prefix = ['flatpak-spawn', '--host'] if constants.IS_FLATPAK else []
-        self.distinfo = subprocess.run(
-            proc_prefix + ['cat', '/etc/lsb-release', '/etc/os-release'],
-            universal_newlines=True,
-            stdout=subprocess.PIPE
-            ).stdout.strip().lower()
+        self.distinfo = get_system_profile().distinfo
 
     def get_download_canceled(self):
         return self.p_download_canceled
@@ -173,7 +169,8 @@ class CtInstaller(QObject):
         """
         # Possibly excuse some of these if not on Steam Deck and ignore if Flatpak
         proc_prefix = ['flatpak-spawn', '--host'] if constants.IS_FLATPAK else []
-        yad_exe = host_which('yad')
+        exes = host_which_all(['yad', 'awk', 'gawk', 'git', 'pgrep', 'unzip', 'wget', 'xdotool', 'xprop', 'xrandr', 'xxd', 'xwininfo'])  # Single host process in Flatpak
+        yad_exe = exes['yad']
         if yad_exe:
             try:
                 yad_vers = subprocess.run(proc_prefix + ['yad', '--version'], universal_newlines=True, stdout=subprocess.PIPE).stdout.strip().split(' ')[0].split('.')
@@ -186,16 +183,16 @@ class CtInstaller(QObject):
         deps_met = {}
         if "steamos" not in self.distinfo:
             deps_met = {
-                'awk-gawk': host_which('awk') or host_which('gawk'),
-                'git': host_which('git'),
-                'pgrep': host_which('pgrep'),
-                'unzip': host_which('unzip'),
-                'wget': host_which('wget'),
-                'xdotool': host_which('xdotool'),
-                'xprop': host_which('xprop'),
-                'xrandr': host_which('xrandr'),
-                'xxd': host_which('xxd'),
-                'xwininfo': host_which('xwininfo'),
+                'awk-gawk': exes['awk'] or exes['gawk'],
+                'git': exes['git'],
+                'pgrep': exes['pgrep'],
+                'unzip': exes['unzip'],
+                'wget': exes['wget'],
+                'xdotool': exes['xdotool'],
+                'xprop': exes['xprop'],
+                'xrandr': exes['xrandr'],
+                'xxd': exes['xxd'],
+                'xwininfo': exes['xwininfo'],
                 'yad >= 7.2': yad_exe and yad_ver >= 7.2
             }
 
@@ -64,6 +64,7 @@ class CtInstaller(QObject):
                 destination=os.path.expanduser(destination),
                 progress_callback=self.__set_download_progress_percent,
                 download_cancelled=self.download_canceled,
+                use_archive_cache=True
             )
         except Exception as e:
             print(f"Failed to download tool {CT_NAME} - Reason: {e}")
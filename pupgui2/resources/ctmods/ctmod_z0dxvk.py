@@ -66,7 +66,8 @@ class CtInstaller(QObject):
                 download_cancelled=self.download_canceled,
                 buffer_size=self.BUFFER_SIZE,
                 stream=True,
-                known_size=known_size
+                known_size=known_size,
+                use_archive_cache=True  # Also used by DXVK (nightly), its artifact urls are per workflow run
             )
         except Exception as e:
             print(f"Failed to download tool {CT_NAME} - Reason: {e}")
@@ -6,6 +6,7 @@ import os
 
 from PySide6.QtCore import QCoreApplication
 
+from pupgui2.ciutil import fetch_successful_workflow_runs, get_workflow_run_artifacts
 from pupgui2.util import extract_zip, ghapi_rlcheck
 
 from pupgui2.resources.ctmods.ctmod_z0dxvk import CtInstaller as DXVKInstaller
@@ -31,6 +32,7 @@ class CtInstaller(DXVKInstaller):
         super().__init__(main_window)
 
         self.release_format: str = 'zip'
+        self.run_ids: dict[str, int] = {}  # short commit hash -> workflow run id, from fetch_releases
 
     def __fetch_workflows(self, count: int = 30) -> list[str]:
 
@@ -39,41 +41,13 @@ class CtInstaller(DXVKInstaller):
         Return Type: list
         """
 
-        workflow_request_url: str = f'{self.CT_WORKFLOW_URL}?per_page={str(count)}'
-        workflow_response_json: dict = self.rs.get(workflow_request_url).json()
+        runs: list[dict] = fetch_successful_workflow_runs(self.rs, self.CT_WORKFLOW_URL, self.DXVK_WORKFLOW_NAME, branch='master', count=count)
 
         tags: list[str] = []
-        for workflow in workflow_response_json.get('workflows', {}):
-            if workflow['state'] != "active" or self.DXVK_WORKFLOW_NAME not in workflow['path']:
-                continue
-
-            page = 1
-            while page != -1 and page <= 5:  # fetch more (up to 5 pages) if first releases all failed
-                at_least_one_failed = False  # ensure the reason that len(tags)=0 is that releases failed
-
-                workflow_runs_request_url: str = f'{workflow["url"]}/runs?per_page={count}&page={page}'
-                workflow_runs_response_json: dict = self.rs.get(workflow_runs_request_url).json()
-
-                for run in workflow_runs_response_json.get('workflow_runs', {}):
-                    if run['head_branch'] != 'master':
-                        continue
-
-                    if run['conclusion'] == "failure":
-                        at_least_one_failed = True
-
-                        continue
-
-                    # TODO can make this generic so that i.e. this DXVK Ctmod can use commmit SHAs but Proton-tkg can use workflow IDs?
-                    #      then this could be a generic function shared between ctmods and could be in a util file, unit tested, etc
-                    commit_hash: str = str(run['head_commit']['id'][:7])
-                    tags.append(commit_hash)
-
-                if len(tags) == 0 and at_least_one_failed:
-                    page += 1
-
-                    continue
-
-                page = -1
+        for run in runs:
+            commit_hash: str = str(run['head_commit']['id'][:7])
+            self.run_ids[commit_hash] = run['id']
+            tags.append(commit_hash)
 
         return tags
 
@@ -93,12 +67,17 @@ class CtInstaller(DXVKInstaller):
         Return Type: str
         """
 
-        for artifact in self.rs.get(f'{self.CT_ALL_ARTIFACTS_URL}?per_page=100').json()["artifacts"]:
+        # Runs listed by fetch_releases are known, only their own artifacts (cached) have to be looked at
+        if commit in self.run_ids:
+            artifacts = get_workflow_run_artifacts(self.rs, self.CT_ARTIFACT_URL.format(self.run_ids[commit])) or []
+        else:
+            artifacts = self.rs.get(f'{self.CT_ALL_ARTIFACTS_URL}?per_page=100').json().get('artifacts', [])
+
+        for artifact in artifacts:
             # DXVK appends '-msvc-output' to Windows builds
             # See: https://github.com/doitsujin/dxvk/blob/20a6fae8a7f60e7719724b229552eba1ae6c3427/.github/workflows/test-build-windows.yml#L80
             if artifact['workflow_run']['head_sha'][:len(commit)] == commit and not artifact['name'].endswith('-msvc-output'):
-                artifact['workflow_run']['head_sha'] = commit
-                return artifact
+                return {**artifact, 'workflow_run': {**artifact['workflow_run'], 'head_sha': commit}}  # Don't modify the cached artifact
         
         return None
 
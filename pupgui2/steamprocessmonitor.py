@@ -0,0 +1,161 @@
+import os
+import threading
+
+from PySide6.QtCore import QObject, QSocketNotifier, QTimer, Signal
+
+from pupgui2.cacheutil import get_path_stamp
+from pupgui2.constants import STEAM_PID_FILES, STEAM_PROCESS_POLL_INTERVAL
+
+
+def read_steam_pid(pid_file: str) -> int:
+    """
+    Read the pid from a Steam pid file, e.g. ~/.steam/steam.pid.
+    Return Type: int (0 if the file does not exist or contains no pid)
+    """
+    try:
+        with open(pid_file, 'r') as f:
+            return int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def is_steam_process(pid: int) -> bool:
+    """
+    Return whether the process with the pid is running a Steam executable.
+    Return Type: bool
+    """
+    try:
+        return 'steam' in os.readlink(f'/proc/{pid}/exe')
+    except OSError:
+        return False
+
+
+def find_steam_pid_in_proc() -> int:
+    """
+    Look for a Steam process in all of /proc, used if Steam did not write a pid file.
+    Return Type: int (0 if Steam is not running)
+    """
+    try:
+        for proc in os.listdir('/proc'):
+            if proc.isdigit() and is_steam_process(int(proc)):
+                return int(proc)
+    except OSError:
+        pass
+
+    return 0
+
+
+def find_steam_pid(pid_files: list[str] = STEAM_PID_FILES) -> int:
+    """
+    Return the pid of the running Steam client, read from its pid file and verified once in /proc.
+    Return Type: int (0 if Steam is not running)
+    """
+    if not any(os.path.exists(pid_file) for pid_file in pid_files):
+        return find_steam_pid_in_proc()
+
+    for pid_file in pid_files:
+        if (pid := read_steam_pid(pid_file)) and is_steam_process(pid):
+            return pid
+
+    return 0
+
+
+class SteamProcessMonitor(QObject):
+    """
+    Knows whether the Steam client is running without scanning /proc each time.
+    The Steam process is watched with a pidfd (polling /proc on older kernels), the pid files are checked
+    every STEAM_PROCESS_POLL_INTERVAL ms to notice when Steam is started. Must be used from the GUI thread.
+    """
+
+    running_changed = Signal(bool)
+
+    def __init__(self, pid_files: list[str] = STEAM_PID_FILES, parent=None):
+        super(SteamProcessMonitor, self).__init__(parent)
+        self.pid_files = pid_files
+
+        self._pid = 0
+        self._checked = False
+        self._pid_file_stamp = None
+        self._pidfd = -1
+        self._pidfd_notifier: QSocketNotifier | None = None
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(STEAM_PROCESS_POLL_INTERVAL)
+        self._poll_timer.timeout.connect(self.poll)
+
+    def is_running(self) -> bool:
+        """
+        Return whether the Steam client is running, checked once and then kept up to date by the monitor.
+        Return Type: bool
+        """
+        if not self._checked:
+            self.refresh()
+
+        return self._pid != 0
+
+    def refresh(self) -> bool:
+        """
+        Look for the Steam process again and emit running_changed if Steam was started or exited.
+        Return Type: bool
+        """
+        was_running = self._pid != 0
+        self._pid_file_stamp = get_path_stamp(self.pid_files)
+        pid = find_steam_pid(self.pid_files)
+
+        if pid != self._pid:
+            self._watch_pid(pid)
+        self._pid = pid
+
+        if not self._poll_timer.isActive():
+            self._poll_timer.start()
+
+        if self._checked and was_running != (pid != 0):
+            self.running_changed.emit(pid != 0)
+        self._checked = True
+
+        return pid != 0
+
+    def poll(self):
+        """ Refresh if the pid files changed, or if the Steam process exited and is not watched with a pidfd """
+        if self._pid and self._pidfd_notifier is None and not is_steam_process(self._pid):
+            self.refresh()
+        elif get_path_stamp(self.pid_files) != self._pid_file_stamp:
+            self.refresh()
+
+    def _watch_pid(self, pid: int):
+        if self._pidfd_notifier is not None:
+            self._pidfd_notifier.setEnabled(False)
+            self._pidfd_notifier.deleteLater()
+            self._pidfd_notifier = None
+        if self._pidfd >= 0:
+            os.close(self._pidfd)
+            self._pidfd = -1
+
+        if not pid or not hasattr(os, 'pidfd_open'):
+            return
+
+        try:
+            self._pidfd = os.pidfd_open(pid)
+        except OSError:
+            return
+
+        # The pidfd becomes readable once the process exits
+        self._pidfd_notifier = QSocketNotifier(self._pidfd, QSocketNotifier.Type.Read, self)
+        self._pidfd_notifier.activated.connect(lambda *args: self.refresh())
+
+
+_steam_process_monitor: SteamProcessMonitor | None = None
+_steam_process_monitor_lock = threading.Lock()
+
+
+def get_steam_process_monitor() -> SteamProcessMonitor:
+    """
+    Return the SteamProcessMonitor shared by all views.
+    Return Type: SteamProcessMonitor
+    """
+    global _steam_process_monitor
+
+    with _steam_process_monitor_lock:
+        if _steam_process_monitor is None:
+            _steam_process_monitor = SteamProcessMonitor()
+        return _steam_process_monitor
@@ -4,9 +4,11 @@ import subprocess
 import json
 import vdf
 import requests
-import threading
 import pkgutil
 import binascii
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from steam.utils.appcache import parse_appinfo
 
 from PySide6.QtCore import Signal
@@ -14,14 +16,22 @@ from PySide6.QtWidgets import QMessageBox, QApplication
 
 from pupgui2.constants import APP_NAME, APP_ID, APP_ICON_FILE
 from pupgui2.constants import PROTON_EAC_RUNTIME_APPID, PROTON_BATTLEYE_RUNTIME_APPID, PROTON_NEXT_APPID, STEAMLINUXRUNTIME_APPID, STEAMLINUXRUNTIME_SOLDIER_APPID, STEAMLINUXRUNTIME_SNIPER_APPID
-from pupgui2.constants import LOCAL_AWACY_GAME_LIST, PROTONDB_API_URL
+from pupgui2.constants import LOCAL_AWACY_GAME_LIST, PROTONDB_API_URL, PROTONDB_CACHE_FILE, PROTONDB_CACHE_TTL, PROTONDB_ERROR_CACHE_TTL, PROTONDB_MAX_WORKERS
+from pupgui2.constants import PROTONDB_NOT_FOUND, PROTONDB_REQUEST_FAILED
 from pupgui2.constants import STEAM_STL_INSTALL_PATH, STEAM_STL_CONFIG_PATH, STEAM_STL_SHELL_FILES, STEAM_STL_FISH_VARIABLES, HOME_DIR, IS_FLATPAK
+from pupgui2.cacheutil import JsonFileCache
 from pupgui2.datastructures import SteamApp, AWACYStatus, BasicCompatTool, CTType, SteamUser, RuntimeType
+from pupgui2.steamprocessmonitor import get_steam_process_monitor
 
 
-_cached_app_list = []
+_cached_app_lists: dict[str, list[SteamApp]] = {}  # steam_config_folder -> apps
 _cached_steam_ctool_id_map = None
 
+_protondb_cache = JsonFileCache(PROTONDB_CACHE_FILE, ttl=PROTONDB_CACHE_TTL)
+_protondb_executor = ThreadPoolExecutor(max_workers=PROTONDB_MAX_WORKERS, thread_name_prefix='protondb')
+_protondb_pending: set[int] = set()
+_protondb_pending_lock = threading.Lock()
+
 
 def get_steam_vdf_compat_tool_mapping(vdf_file: dict) -> dict:
 
@@ -47,10 +57,8 @@ def get_steam_app_list(steam_config_folder: str, cached=False, no_shortcuts=Fals
     steam_config_folder = e.g. '~/.steam/root/config'
     Return Type: list[SteamApp]
     """
-    global _cached_app_list
-
-    if cached and _cached_app_list != []:
-        return _cached_app_list
+    if cached and steam_config_folder in _cached_app_lists:
+        return _cached_app_lists[steam_config_folder]
 
     libraryfolders_vdf_file = os.path.join(os.path.expanduser(steam_config_folder), 'libraryfolders.vdf')
     config_vdf_file = os.path.join(os.path.expanduser(steam_config_folder), 'config.vdf')
@@ -93,7 +101,7 @@ def get_steam_app_list(steam_config_folder: str, cached=False, no_shortcuts=Fals
         if not no_shortcuts:
             apps.extend(get_steam_shortcuts_list(steam_config_folder, c))
 
-    _cached_app_list = apps
+    _cached_app_lists[steam_config_folder] = apps
     return apps
 
 
@@ -157,7 +165,32 @@ def get_steam_game_list(steam_config_folder: str, compat_tool: BasicCompatTool |
     """
     apps = get_steam_app_list(steam_config_folder, cached=cached)
 
-    return [app for app in apps if app.app_type == 'game' and (compat_tool is None or app.compat_tool == compat_tool.get_internal_name() or ctool_is_runtime_for_app(app, compat_tool))]
+    if compat_tool is None:
+        return [app for app in apps if app.app_type == 'game']
+
+    return get_steam_games_for_ctool(get_steam_ct_game_index(apps), compat_tool)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_runtime_type_for_ctool_name(compat_tool_name: str) -> RuntimeType | None:
+    """ Map an anti-cheat runtime name like 'Proton EasyAntiCheat Runtime' to its RuntimeType """
+    compat_tool_name = compat_tool_name.lower().replace(' ', '')
+    if 'easyanticheatruntime' in compat_tool_name:
+        return RuntimeType.EAC
+    if 'battleyeruntime' in compat_tool_name:
+        return RuntimeType.BATTLEYE
+    return None
+
+
+def get_ctool_runtime_type(compat_tool: BasicCompatTool | None) -> RuntimeType | None:
+    """
+    Return the RuntimeType of an anti-cheat runtime compatibility tool, or None if compat_tool is no runtime.
+    Return Type: RuntimeType | None
+    """
+    if not compat_tool or not compat_tool.ct_type == CTType.STEAM_RT:
+        return None
+
+    return _get_runtime_type_for_ctool_name(compat_tool.get_internal_name())
 
 
 def ctool_is_runtime_for_app(app: SteamApp, compat_tool: BasicCompatTool | None):
@@ -165,12 +198,42 @@ def ctool_is_runtime_for_app(app: SteamApp, compat_tool: BasicCompatTool | None)
     Check if a compatibility tool name corresponds to a runtime in use by a SteamApp by comparing a hardcoded name against app.anticheat_runtimes
     Example: Compatibility tool name is 'ProtonEasyAntiCheatRuntime' and the app.anticheat_runtimes has RuntimeType.EAC as True
     """
-    if not compat_tool or not compat_tool.ct_type == CTType.STEAM_RT:
-        return False
+    runtime_type = get_ctool_runtime_type(compat_tool)
+    return runtime_type is not None and app.anticheat_runtimes.get(runtime_type, False)
+
+
+def get_steam_ct_game_index(apps: list[SteamApp]) -> dict[str | RuntimeType, list[SteamApp]]:
+    """
+    Build a reverse index in a single pass over apps: compatibility tool internal name or anti-cheat RuntimeType -> games using it.
+    Only apps of type 'game' are included.
+    Return Type: dict[str | RuntimeType, list[SteamApp]]
+    """
+    ct_game_index: dict[str | RuntimeType, list[SteamApp]] = {}
+    for app in apps:
+        if app.app_type != 'game':
+            continue
 
-    compat_tool_name = compat_tool.get_internal_name().lower().replace(' ', '')
-    return 'easyanticheatruntime' in compat_tool_name and app.anticheat_runtimes[RuntimeType.EAC] \
-        or 'battleyeruntime' in compat_tool_name and app.anticheat_runtimes[RuntimeType.BATTLEYE]
+        if app.compat_tool:
+            ct_game_index.setdefault(app.compat_tool, []).append(app)
+        for runtime_type, is_used in app.anticheat_runtimes.items():
+            if is_used:
+                ct_game_index.setdefault(runtime_type, []).append(app)
+
+    return ct_game_index
+
+
+def get_steam_games_for_ctool(ct_game_index: dict[str | RuntimeType, list], compat_tool: BasicCompatTool) -> list:
+    """
+    Look up the games using compat_tool in a reverse index built by get_steam_ct_game_index (or with the same keys),
+    including games which depend on compat_tool if it is an anti-cheat runtime.
+    Return Type: list
+    """
+    games = ct_game_index.get(compat_tool.get_internal_name(), [])
+    if (runtime_type := get_ctool_runtime_type(compat_tool)) and (runtime_games := ct_game_index.get(runtime_type)):
+        game_ids = {id(game) for game in games}
+        games = games + [game for game in runtime_games if id(game) not in game_ids]
+
+    return games
 
 
 def get_steam_ct_game_map(steam_config_folder: str, compat_tools: list[BasicCompatTool], cached=False) -> dict[BasicCompatTool, list[SteamApp]]:
@@ -358,22 +421,87 @@ def update_steamapp_awacystatus(steamapp_list: list[SteamApp]) -> list[SteamApp]
 
 
 def get_protondb_status_thread(game: SteamApp, signal: Signal) -> None:
-    """ Downloads the ProtonDB.com status and calls the Qt Signal "signal" when done. Use with "get_protondb_status"!"""
+    """
+    Downloads the ProtonDB.com status and calls the Qt Signal "signal" when done. Use with "get_protondb_status"!
+    Games unknown to ProtonDB.com and failed requests are cached with a summary containing only an 'error'
+    (PROTONDB_NOT_FOUND or PROTONDB_REQUEST_FAILED), so they are not fetched again each time.
+    """
     try:
         json_url = PROTONDB_API_URL.format(game_id=str(game.app_id))
-        r = requests.get(json_url)
+        r = requests.get(json_url, timeout=10)
         if r.status_code == 200:
             game.protondb_summary = r.json()
-        signal.emit(game)
+            _protondb_cache.set(game.get_app_id_str(), game.protondb_summary)
+        elif r.status_code == 404:
+            game.protondb_summary = {'error': PROTONDB_NOT_FOUND}
+            _protondb_cache.set(game.get_app_id_str(), game.protondb_summary)
+        else:
+            game.protondb_summary = {'error': PROTONDB_REQUEST_FAILED}
+            _protondb_cache.set(game.get_app_id_str(), game.protondb_summary, ttl=PROTONDB_ERROR_CACHE_TTL)
     except Exception as e:
         print('Error getting the protondb.com status:', e)
-        signal.emit(None)
+        game.protondb_summary = {'error': PROTONDB_REQUEST_FAILED}
+        _protondb_cache.set(game.get_app_id_str(), game.protondb_summary, ttl=PROTONDB_ERROR_CACHE_TTL)
+
+    signal.emit(game)
+
+
+def _protondb_request_done(app_id: int) -> None:
+    """ Called by the ProtonDB worker pool when a request finished. Writes the cache once no more requests are pending. """
+    with _protondb_pending_lock:
+        _protondb_pending.discard(app_id)
+        is_idle = len(_protondb_pending) == 0
+
+    if is_idle:
+        _protondb_cache.save()
 
 
-def get_protondb_status(game: SteamApp, signal: Signal) -> None:
-    """ Downloads the ProtonDB.com status in a separate threads. When done the Qt Signal "signal" is called """
-    t = threading.Thread(target=get_protondb_status_thread, args=(game, signal))
-    t.start()
+def load_cached_protondb_status(game: SteamApp) -> bool:
+    """
+    Set game.protondb_summary from the ProtonDB cache if there is a cached summary which is not expired.
+    Also returns True for games cached with an 'error' (unknown to ProtonDB.com or failed recently), which don't need to be fetched.
+    Return Type: bool
+    """
+    summary = _protondb_cache.get(game.get_app_id_str())
+    if summary is None:
+        return False
+
+    game.protondb_summary = summary
+    return True
+
+
+def get_protondb_status(game: SteamApp, signal: Signal, refresh: bool = False) -> None:
+    """
+    Downloads the ProtonDB.com status using a bounded worker pool. When done the Qt Signal "signal" is called.
+    Cached summaries are emitted right away without a request, unless refresh is True.
+    """
+    if not refresh and load_cached_protondb_status(game):
+        signal.emit(game)
+        return
+
+    with _protondb_pending_lock:
+        if game.app_id in _protondb_pending:
+            return  # Already being fetched
+        _protondb_pending.add(game.app_id)
+
+    future = _protondb_executor.submit(get_protondb_status_thread, game, signal)
+    future.add_done_callback(lambda _, app_id=game.app_id: _protondb_request_done(app_id))
+
+
+def cancel_protondb_requests() -> None:
+    """ Drop the ProtonDB requests which have not started yet, so quitting does not wait for them """
+    _protondb_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_protondb_status_list(games: list[SteamApp], signal: Signal, refresh: bool = False) -> None:
+    """
+    Downloads the ProtonDB.com status for multiple games, see get_protondb_status.
+    Non-Steam shortcuts are skipped as they are not listed on ProtonDB.com.
+    """
+    for game in games:
+        if game.shortcut_id:
+            continue
+        get_protondb_status(game, signal, refresh=refresh)
 
 
 def steam_update_ctool(game: SteamApp, new_ctool=None, steam_config_folder='') -> bool:
@@ -439,18 +567,10 @@ def steam_update_ctools(games: dict[SteamApp, str], steam_config_folder='') -> b
 
 def is_steam_running() -> bool:
     """
-    Returns True if the Steam client is running, False otherwise
+    Returns True if the Steam client is running, False otherwise (see SteamProcessMonitor)
     Return Type: bool
     """
-    try:
-        procs = os.listdir('/proc')
-        for proc in procs:
-            exe = os.path.join('/proc', proc, 'exe')
-            if os.path.exists(exe) and 'steam' in os.readlink(exe):
-                return True
-    except:
-        pass
-    return False
+    return get_steam_process_monitor().is_running()
 
 
 get_fish_user_paths = lambda mfile: ([line.strip() for line in mfile.readlines() if 'fish_user_paths' in line] or ['SETUVAR fish_user_paths:\\x1d'])[0].split('fish_user_paths:')[1:][0].split('\\x1e')
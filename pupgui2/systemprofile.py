@@ -0,0 +1,149 @@
+import os
+import sys
+import platform
+import threading
+import subprocess
+import importlib.util
+
+import PySide6
+
+from pupgui2.constants import IS_FLATPAK
+from pupgui2.datastructures import HardwarePlatform
+
+
+TAR_DECOMPRESSOR_MODULES = { 'gz': 'zlib', 'bz2': 'bz2', 'xz': 'lzma', 'zst': 'zstandard' }  # Compression of tar archives -> module needed to extract them
+
+
+class SystemProfile:
+    """ Information about the system which does not change while ProtonUp-Qt is running, see get_system_profile """
+
+    def __init__(self):
+        self.platform = HardwarePlatform.DESKTOP
+        self.is_steam_os = False
+        self.is_flatpak = IS_FLATPAK
+        self.distinfo = ''  # Lowercase content of lsb-release and os-release of the host, e.g. to check for 'steamos'
+        self.release: dict[str, str] = {}  # lsb-release/os-release values of the system ProtonUp-Qt is running on (Flatpak runtime inside Flatpak)
+        self.host_release: dict[str, str] = {}  # os-release values of the host
+        self.decompressors: list[str] = []  # Supported compressions of tar archives, e.g. ['gz', 'xz', 'zst']
+        self.version_info = ''  # Python and PySide version
+
+
+def parse_release_file(content: str) -> dict[str, str]:
+    """
+    Parse the KEY=value lines of /etc/os-release and /etc/lsb-release, the first value of a key is kept.
+    Return Type: dict[str, str]
+    """
+    values = {}
+    for line in content.splitlines():
+        key, sep, value = line.strip().partition('=')
+        if sep and key not in values:
+            values[key] = value.strip().strip('"\'')
+
+    return values
+
+
+def read_release_files(etc_dir: str = '/etc', host: bool = False) -> tuple[str, str]:
+    """
+    Read lsb-release and os-release, from the host if host=True and running inside Flatpak (using a single flatpak-spawn).
+    Missing files are skipped.
+    Return Type: tuple[str, str] (lsb-release, os-release)
+    """
+    lsb_release_path, os_release_path = os.path.join(etc_dir, 'lsb-release'), os.path.join(etc_dir, 'os-release')
+
+    if host and IS_FLATPAK:
+        script = 'cat "$1" 2>/dev/null; echo "\x1e"; cat "$2" 2>/dev/null'
+        try:
+            stdout = subprocess.run(['flatpak-spawn', '--host', 'sh', '-c', script, 'sh', lsb_release_path, os_release_path], universal_newlines=True, stdout=subprocess.PIPE).stdout
+        except OSError as e:
+            print(f'Warning: Could not read the host release files: {e}')
+            return '', ''
+        lsb_release, _, os_release = stdout.partition('\x1e\n')
+        return lsb_release, os_release
+
+    contents = []
+    for path in [lsb_release_path, os_release_path]:
+        try:
+            with open(path, 'r') as f:
+                contents.append(f.read())
+        except OSError:
+            contents.append('')
+
+    return contents[0], contents[1]
+
+
+def load_system_profile(etc_dir: str = '/etc') -> SystemProfile:
+    """
+    Collect the system profile, spawns at most one process on the host.
+    Return Type: SystemProfile
+    """
+    profile = SystemProfile()
+
+    lsb_release, os_release = read_release_files(etc_dir)
+    profile.release = parse_release_file(lsb_release) or parse_release_file(os_release)
+
+    if IS_FLATPAK:
+        host_lsb_release, host_os_release = read_release_files(etc_dir, host=True)
+    else:
+        host_lsb_release, host_os_release = lsb_release, os_release
+    profile.host_release = parse_release_file(host_os_release)
+    profile.distinfo = (host_lsb_release + host_os_release).strip().lower()
+
+    # Detect SteamOS: https://github.com/sonic2kk/steamtinkerlaunch/wiki/Steam-Deck#setup
+    profile.is_steam_os = 'steamos' in profile.distinfo
+    if 'steamdeck' in host_os_release:
+        profile.platform = HardwarePlatform.STEAM_DECK
+
+    profile.decompressors = [compression for compression, module in TAR_DECOMPRESSOR_MODULES.items() if importlib.util.find_spec(module) is not None]
+    profile.version_info = 'Python ' + sys.version.replace('\n', '') + f', PySide {PySide6.__version__}'
+
+    return profile
+
+
+def format_release(release: dict[str, str]) -> str:
+    """
+    Return the name and version of a parsed release file, e.g. 'SteamOS 3.5.19'.
+    Return Type: str
+    """
+    name = release.get('NAME', release.get('DISTRIB_ID', ''))
+    version = release.get('VERSION', release.get('DISTRIB_RELEASE', release.get('VERSION_ID', '')))
+    return f'{name} {version}'.strip()
+
+
+def format_system_profile(profile: SystemProfile) -> str:
+    """
+    Return the system information printed on start.
+    Return Type: str
+    """
+    info = f'{profile.version_info}\n'
+    info += f'Platform: {format_release(profile.release)}, {platform.platform()}'
+
+    if profile.is_flatpak:
+        info += ' (Flatpak)'
+        info += f'\nPlatform: {format_release(profile.host_release)} (Host)'
+
+    info += f'\nDecompressors: {", ".join(profile.decompressors)}'
+
+    return info
+
+
+_system_profile: SystemProfile | None = None
+_system_profile_lock = threading.Lock()
+
+
+def get_system_profile() -> SystemProfile:
+    """
+    Return the system profile, collected once per process. Waits if it is being collected in the background.
+    Return Type: SystemProfile
+    """
+    global _system_profile
+
+    with _system_profile_lock:
+        if _system_profile is None:
+            _system_profile = load_system_profile()
+        return _system_profile
+
+
+def preload_system_profile(callback=lambda profile: None) -> None:
+    """ Collect the system profile in the background and call callback with it (in the background thread) """
+    t = threading.Thread(target=lambda: callback(get_system_profile()), name='preload_system_profile', daemon=True)
+    t.start()
@@ -1,8 +1,10 @@
 import os
+import re
 import sys
+import fcntl
+import tempfile
 import subprocess
 import shutil
-import platform
 import threading
 import webbrowser
 import requests
@@ -10,22 +12,29 @@ import zipfile
 import tarfile
 import pkgutil
 import random
+import unicodedata
+import difflib
+import functools
 
 import zstandard
 
-from configparser import ConfigParser
 from typing import Any, Callable
 
-import PySide6
 from PySide6.QtCore import QCoreApplication
-from PySide6.QtWidgets import QApplication, QComboBox, QStyleFactory, QMessageBox, QCheckBox
+from PySide6.QtWidgets import QApplication, QComboBox, QStyleFactory, QMessageBox, QCheckBox, QListWidget
 
+from pupgui2.cacheutil import ParsedFileCache
+from pupgui2.configutil import get_config_store
 from pupgui2.constants import POSSIBLE_INSTALL_LOCATIONS, CONFIG_FILE, PALETTE_DARK, PALETTE_STEAMUI, TEMP_DIR, IS_FLATPAK
 from pupgui2.constants import AWACY_GAME_LIST_URL, LOCAL_AWACY_GAME_LIST
-from pupgui2.constants import GITHUB_API, GITLAB_API, GITLAB_API_RATELIMIT_TEXT
-from pupgui2.datastructures import BasicCompatTool, CTType, Launcher, SteamApp, LutrisGame, HeroicGame
+from pupgui2.constants import ARCHIVE_CACHE_DEFAULT_SIZE_MB, CTOOL_TRASH_DIR_NAME, CTOOL_STAGING_DIR_NAME
+from pupgui2.constants import GITHUB_API, GITHUB_GRAPHQL_RELEASES_COUNT, GITLAB_API, GITLAB_API_RATELIMIT_TEXT
+from pupgui2.mirrorutil import fetch_json_from_mirror
+from pupgui2.graphqlutil import get_prefetched_releases, get_prefetched_release
+from pupgui2.datastructures import BasicCompatTool, CTType, InstalledCtoolEntry, Launcher, SteamApp, LutrisGame, HeroicGame
 from pupgui2.datastructures import HardwarePlatform
 from pupgui2.steamutil import remove_steamtinkerlaunch, is_valid_steam_install
+from pupgui2.systemprofile import SystemProfile, get_system_profile, format_system_profile
 
 
 def create_msgbox(
@@ -81,6 +90,27 @@ def create_msgbox(
     return msg_box
 
 
+def update_list_widget_texts(list_widget: QListWidget, texts: list[str]) -> None:
+    """
+    Update the items of a QListWidget to show texts, only inserting, removing or renaming the rows that differ.
+    Unchanged rows keep their selection.
+    """
+    old_texts = [list_widget.item(i).text() for i in range(list_widget.count())]
+
+    # Apply from the end, so the indices of the remaining operations stay valid
+    for tag, i1, i2, j1, j2 in reversed(difflib.SequenceMatcher(a=old_texts, b=texts, autojunk=False).get_opcodes()):
+        if tag == 'equal':
+            continue
+
+        for i in reversed(range(i1 + (j2 - j1), i2)):  # rows replaced by fewer new rows
+            list_widget.takeItem(i)
+        for offset, text in enumerate(texts[j1:j2]):
+            if i1 + offset < i2:
+                list_widget.item(i1 + offset).setText(text)
+            else:
+                list_widget.insertItem(i1 + offset, text)
+
+
 def apply_dark_theme(app: QApplication) -> None:
     """
     Apply custom dark mode to Qt application when not using KDE Plasma
@@ -130,7 +160,7 @@ def apply_dark_theme(app: QApplication) -> None:
 
 def read_update_config_value(option: str, value = None, section: str = 'pupgui2', config_file: str = CONFIG_FILE) -> str | None:
     """
-    Uses ConfigParser to read a value with a given option from a given section from a given config file.
+    Read a value with a given option from a given section from a given config file using the shared ConfigStore.
     By default, will read a option and a value from the 'pupgui2' section in CONFIG_FILE path in constants.py.
 
     Args:
@@ -144,23 +174,14 @@ def read_update_config_value(option: str, value = None, section: str = 'pupgui2'
         str | None: The value read from the config file or None if the option does not exist.
     """
 
-    config = ConfigParser()
+    config = get_config_store(config_file)
 
     # Write value if given
     if value != None:  # "!= None" is used to avoid false positives with empty strings
-        config.read(config_file)
-        if not config.has_section(section):
-            config.add_section(section)
-        config[section][option] = value
-        os.makedirs(os.path.dirname(config_file), exist_ok=True)
-
-        with open(config_file, 'w') as cfg:
-            config.write(cfg)
+        config.set(section, option, value)
     # If no value, attempt to read from config
-    elif os.path.exists(config_file):
-        config.read(config_file)
-        if config.has_option(section, option):
-            value = config[section][option]
+    else:
+        value = config.get(section, option)
 
     return value
 
@@ -201,6 +222,28 @@ def config_gitlab_access_token(gitlab_token=None) -> str:
     return read_update_config_value('gitlab_api_token', gitlab_token, section='pupgui2') or ""
 
 
+def config_mirror_url(mirror_url=None) -> str:
+    """
+    Read/update config for the base url of a local mirror (see 'protonup-qt serve-cache'), e.g. http://192.168.1.10:8484
+    """
+
+    return read_update_config_value('mirror_url', mirror_url, section='pupgui2') or ""
+
+
+def config_archive_cache_size(size_mb=None) -> int:
+    """
+    Read/update config for the maximum size of the download archive cache in MB, 0 disables the cache
+    Return Type: int
+    """
+
+    value = read_update_config_value('archive_cache_size_mb', str(size_mb) if size_mb is not None else None, section='pupgui2')
+    try:
+        return max(int(value), 0) if value not in (None, '') else ARCHIVE_CACHE_DEFAULT_SIZE_MB
+    except ValueError:
+        print(f'Warning: Invalid archive_cache_size_mb "{value}", using {ARCHIVE_CACHE_DEFAULT_SIZE_MB}')
+        return ARCHIVE_CACHE_DEFAULT_SIZE_MB
+
+
 def create_compatibilitytools_folder() -> None:
     """
     Create compatibilitytools folder if launcher is installed but compatibilitytools folder doesn't exist
@@ -230,7 +273,7 @@ def is_valid_launcher_installation(loc) -> bool:
     # because Steam can leave behind its directory structure when uninstalled, but not these files.
     #
     # In future we could expand this to other Steam flavours and other launchers.
-    if loc['display_name'] == 'Steam':  # This seems to get called many times, why?
+    if loc['display_name'] == 'Steam':
         # get the parent of the compatibility tools install directory
         # use abspath here as install_dir could be a symlink, https://github.com/DavidoTek/ProtonUp-Qt/pull/381
         launcher_root_dir = os.path.abspath(os.path.join(install_dir, '..'))
@@ -239,11 +282,23 @@ def is_valid_launcher_installation(loc) -> bool:
     return os.path.exists(install_dir)  # Default to path check for all other launchers
 
 
-def available_install_directories() -> list[str]:
+_available_install_directories: list[str] | None = None
+_available_install_directories_lock = threading.Lock()
+
+
+def available_install_directories(cached: bool = True) -> list[str]:
     """
     List available install directories
+    The result is cached until invalidate_available_install_directories() is called or cached=False,
+    e.g. when a launcher is (un)installed or the custom install location changes.
     Return Type: list[str]
     """
+    global _available_install_directories
+
+    with _available_install_directories_lock:
+        if cached and _available_install_directories is not None:
+            return list(_available_install_directories)
+
     available_dirs = []
     for loc in POSSIBLE_INSTALL_LOCATIONS:
         install_dir = os.path.expanduser(loc['install_dir'])
@@ -253,7 +308,54 @@ def available_install_directories() -> list[str]:
     install_dir = config_custom_install_location().get('install_dir')
     if install_dir and os.path.exists(install_dir) and not install_dir in available_dirs:
         available_dirs.append(install_dir)
-    return available_dirs
+
+    with _available_install_directories_lock:
+        _available_install_directories = available_dirs
+    return list(available_dirs)
+
+
+def invalidate_available_install_directories() -> None:
+    """ Forget the cached available_install_directories, they will be searched again on the next call """
+    global _available_install_directories
+
+    with _available_install_directories_lock:
+        _available_install_directories = None
+
+
+def get_install_location_root_dirs() -> list[str]:
+    """
+    List the launcher root directory for each possible install location (e.g. ~/.steam/root for Steam), i.e. the parent of the install directory.
+    Return Type: list[str]
+    """
+    install_dirs = [loc['install_dir'] for loc in POSSIBLE_INSTALL_LOCATIONS]
+    if custom_install_dir := config_custom_install_location().get('install_dir'):
+        install_dirs.append(custom_install_dir)
+
+    root_dirs = []
+    for install_dir in install_dirs:
+        root_dir = os.path.dirname(os.path.normpath(os.path.expanduser(install_dir)))
+        if root_dir not in root_dirs:
+            root_dirs.append(root_dir)
+
+    return root_dirs
+
+
+def get_install_location_watch_dirs() -> list[str]:
+    """
+    List the directories which have to be watched to notice when an install location becomes (un)available:
+    The existing launcher root directories (see get_install_location_root_dirs).
+    Missing ones are not replaced by a parent, directories like ~/.config change all the time. Check them with get_missing_install_location_dirs instead.
+    Return Type: list[str]
+    """
+    return [root_dir for root_dir in get_install_location_root_dirs() if os.path.isdir(root_dir)]
+
+
+def get_missing_install_location_dirs() -> list[str]:
+    """
+    List the launcher root directories which don't exist (yet), see get_install_location_watch_dirs.
+    Return Type: list[str]
+    """
+    return [root_dir for root_dir in get_install_location_root_dirs() if not os.path.isdir(root_dir)]
 
 
 def get_install_location_from_directory_name(install_dir: str) -> dict[str, str]:
@@ -278,30 +380,23 @@ def install_directory(target=None) -> str:
     Write target to config or read from config if target=None
     Return Type: str
     """
-    config = ConfigParser()
+    config = get_config_store()
 
     if target and target.lower() != 'get':
         if target.lower() == 'default':
             target = POSSIBLE_INSTALL_LOCATIONS[0]['install_dir']
         if not target.endswith('/'):
             target += '/'
-        config.read(CONFIG_FILE)
-        if not config.has_section('pupgui'):
-            config.add_section('pupgui')
-        config['pupgui']['installdir'] = target
-        os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-        with open(CONFIG_FILE, 'w') as file:
-            config.write(file)
-    elif os.path.exists(CONFIG_FILE):
-        config.read(CONFIG_FILE)
-        if config.has_option('pupgui', 'installdir'):
-            target = os.path.expanduser(config['pupgui']['installdir'])
-
-    if target in available_install_directories():
+        config.set('pupgui', 'installdir', target)
+    elif config.has_option('pupgui', 'installdir'):
+        target = os.path.expanduser(config.get('pupgui', 'installdir'))
+
+    available_dirs = available_install_directories()
+    if target in available_dirs:
         return target
-    elif len(available_install_directories()) > 0:
-        install_directory(available_install_directories()[0])
-        return available_install_directories()[0]
+    elif len(available_dirs) > 0:
+        install_directory(available_dirs[0])
+        return available_dirs[0]
     return ''
 
 
@@ -312,30 +407,19 @@ def config_custom_install_location(install_dir=None, launcher='', remove=False)
     Return Type: dict
         Contents: 'install_dir', 'display_name' (always ''), 'launcher'
     """
-    config = ConfigParser()
+    config = get_config_store()
 
     if install_dir and launcher and not remove:
-        config.read(CONFIG_FILE)
-        if not config.has_section('pupgui2'):
-            config.add_section('pupgui2')
-        config['pupgui2']['custom_install_dir'] = install_dir
-        config['pupgui2']['custom_install_launcher'] = launcher
-        os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-        with open(CONFIG_FILE, 'w') as file:
-            config.write(file)
-    elif remove and os.path.exists(CONFIG_FILE):
-        config.read(CONFIG_FILE)
-        if config.has_option('pupgui2', 'custom_install_dir'):
-            config.remove_option('pupgui2', 'custom_install_dir')
-        if config.has_option('pupgui2', 'custom_install_launcher'):
-            config.remove_option('pupgui2', 'custom_install_launcher')
-        with open(CONFIG_FILE, 'w') as file:
-            config.write(file)
-    elif os.path.exists(CONFIG_FILE):
-        config.read(CONFIG_FILE)
-        if config.has_option('pupgui2', 'custom_install_dir') and config.has_option('pupgui2', 'custom_install_launcher'):
-            install_dir = config['pupgui2']['custom_install_dir']
-            launcher = config['pupgui2']['custom_install_launcher']
+        config.set('pupgui2', 'custom_install_dir', install_dir)
+        config.set('pupgui2', 'custom_install_launcher', launcher)
+        invalidate_available_install_directories()
+    elif remove:
+        config.remove('pupgui2', 'custom_install_dir')
+        config.remove('pupgui2', 'custom_install_launcher')
+        invalidate_available_install_directories()
+    elif config.has_option('pupgui2', 'custom_install_dir') and config.has_option('pupgui2', 'custom_install_launcher'):
+        install_dir = config.get('pupgui2', 'custom_install_dir')
+        launcher = config.get('pupgui2', 'custom_install_launcher')
 
     if install_dir and not install_dir.endswith('/'):
         install_dir += '/'
@@ -348,20 +432,10 @@ def list_installed_ctools(install_dir: str, without_version=False) -> list[str]:
     Returns the name of the tool and the version from VERSION.txt if without_version=False
     Return Type: list[str]
     """
-    versions_found = []
-
-    if os.path.exists(install_dir):
-        folders = os.listdir(install_dir)
-        for folder in folders:
-            ver_file = os.path.join(install_dir, folder, 'VERSION.txt')
-            if os.path.exists(ver_file) and not without_version:
-                with open(ver_file, 'r') as f:
-                    ver = f.read()
-                versions_found.append(f'{folder} - {ver.strip()}')
-            else:
-                versions_found.append(folder)
-
-    return versions_found
+    return [
+        f'{entry.name} - {entry.version}' if entry.version and not without_version else entry.name
+        for entry in get_ctool_inventory(install_dir)
+    ]
 
 
 def remove_ctool(ver: str, install_dir: str) -> bool:
@@ -385,35 +459,79 @@ def remove_ctool(ver: str, install_dir: str) -> bool:
     return False
 
 
-def sort_compatibility_tool_names(unsorted: list[str], reverse=False) -> list[str]:
+def get_ctool_trash_dir(install_dir: str) -> str:
     """
-    Sort the list of compatibility tools: First sort alphabetically using sorted() then sort by Proton version
-    Return Type: list[str]
+    Return the trash directory for compatibility tools in install_dir.
+    It is next to install_dir, so tools can be moved there with a rename and launchers don't list it as a tool.
+    Return Type: str
     """
-    unsorted = sorted(unsorted)
-    ver_dict = {}
-    for i, ver in enumerate(unsorted, start=1):
-        if ver.startswith('GE-Proton'):
-            ver_dict[100+i] = ver
-        elif 'SteamTinkerLaunch' in ver:
-            ver_dict[100+i] = ver
-        elif 'Proton-' in ver:
-            try:
-                ver_string = ver.split('-')[1]
-                ver_major = int(ver_string.split('.')[0])
-                ver_minor = int(ver_string.split('.')[1])
-                ver_dict[ver_major * 10 + ver_minor] = ver
-            except:
-                ver_dict[i] = ver
-        else:
-            ver_dict[i] = ver
+    return os.path.join(os.path.dirname(os.path.normpath(os.path.expanduser(install_dir))), CTOOL_TRASH_DIR_NAME)
+
+
+def move_ctool_to_trash(ver: str, install_dir: str) -> str:
+    """
+    Move a compatibility tool folder into the trash directory (see get_ctool_trash_dir) with a single rename,
+    so launchers never see a partially removed tool. The returned trash entry still has to be deleted.
+    Returns an empty string if the tool does not exist.
+    Raises: OSError
+    Return Type: str
+    """
+    target = os.path.join(install_dir, ver.split(' - ')[0])
+    if not os.path.exists(target):
+        return ''
+
+    trash_dir = get_ctool_trash_dir(install_dir)
+    os.makedirs(trash_dir, exist_ok=True)
+
+    trash_entry = tempfile.mkdtemp(prefix=f'{os.path.basename(target)}.', dir=trash_dir)
+    try:
+        os.rename(target, os.path.join(trash_entry, os.path.basename(target)))
+    except OSError:
+        os.rmdir(trash_entry)
+        raise
+
+    return trash_entry
 
-    sorted_vers = [ver_dict[v] for v in sorted(ver_dict)]
 
-    if reverse:
-        sorted_vers.reverse()
+_COMMIT_HASH_RE = re.compile(r'(?<![0-9a-z])g?((?=[0-9a-f]*[a-f])(?=[0-9a-f]*[0-9])[0-9a-f]{7,40})(?![0-9a-z])', re.IGNORECASE)  # e.g. '.g0d3f5c1' in tkg builds
+_NUMBER_RE = re.compile(r'(\d+)')
 
-    return sorted_vers
+
+@functools.lru_cache(maxsize=4096)
+def get_compatibility_tool_sort_key(name: str) -> tuple:
+    """
+    Return a natural sort key for a compatibility tool name, e.g. GE-Proton9-5 < GE-Proton10-1.
+    Tools are grouped like this: other tools (e.g. Luxtorpeda, Wine-GE, DXVK), Valve Proton (Proton-x.y), GE-Proton and SteamTinkerLaunch.
+    Numbers are compared by value and commit hashes (tkg builds) as a whole. The name is the last element, so no two names have the same key.
+    Return Type: tuple
+    """
+    if name.startswith('GE-Proton') or 'SteamTinkerLaunch' in name:
+        group = 2
+    elif name.startswith('Proton-') and name[7:8].isdigit():
+        group = 1
+    else:
+        group = 0
+
+    tokens = []
+    for i, part in enumerate(_COMMIT_HASH_RE.split(name)):
+        if i % 2 == 1:  # Commit hash
+            tokens.append((2, 0, part.lower()))
+            continue
+        for j, text in enumerate(_NUMBER_RE.split(part)):
+            if j % 2 == 1:
+                tokens.append((0, int(text), ''))
+            elif text:
+                tokens.append((1, 0, text.lower()))
+
+    return (group, tuple(tokens), name)
+
+
+def sort_compatibility_tool_names(unsorted: list[str], reverse=False) -> list[str]:
+    """
+    Sort the list of compatibility tools by version, see get_compatibility_tool_sort_key
+    Return Type: list[str]
+    """
+    return sorted(unsorted, key=get_compatibility_tool_sort_key, reverse=reverse)
 
 
 def open_webbrowser_thread(url: str) -> None:
@@ -427,39 +545,11 @@ def open_webbrowser_thread(url: str) -> None:
         print(f'Could not open webbrowser url {url}')
 
 
-def print_system_information() -> None:
+def print_system_information(profile: SystemProfile | None = None) -> None:
     """
     Print system information like Python/Qt/OS version to the console
     """
-    # Python and PySide version
-    ver_info = 'Python ' + sys.version.replace('\n', '')
-    ver_info += f', PySide {PySide6.__version__}' + '\n'
-
-    # OS release (or Flatpak runtime)
-    ver_info += 'Platform: '
-    try:
-        with open('/etc/lsb-release') if os.path.exists('/etc/lsb-release') else open('/etc/os-release') as f:
-            l = f.readlines()
-            ver_info += l[0].strip().split('=')[1] + ' ' + l[1].strip().split('=')[1]
-            ver_info = ver_info.replace('"', '')
-    except:
-        pass
-    ver_info += ", " + str(platform.platform())
-
-    # Host OS release if running in Flatpak
-    if IS_FLATPAK:
-        ver_info += " (Flatpak)"
-        ver_info += '\nPlatform: '
-        cmd = ["flatpak-spawn", "--host", "cat", "/etc/os-release"]
-        try:
-            l = subprocess.check_output(cmd).decode("utf-8").splitlines()
-            ver_info += l[0].strip().split('=')[1] + ' ' + l[1].strip().split('=')[1] + ' '
-            ver_info = ver_info.replace('"', '')
-            ver_info += " (Host)"   
-        except Exception as e:
-            print(f"ERROR while calling detect_platform(): {e}")
-
-    print(ver_info)
+    print(format_system_profile(profile or get_system_profile()))
 
 
 def single_instance() -> bool:
@@ -502,6 +592,100 @@ def download_awacy_gamelist() -> None:
     t.start()
 
 
+def read_version_file(path: str) -> str:
+    """
+    Read the version from a compatibility tool VERSION.txt file.
+    Return Type: str
+    """
+    with open(path, 'r') as f:
+        return f.read().strip()
+
+
+version_file_cache = ParsedFileCache(read_version_file)  # VERSION.txt of installed tools, only read again when changed
+
+
+def get_mtime_ns(path: str) -> int:
+    """
+    Return the mtime of path in nanoseconds, or -1 if it does not exist.
+    Return Type: int
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def get_file_stamp(path: str) -> tuple[int, int]:
+    """
+    Return the mtime (ns) and size of a file, e.g. to check whether it was rewritten in place.
+    Return Type: tuple[int, int] ((-1, -1) if the file does not exist)
+    """
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return -1, -1
+
+
+_ctool_inventories: dict[str, tuple[int, tuple[InstalledCtoolEntry, ...], tuple]] = {}  # install dir -> (directory mtime, entries, stamp of each entry)
+_ctool_inventories_lock = threading.Lock()
+
+
+def get_ctool_entry_stamp(install_dir: str, entry: InstalledCtoolEntry) -> tuple[int, int] | int:
+    """
+    Return a value that changes when the version of a tool folder may have changed:
+    The mtime and size of its VERSION.txt, or the mtime of the folder if it has no version (it may still be extracting).
+    Return Type: tuple[int, int] | int
+    """
+    if entry.version:
+        return get_file_stamp(os.path.join(install_dir, entry.name, 'VERSION.txt'))
+    return get_mtime_ns(os.path.join(install_dir, entry.name))
+
+
+def get_ctool_inventory(install_dir: str) -> tuple[InstalledCtoolEntry, ...]:
+    """
+    Return the compatibility tool folders in install_dir with their VERSION.txt, read with a single os.scandir.
+    The inventory is only read again when the mtime of install_dir changes (i.e. when tools are added or removed)
+    or when the version of a folder may have changed (see get_ctool_entry_stamp), e.g. a tool updated in place.
+    Return Type: tuple[InstalledCtoolEntry, ...]
+    """
+    install_dir = os.path.normpath(os.path.expanduser(install_dir))
+    try:
+        mtime = os.stat(install_dir).st_mtime_ns
+    except OSError:
+        return ()
+
+    with _ctool_inventories_lock:
+        cached = _ctool_inventories.get(install_dir)
+
+    if cached and cached[0] == mtime and all(get_ctool_entry_stamp(install_dir, entry) == stamp for entry, stamp in zip(cached[1], cached[2])):
+        return cached[1]
+
+    entries = []
+    try:
+        with os.scandir(install_dir) as it:
+            for dir_entry in it:
+                try:
+                    if not dir_entry.is_dir():
+                        continue
+                    folder_mtime = dir_entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+
+                version = version_file_cache.get(os.path.join(dir_entry.path, 'VERSION.txt'), '')
+                entries.append(InstalledCtoolEntry(dir_entry.name, version, CTType.CUSTOM, folder_mtime))
+    except OSError as e:
+        print(f'Warning: Could not list compatibility tools in {install_dir}: {e}')
+        return ()
+
+    inventory = tuple(entries)
+    stamps = tuple(get_ctool_entry_stamp(install_dir, entry) if entry.version else entry.mtime for entry in inventory)
+    with _ctool_inventories_lock:
+        _ctool_inventories[install_dir] = (mtime, inventory, stamps)
+
+    return inventory
+
+
 def get_installed_ctools(install_dir: str) -> list[BasicCompatTool]:
     """
     Returns installed compatibility tools sorted after name/version
@@ -509,34 +693,90 @@ def get_installed_ctools(install_dir: str) -> list[BasicCompatTool]:
     """
     ctools = []
 
-    if os.path.exists(install_dir):
-        folders = os.listdir(install_dir)
-        folders = sort_compatibility_tool_names(folders)
-        for folder in folders:
-            if not os.path.isdir(os.path.join(install_dir, folder)):
-                continue
-            
-            ct = BasicCompatTool(folder, install_dir, folder, ct_type=CTType.CUSTOM)
-
-            ver_file = os.path.join(install_dir, folder, 'VERSION.txt')
-            if os.path.exists(ver_file):
-                with open(ver_file, 'r') as f:
-                    ver = f.read().strip()
-                    ct.set_version(ver)
+    entries = {entry.name: entry for entry in get_ctool_inventory(install_dir)}
+    for folder in sort_compatibility_tool_names(list(entries)):
+        entry = entries[folder]
+        ct = BasicCompatTool(folder, install_dir, folder, ct_type=entry.ct_type)
+        if entry.version:
+            ct.set_version(entry.version)
 
-            ctools.append(ct)
+        ctools.append(ct)
 
     return ctools
 
 
+# Prints one line per argument: the path of an executable ('w:name') or 1/0 whether a file ('f:path') or directory ('d:path') exists
+_HOST_PROBE_SCRIPT = '''
+for arg in "$@"; do
+    value="${arg#?:}"
+    case "$arg" in
+        w:*) printf '%s\\n' "$(command -v -- "$value" 2>/dev/null)" ;;
+        f:*) if [ -f "$value" ]; then echo 1; else echo 0; fi ;;
+        d:*) if [ -d "$value" ]; then echo 1; else echo 0; fi ;;
+        *) echo ;;
+    esac
+done
+'''
+
+_host_which_cache: dict[str, str | None] = {}  # Executables on the host do not change while ProtonUp-Qt is running
+_host_which_cache_lock = threading.Lock()
+
+
+def run_host_probe(executables: list[str], paths: list[tuple[str, bool]], proc_prefix: list[str] | None = None) -> tuple[dict[str, str | None], dict[str, bool]]:
+    """
+    Look up executables and check paths on the host system with a single process (using 'flatpak-spawn --host' when inside Flatpak).
+    paths is a list of (path, is_file) tuples, is_file=False checks for a directory.
+    Return Type: tuple[dict[str, str | None], dict[str, bool]] (executable -> path or None, path -> exists)
+    """
+    if proc_prefix is None:
+        proc_prefix = ['flatpak-spawn', '--host'] if IS_FLATPAK else []
+
+    args = [f'w:{name}' for name in executables] + [f'{"f" if is_file else "d"}:{path}' for path, is_file in paths]
+    if not args:
+        return {}, {}
+
+    try:
+        stdout = subprocess.run(proc_prefix + ['sh', '-c', _HOST_PROBE_SCRIPT, 'sh'] + args, universal_newlines=True, stdout=subprocess.PIPE).stdout
+    except OSError as e:
+        print(f'Warning: Could not run host probe: {e}')
+        stdout = ''
+
+    lines = stdout.split('\n')
+    lines += [''] * (len(args) - len(lines))
+
+    found_executables = {name: lines[i].strip() or None for i, name in enumerate(executables)}
+    existing_paths = {path: lines[len(executables) + i].strip() == '1' for i, (path, _) in enumerate(paths)}
+
+    return found_executables, existing_paths
+
+
+def host_which_all(names: list[str]) -> dict[str, str | None]:
+    """
+    Look up multiple executables on the host system at once, the results are cached for the session.
+    Return Type: dict[str, str | None] (name -> path of the executable or None)
+    """
+    with _host_which_cache_lock:
+        missing = [name for name in dict.fromkeys(names) if name not in _host_which_cache]
+
+    if missing:
+        if IS_FLATPAK:
+            found, _ = run_host_probe(missing, [])
+        else:
+            found = {name: shutil.which(name) for name in missing}
+
+        with _host_which_cache_lock:
+            _host_which_cache.update(found)
+
+    with _host_which_cache_lock:
+        return {name: _host_which_cache.get(name) for name in names}
+
+
 def host_which(name: str) -> str:
     """
     Runs 'which <name>' on the host system (either normal or using 'flatpak-spawn --host' when inside Flatpak)
     Return Type: str
     """
-    proc_prefix = ['flatpak-spawn', '--host'] if IS_FLATPAK else []
-    which = subprocess.run(proc_prefix + ['which', name], universal_newlines=True, stdout=subprocess.PIPE).stdout.strip()
-    return None if which == '' else which
+    return host_which_all([name])[name]
 
 
 def host_path_exists(path: str, is_file: bool) -> bool:
@@ -552,10 +792,11 @@ def host_path_exists(path: str, is_file: bool) -> bool:
     Return Type: bool
     """
     path = os.path.expanduser(path)
-    proc_prefix = 'flatpak-spawn --host' if IS_FLATPAK else ''
-    parameter = 'f' if is_file else 'd'  # check file using -f and directory using -d
-    ret = os.system(proc_prefix + ' bash -c \'if [ -' + parameter + ' "' + path + '" ]; then exit 1; else exit 0; fi\'')
-    return bool(ret) 
+    if not IS_FLATPAK:
+        return os.path.isfile(path) if is_file else os.path.isdir(path)
+
+    _, existing_paths = run_host_probe([], [(path, is_file)])
+    return existing_paths[path]
 
 
 def ghapi_rlcheck(json: dict):
@@ -619,7 +860,12 @@ def fetch_project_releases(releases_url: str, rs: requests.Session, count: int =
     releases: dict = {}
     tag_key: str = ''
     if GITHUB_API in releases_url:
-        releases = ghapi_rlcheck(rs.get(releases_api_url).json())
+        # Releases may have been fetched for several projects at once using the GraphQL API
+        prefetched_releases = get_prefetched_releases(releases_url) if page == 1 else None
+        if prefetched_releases is not None and (count <= len(prefetched_releases) or len(prefetched_releases) < GITHUB_GRAPHQL_RELEASES_COUNT):
+            releases = prefetched_releases[:count]
+        else:
+            releases = ghapi_rlcheck(rs.get(releases_api_url).json())
         tag_key = 'tag_name'
     elif is_gitlab_instance(releases_url):
         releases = glapi_rlcheck(rs.get(releases_api_url).json())
@@ -702,7 +948,9 @@ def fetch_project_release_data(release_url: str, release_format: str, rs: reques
     else:
         return {}  # Unknown API, cannot fetch data!
 
-    release: dict = rs.get(url).json()
+    release: dict | None = get_prefetched_release(release_url, tag) if GITHUB_API in release_url else None
+    if release is None:
+        release = fetch_json_from_mirror(url, config_mirror_url()) or rs.get(url).json()
     values: dict = { 'version': release['tag_name'], 'date': release[date_key].split('T')[0] }
 
     for asset in get_assets_from_release(release_url, release):
@@ -810,6 +1058,118 @@ def write_tool_version(tool_dir: str, version: str):
         f.write(f'{version}\n')
 
 
+FICLONE = 0x40049409  # ioctl to reflink a file, see ioctl_ficlone(2)
+
+
+def clone_file(src: str, dst: str, *args, **kwargs) -> str:
+
+    """
+    Create dst with the content of src as cheap as possible: As reflink (copy-on-write, e.g. Btrfs/XFS),
+    or as a regular copy if that is not supported or src and dst are on different file systems.
+    Never hardlinks, the copies of a tool in different launchers must not change when one of them is modified.
+    Can be used as copy_function for shutil.copytree.
+
+    Return Type: str
+    """
+
+    try:
+        with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+        shutil.copystat(src, dst)
+        return dst
+    except OSError:
+        if os.path.lexists(dst):
+            os.remove(dst)
+
+    return shutil.copy2(src, dst)
+
+
+def materialize_tree(src: str, dst: str) -> bool:
+
+    """
+    Recreate the file or directory src at dst using clone_file, replacing dst if it exists.
+
+    Return Type: bool
+    """
+
+    remove_if_exists(dst)
+    try:
+        if os.path.isdir(src) and not os.path.islink(src):
+            shutil.copytree(src, dst, symlinks=True, copy_function=clone_file)
+        elif os.path.islink(src):
+            os.symlink(os.readlink(src), dst)
+        else:
+            clone_file(src, dst)
+        return True
+    except (OSError, shutil.Error) as e:
+        print(f'Could not install {src} to {dst}: {e}')
+        return False
+
+
+def get_ctool_staging_dir(install_dir: str) -> str:
+    """
+    Return the staging directory for compatibility tools installed to install_dir and other locations.
+    It is next to install_dir, so the staged files are on the same file system and can be reflinked, and launchers don't list it as a tool.
+    Return Type: str
+    """
+    return os.path.join(os.path.dirname(os.path.normpath(os.path.expanduser(install_dir))), CTOOL_STAGING_DIR_NAME)
+
+
+def install_tool_to_locations(installer, version: str, install_dirs: list[str], temp_dir: str, staging_dir: str = '') -> bool:
+
+    """
+    Install a compatibility tool into several install directories (e.g. Steam and Heroic) with a single download and extraction.
+    The tool is installed into a staging directory (see get_ctool_staging_dir) that mirrors the first install directory,
+    and the installed files are then reflinked/copied into each install directory (see get_extract_dir of the ctmods).
+    If the tool installs anything outside of its extract directory, it is installed into each directory separately instead.
+
+    Return Type: bool
+    """
+
+    install_dirs = [os.path.expanduser(install_dir) for install_dir in install_dirs]
+    get_extract_dir = getattr(installer, 'get_extract_dir', lambda install_dir: install_dir)
+
+    staging_dir = staging_dir or get_ctool_staging_dir(install_dirs[0])
+    os.makedirs(staging_dir, exist_ok=True)
+    staging_root = tempfile.mkdtemp(dir=staging_dir)
+    try:
+        staged_install_dir = os.path.join(staging_root, os.path.abspath(install_dirs[0]).lstrip(os.sep))
+        os.makedirs(staged_install_dir)
+
+        installer.get_tool(version, staged_install_dir, temp_dir)
+
+        staged_extract_dir = os.path.normpath(get_extract_dir(staged_install_dir))
+        staged_entries = os.listdir(staged_extract_dir) if os.path.isdir(staged_extract_dir) else []
+        staged_outside = [
+            os.path.join(root, f) for root, _, files in os.walk(staging_root) for f in files
+            if os.path.commonpath([staged_extract_dir, os.path.join(root, f)]) != staged_extract_dir
+        ]
+
+        if not staged_entries and not staged_outside:
+            return False  # Installation failed or was cancelled
+
+        if staged_outside:
+            print(f'Could not stage {version}, installing it to each location separately')
+            for install_dir in install_dirs:
+                installer.get_tool(version, install_dir, temp_dir)
+            return True
+
+        success = True
+        for install_dir in install_dirs:
+            extract_dir = get_extract_dir(install_dir)
+            os.makedirs(extract_dir, exist_ok=True)
+            for entry in staged_entries:
+                success = materialize_tree(os.path.join(staged_extract_dir, entry), os.path.join(extract_dir, entry)) and success
+
+        return success
+    finally:
+        shutil.rmtree(staging_root, ignore_errors=True)
+        try:
+            os.rmdir(staging_dir)  # Only removed if no other installation is using it
+        except OSError:
+            pass
+
+
 ## Extraction utility methods ##
 
 
@@ -938,7 +1298,8 @@ def create_missing_dependencies_message(ct_name: str, dependencies: list[str]) -
     Return Type: tuple[str, bool]
     """
 
-    deps_found = [ host_which(dep) for dep in dependencies ]
+    found_executables = host_which_all(dependencies)
+    deps_found = [ found_executables[dep] for dep in dependencies ]
 
     if all(deps_found):
         return '', True
@@ -973,6 +1334,20 @@ def get_random_game_name(games: list[SteamApp] | list[LutrisGame] | list[HeroicG
     return str(tooltip_game_name)
 
 
+def normalize_search_text(text: str) -> str:
+    """
+    Normalize text for searching game lists: case-insensitive and ignoring accents, e.g. 'Pokémon' -> 'pokemon'.
+    Return Type: str
+    """
+
+    text = str(text or '')
+    if text.isascii():
+        return text.lower()
+
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
 def detect_platform() -> HardwarePlatform:
     """
     Detects the (hardware) platform the application is running on.
@@ -982,21 +1357,4 @@ def detect_platform() -> HardwarePlatform:
         HardwarePlatform: The platform (Enum)
     """
 
-    os_release_content = ""
-
-    # Detect SteamOS: https://github.com/sonic2kk/steamtinkerlaunch/wiki/Steam-Deck#setup
-    if IS_FLATPAK:
-        cmd = ["flatpak-spawn", "--host", "cat", "/etc/os-release"]
-        try:
-            os_release_content = subprocess.check_output(cmd).decode("utf-8")
-        except Exception as e:
-            print(f"ERROR while calling detect_platform(): {e}")
-    else:
-        if os.path.isfile("/etc/os-release"):
-            with open("/etc/os-release") as f:
-                os_release_content = f.read()
-
-    if "steamdeck" in os_release_content:
-        return HardwarePlatform.STEAM_DECK
-
-    return HardwarePlatform.DESKTOP
+    return get_system_profile().platform
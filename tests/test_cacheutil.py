@@ -0,0 +1,146 @@
+import os
+import json
+
+from pytest_mock import MockerFixture
+
+from pupgui2.cacheutil import JsonFileCache, ArchiveCache, DirectoryIndex
+
+
+def test_json_file_cache_persists(tmp_path) -> None:
+
+    """
+    Test that values written to a JsonFileCache can be read back by a new cache instance using the same file.
+    """
+
+    cache_file: str = os.path.join(tmp_path, 'cache', 'summaries.json')
+
+    cache = JsonFileCache(cache_file)
+    cache.set('620', {'tier': 'platinum'})
+
+    assert cache.get('620') == {'tier': 'platinum'}
+    assert not os.path.exists(cache_file)  # Only written on save()
+
+    assert cache.save()
+    assert os.path.isfile(cache_file)
+
+    result = JsonFileCache(cache_file).get('620')
+
+    assert result == {'tier': 'platinum'}
+
+
+def test_json_file_cache_ttl(tmp_path, mocker: MockerFixture) -> None:
+
+    """
+    Test that entries of a JsonFileCache expire after the ttl and are not written to disk anymore.
+    """
+
+    cache_file: str = os.path.join(tmp_path, 'summaries.json')
+
+    time_mock = mocker.patch('pupgui2.cacheutil.time.time')
+    time_mock.return_value = 1000.0
+
+    cache = JsonFileCache(cache_file, ttl=60)
+    cache.set('620', 'gold')
+    cache.set(730, 'silver')
+    cache.set('570', {}, ttl=3600)  # Entries can outlive the ttl of the cache
+
+    assert cache.get('620') == 'gold'
+    assert cache.get('730') == 'silver'
+
+    time_mock.return_value = 1061.0
+    cache.set('440', 'platinum')
+
+    assert cache.get('620') is None
+    assert cache.get('620', 'default') == 'default'
+    assert cache.get('440') == 'platinum'
+    assert cache.get('570') == {}
+
+    cache.save()
+    with open(cache_file, 'r') as f:
+        assert sorted(json.load(f).keys()) == ['440', '570']
+
+
+def test_json_file_cache_invalid_file(tmp_path) -> None:
+
+    """
+    Test that a JsonFileCache starts empty if the cache file is not valid JSON.
+    """
+
+    cache_file: str = os.path.join(tmp_path, 'summaries.json')
+    with open(cache_file, 'w') as f:
+        f.write('{ not json')
+
+    cache = JsonFileCache(cache_file)
+
+    assert cache.get('620') is None
+
+
+def test_archive_cache_lru_eviction(tmp_path) -> None:
+
+    """
+    Test that an ArchiveCache finds archives by url and checksum and removes the least recently used archives when it is full.
+    """
+
+    cache = ArchiveCache(os.path.join(tmp_path, 'archives'), max_size=25)
+
+    for i, version in enumerate(['9-3', '9-4', '9-5']):
+        url: str = f'https://github.com/releases/download/GE-Proton{version}.tar.gz'
+        archive: str = os.path.join(tmp_path, f'GE-Proton{version}.tar.gz')
+        with open(archive, 'wb') as f:
+            f.write(b'0123456789')
+
+        assert cache.put(url, archive)
+        os.utime(cache.get_cache_path(url), (i, i))
+
+        if version == '9-4':
+            cache.get('https://github.com/releases/download/GE-Proton9-3.tar.gz')  # 9-3 is now used more recently than 9-4
+
+    assert cache.get('https://github.com/releases/download/GE-Proton9-3.tar.gz') is not None
+    assert cache.get('https://github.com/releases/download/GE-Proton9-4.tar.gz') is None
+    assert cache.get('https://github.com/releases/download/GE-Proton9-5.tar.gz') is not None
+
+    assert cache.get('https://github.com/releases/download/GE-Proton9-5.tar.gz', checksum='abc') is None  # Different checksum
+    assert os.path.basename(cache.get_cache_path('https://github.com/releases/download/GE-Proton9-5.tar.gz')).endswith('-GE-Proton9-5.tar.gz')
+
+
+def test_archive_cache_too_large(tmp_path) -> None:
+
+    """
+    Test that an ArchiveCache does not store archives larger than the cache.
+    """
+
+    archive: str = os.path.join(tmp_path, 'archive.tar.gz')
+    with open(archive, 'wb') as f:
+        f.write(b'0123456789')
+
+    assert not ArchiveCache(os.path.join(tmp_path, 'archives'), max_size=5).put('https://github.com/archive.tar.gz', archive)
+    assert not ArchiveCache(os.path.join(tmp_path, 'archives'), max_size=0).put('https://github.com/archive.tar.gz', archive)
+    assert not os.path.exists(os.path.join(tmp_path, 'archives'))
+
+
+def test_directory_index_refresh(tmp_path, mocker: MockerFixture) -> None:
+
+    """
+    Test that a DirectoryIndex only parses new and changed files again when it is refreshed.
+    """
+
+    for name, content in [('a.json', {'a': 1}), ('b.json', {'b': 2}), ('ignored.txt', {})]:
+        with open(os.path.join(tmp_path, name), 'w') as f:
+            json.dump(content, f)
+
+    load_file = mocker.Mock(side_effect=lambda path: json.load(open(path)))
+    index = DirectoryIndex('.json', load_file)
+
+    assert index.get(str(tmp_path)) == {'a.json': {'a': 1}, 'b.json': {'b': 2}}
+    assert load_file.call_count == 2
+
+    with open(os.path.join(tmp_path, 'b.json'), 'w') as f:
+        json.dump({'b': 20}, f)
+    os.utime(os.path.join(tmp_path, 'b.json'), ns=(1, 1))
+    os.remove(os.path.join(tmp_path, 'a.json'))
+
+    assert index.get(str(tmp_path)) == {'a.json': {'a': 1}, 'b.json': {'b': 2}}  # Cached
+    assert index.get(str(tmp_path), cached=False) == {'b.json': {'b': 20}}
+    assert load_file.call_count == 3
+
+    assert index.get(os.path.join(tmp_path, 'missing')) == {}
@@ -0,0 +1,92 @@
+import os
+
+import requests
+import pytest_responses
+
+from responses import RequestsMock, matchers
+
+from pytest_mock import MockerFixture
+
+from pupgui2.cacheutil import JsonFileCache
+from pupgui2.ciutil import fetch_successful_workflow_runs, get_workflow_run_artifacts
+
+
+workflows_url: str = 'https://api.github.com/repos/Frogging-Family/wine-tkg-git/actions/workflows'
+
+
+def test_fetch_successful_workflow_runs(responses: RequestsMock, mocker: MockerFixture) -> None:
+
+    """
+    Test that fetch_successful_workflow_runs only asks GitHub for successful runs of the matching, active workflows.
+    """
+
+    mocker.patch('pupgui2.ciutil._workflows_cache', {})
+
+    responses.get(workflows_url, json={
+        'workflows': [
+            {'path': '.github/workflows/proton-arch-nopackage.yml', 'state': 'active', 'url': f'{workflows_url}/1'},
+            {'path': '.github/workflows/proton-valvexbe-arch-nopackage.yml', 'state': 'active', 'url': f'{workflows_url}/2'},
+            {'path': '.github/workflows/proton-valvexbe-arch-nopackage-old.yml', 'state': 'disabled_manually', 'url': f'{workflows_url}/3'},
+        ]
+    })
+
+    runs_mock = responses.get(
+        f'{workflows_url}/2/runs',
+        match=[matchers.query_param_matcher({'status': 'success', 'branch': 'master', 'per_page': '30'})],
+        json={'workflow_runs': [{'id': 1002, 'conclusion': 'success'}, {'id': 1001, 'conclusion': 'success'}]}
+    )
+
+    result: list[dict] = fetch_successful_workflow_runs(requests.Session(), workflows_url, 'proton-valvexbe-arch-nopackage', branch='master')
+
+    assert [run['id'] for run in result] == [1002, 1001]
+    assert runs_mock.call_count == 1
+
+    # The workflow list is reused by other ctmods for the same repository
+    fetch_successful_workflow_runs(requests.Session(), workflows_url, 'proton-valvexbe-arch-nopackage', branch='master')
+    assert responses.assert_call_count(f'{workflows_url}?per_page=100', 1)
+
+
+def test_get_workflow_run_artifacts(responses: RequestsMock, mocker: MockerFixture, tmp_path) -> None:
+
+    """
+    Test that get_workflow_run_artifacts stores the artifacts of a run on disk and does not request them again.
+    """
+
+    cache_file: str = os.path.join(tmp_path, 'ci_artifacts.json')
+    mocker.patch('pupgui2.ciutil._artifact_cache', JsonFileCache(cache_file))
+
+    artifacts_url: str = 'https://api.github.com/repos/Frogging-Family/wine-tkg-git/actions/runs/1002/artifacts'
+    artifacts_mock = responses.get(artifacts_url, json={
+        'total_count': 1,
+        'artifacts': [{
+            'id': 5, 'name': 'proton-tkg-build', 'size_in_bytes': 1234, 'updated_at': '2024-05-01T10:00:00Z', 'expired': False,
+            'archive_download_url': 'https://api.github.com/...', 'workflow_run': {'id': 1002, 'head_sha': 'abcdef1234', 'head_branch': 'master', 'repository_id': 1},
+        }]
+    })
+
+    result: list[dict] | None = get_workflow_run_artifacts(requests.Session(), artifacts_url)
+
+    assert result == [{
+        'id': 5, 'name': 'proton-tkg-build', 'size_in_bytes': 1234, 'updated_at': '2024-05-01T10:00:00Z', 'expired': False,
+        'workflow_run': {'id': 1002, 'head_sha': 'abcdef1234', 'head_branch': 'master'},
+    }]
+    assert os.path.isfile(cache_file)
+
+    assert get_workflow_run_artifacts(requests.Session(), artifacts_url) == result
+    assert artifacts_mock.call_count == 1
+
+
+def test_get_workflow_run_artifacts_not_found(responses: RequestsMock, mocker: MockerFixture, tmp_path) -> None:
+
+    """
+    Test that get_workflow_run_artifacts returns None and caches nothing if the run does not exist.
+    """
+
+    mocker.patch('pupgui2.ciutil._artifact_cache', JsonFileCache(os.path.join(tmp_path, 'ci_artifacts.json')))
+
+    artifacts_url: str = 'https://api.github.com/repos/Frogging-Family/wine-tkg-git/actions/runs/1/artifacts'
+    artifacts_mock = responses.get(artifacts_url, status=404, json={'message': 'Not Found'})
+
+    assert get_workflow_run_artifacts(requests.Session(), artifacts_url) is None
+    assert get_workflow_run_artifacts(requests.Session(), artifacts_url) is None
+    assert artifacts_mock.call_count == 2
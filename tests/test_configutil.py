@@ -0,0 +1,66 @@
+import os
+
+from configparser import ConfigParser
+
+from pupgui2.configutil import ConfigStore
+
+
+def test_config_store_set_and_save(tmp_path) -> None:
+
+    """
+    Test that changes to a ConfigStore are visible right away but only written to disk on save().
+    """
+
+    config_file: str = os.path.join(tmp_path, 'pupgui', 'config.ini')
+
+    config = ConfigStore(config_file, save_delay=60)
+    config.set('pupgui2', 'theme', 'dark')
+    config.set('pupgui', 'installdir', '/home/user/.steam/root/compatibilitytools.d/')
+
+    assert config.get('pupgui2', 'theme') == 'dark'
+    assert not os.path.exists(config_file)
+
+    assert config.save()
+
+    parser = ConfigParser()
+    parser.read(config_file)
+
+    assert parser['pupgui2']['theme'] == 'dark'
+    assert parser['pupgui']['installdir'] == '/home/user/.steam/root/compatibilitytools.d/'
+    assert not os.path.exists(f'{config_file}.tmp')
+
+    config.remove('pupgui2', 'theme')
+    config.save()
+
+    assert ConfigStore(config_file).get('pupgui2', 'theme', 'light') == 'light'
+
+
+def test_config_store_external_change(tmp_path) -> None:
+
+    """
+    Test that a ConfigStore picks up changes made to the config file by someone else, without losing unsaved changes.
+    """
+
+    config_file: str = os.path.join(tmp_path, 'config.ini')
+    with open(config_file, 'w') as f:
+        f.write('[pupgui2]\ntheme = light\n')
+
+    config = ConfigStore(config_file, save_delay=60)
+
+    assert config.get('pupgui2', 'theme') == 'light'
+
+    config.set('pupgui2', 'advancedmode', 'enabled')
+
+    with open(config_file, 'w') as f:
+        f.write('[pupgui2]\ntheme = steam\n')
+    os.utime(config_file, ns=(0, 0))  # Make sure the modification time differs
+
+    assert config.get('pupgui2', 'theme') == 'steam'
+    assert config.get('pupgui2', 'advancedmode') == 'enabled'
+
+    config.save()
+
+    parser = ConfigParser()
+    parser.read(config_file)
+
+    assert dict(parser['pupgui2']) == {'theme': 'steam', 'advancedmode': 'enabled'}
@@ -0,0 +1,90 @@
+import os
+import time
+
+from pupgui2.ctoolremovalworker import *
+from pupgui2.util import move_ctool_to_trash, get_ctool_trash_dir
+
+
+def create_tool(install_dir: str, name: str) -> str:
+
+    tool_dir: str = os.path.join(install_dir, name)
+    os.makedirs(os.path.join(tool_dir, 'files', 'bin'))
+    with open(os.path.join(tool_dir, 'files', 'bin', 'wine'), 'w') as f:
+        f.write('wine')
+    os.symlink('wine', os.path.join(tool_dir, 'files', 'bin', 'wine64'))
+
+    return tool_dir
+
+
+def wait_for_worker(worker: CtoolRemovalWorker, timeout: float = 10) -> None:
+
+    end_time: float = time.monotonic() + timeout
+    while worker.is_running() and time.monotonic() < end_time:
+        time.sleep(0.01)
+
+
+def test_ctool_removal_worker(tmp_path) -> None:
+
+    """
+    Test that trashed tools and leftovers of earlier removals are deleted by CtoolRemovalWorker.
+    """
+
+    install_dir: str = os.path.join(tmp_path, 'compatibilitytools.d')
+    create_tool(install_dir, 'GE-Proton9-4')
+    tool_dir: str = create_tool(install_dir, 'GE-Proton9-5')
+
+    leftover_entry: str = move_ctool_to_trash('GE-Proton9-4', install_dir)
+    trash_entry: str = move_ctool_to_trash('GE-Proton9-5', install_dir)
+
+    assert os.listdir(install_dir) == []
+    assert os.path.dirname(trash_entry) == get_ctool_trash_dir(install_dir) == os.path.join(tmp_path, CTOOL_TRASH_DIR_NAME)
+    assert os.path.isfile(os.path.join(trash_entry, 'GE-Proton9-5', 'files', 'bin', 'wine'))
+
+    worker = CtoolRemovalWorker()
+    worker.remove([TrashedCtool(trash_entry, tool_dir)])
+    wait_for_worker(worker)
+
+    assert not worker.is_running()
+    assert not os.path.exists(trash_entry)
+    assert not os.path.exists(leftover_entry)
+
+
+def test_ctool_removal_worker_cancel(tmp_path) -> None:
+
+    """
+    Test that cancelling CtoolRemovalWorker leaves tools which were not deleted yet in the trash, and that purge deletes them.
+    """
+
+    install_dir: str = os.path.join(tmp_path, 'compatibilitytools.d')
+    tool_dir: str = create_tool(install_dir, 'GE-Proton9-5')
+    trashed_ctool = TrashedCtool(move_ctool_to_trash('GE-Proton9-5', install_dir), tool_dir)
+
+    worker = CtoolRemovalWorker()
+    worker._queue.append(trashed_ctool)  # Queued, but not started yet
+
+    assert worker.cancel() == [trashed_ctool.trash_entry]
+    assert not os.path.exists(tool_dir)
+    assert os.path.isfile(os.path.join(trashed_ctool.trash_entry, 'GE-Proton9-5', 'files', 'bin', 'wine'))
+
+    # Next start
+    worker = CtoolRemovalWorker()
+    worker.purge([get_ctool_trash_dir(install_dir), os.path.join(tmp_path, 'missing', CTOOL_TRASH_DIR_NAME)])
+    wait_for_worker(worker)
+
+    assert not worker.is_running()
+    assert os.listdir(get_ctool_trash_dir(install_dir)) == []
+
+
+def test_delete_tree(tmp_path) -> None:
+
+    """
+    Test that delete_tree deletes a tree with symlinks and reports the number of deleted entries.
+    """
+
+    tool_dir: str = create_tool(str(tmp_path), 'GE-Proton9-5')
+    progress: list[int] = []
+
+    delete_tree(tool_dir, progress.append)
+
+    assert not os.path.exists(tool_dir)
+    assert progress[-1] == 4  # files, bin, wine, wine64
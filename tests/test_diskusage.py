@@ -0,0 +1,89 @@
+import os
+
+from pupgui2.datastructures import BasicCompatTool, CTType
+from pupgui2.diskusage import *
+
+
+def create_tool(install_dir: str, name: str, content: bytes = b'wine' * 4096) -> str:
+
+    tool_dir: str = os.path.join(install_dir, name)
+    os.makedirs(os.path.join(tool_dir, 'files', 'bin'))
+    with open(os.path.join(tool_dir, 'files', 'bin', 'wine'), 'wb') as f:
+        f.write(content)
+    os.symlink('wine', os.path.join(tool_dir, 'files', 'bin', 'wine64'))
+
+    return tool_dir
+
+
+def test_scan_disk_usage_hardlinks(tmp_path) -> None:
+
+    """
+    Test that hardlinked files are counted once and only reclaimable when all of their links are removed.
+    """
+
+    tool_dir: str = create_tool(str(tmp_path), 'GE-Proton9-5')
+    other_tool_dir: str = create_tool(str(tmp_path), 'GE-Proton9-4')
+    os.link(os.path.join(tool_dir, 'files', 'bin', 'wine'), os.path.join(tool_dir, 'files', 'wine'))
+    os.link(os.path.join(tool_dir, 'files', 'bin', 'wine'), os.path.join(other_tool_dir, 'files', 'wine'))
+
+    usage: DiskUsage = scan_disk_usage(tool_dir)
+    other_usage: DiskUsage = scan_disk_usage(other_tool_dir)
+    wine_size: int = get_used_bytes(os.stat(os.path.join(tool_dir, 'files', 'bin', 'wine')))
+
+    assert list(usage.linked_files.values()) == [(wine_size, 3, 2)]
+    assert usage.get_total_size() == usage.size + wine_size
+    assert get_reclaimable_size([usage]) == usage.size
+    assert get_reclaimable_size([usage, other_usage]) == usage.size + other_usage.size + wine_size
+
+
+def test_get_disk_usage_cache(tmp_path) -> None:
+
+    """
+    Test that get_disk_usage only scans a tool again when the mtime of its directory changes.
+    """
+
+    tool_dir: str = create_tool(str(tmp_path), 'GE-Proton9-5')
+
+    usage: DiskUsage = get_disk_usage(tool_dir)
+    assert get_disk_usage(tool_dir) is usage
+    assert get_disk_usages([tool_dir, str(tmp_path)])[tool_dir] is usage
+
+    with open(os.path.join(tool_dir, 'VERSION.txt'), 'w') as f:
+        f.write('GE-Proton9-5')
+    os.utime(tool_dir, ns=(1, 1))
+
+    assert get_disk_usage(tool_dir) is not usage
+
+
+def test_create_reclaim_plan(tmp_path) -> None:
+
+    """
+    Test that create_reclaim_plan only includes unused tools which are not global and sums up their disk usage.
+    """
+
+    install_dir: str = str(tmp_path)
+    ctools: list[BasicCompatTool] = []
+    for name, no_games, is_global in [('GE-Proton9-5', 2, False), ('GE-Proton9-4', 0, False), ('GE-Proton9-3', 0, True), ('Luxtorpeda', -1, False)]:
+        create_tool(install_dir, name)
+        ct = BasicCompatTool(name, install_dir, name, CTType.CUSTOM)
+        ct.no_games = no_games
+        ct.set_global(is_global)
+        ctools.append(ct)
+
+    plan: ReclaimPlan = create_reclaim_plan(install_dir, ctools)
+
+    assert [ct.displayname for ct in plan.ctools] == ['GE-Proton9-4']
+    assert plan.size == scan_disk_usage(os.path.join(install_dir, 'GE-Proton9-4')).get_total_size()
+    assert plan.install_dir == install_dir
+
+
+def test_format_size() -> None:
+
+    """
+    Test that format_size uses the largest fitting unit up to GB.
+    """
+
+    assert format_size(512) == '512 B'
+    assert format_size(1536) == '1.5 KB'
+    assert format_size(3 * 1024 ** 3) == '3.0 GB'
+    assert format_size(2048 * 1024 ** 3) == '2048.0 GB'
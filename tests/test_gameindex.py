@@ -0,0 +1,89 @@
+import os
+import json
+
+from pupgui2.datastructures import BasicCompatTool, CTType, HeroicGame
+from pupgui2.gameindex import *
+
+
+def write_json(path: str, content: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(content, f)
+
+
+def create_heroic_dir(heroic_path: str) -> dict[str, str]:
+
+    """
+    Create a Heroic config directory with two installed sideloaded games using different Wine versions.
+    Return the install location for it.
+    """
+
+    write_json(os.path.join(heroic_path, 'sideload_apps', 'library.json'), {'games': [
+        {'runner': 'sideload', 'app_name': 'osu', 'title': 'osu!', 'is_installed': True, 'install': {'platform': 'windows'}},
+        {'runner': 'sideload', 'app_name': 'manual', 'title': 'Manual Game', 'is_installed': True, 'install': {'platform': 'windows'}},
+    ]})
+    write_json(os.path.join(heroic_path, 'GamesConfig', 'osu.json'), {'osu': {'wineVersion': {'name': 'Proton - GE-Proton9-5'}}})
+    write_json(os.path.join(heroic_path, 'GamesConfig', 'manual.json'), {'manual': {'wineVersion': {'name': 'Wine - Wine-GE-Proton8-26'}}})
+
+    return {'install_dir': os.path.join(heroic_path, 'tools', 'proton'), 'launcher': 'heroicproton'}
+
+
+def test_game_index_get_games_for_compat_tool(tmp_path) -> None:
+
+    """
+    Test that GameIndex looks up the games using a compatibility tool in the reverse index of the snapshot.
+    """
+
+    install_loc: dict[str, str] = create_heroic_dir(os.path.join(tmp_path, 'heroic'))
+    game_index = GameIndex()
+
+    ge_proton: list[HeroicGame] = game_index.get_games_for_compat_tool(install_loc, BasicCompatTool('GE-Proton9-5', install_loc['install_dir'], 'GE-Proton9-5', CTType.CUSTOM))
+    wine_ge: list[HeroicGame] = game_index.get_games_for_compat_tool(install_loc, BasicCompatTool('Wine-GE-Proton8-26', install_loc['install_dir'], 'Wine-GE-Proton8-26', CTType.CUSTOM))
+    unused: list[HeroicGame] = game_index.get_games_for_compat_tool(install_loc, BasicCompatTool('GE-Proton9-4', install_loc['install_dir'], 'GE-Proton9-4', CTType.CUSTOM))
+
+    assert [game.app_name for game in ge_proton] == ['osu']
+    assert [game.app_name for game in wine_ge] == ['manual']
+    assert unused == []
+    assert sorted(game.app_name for game in game_index.get_games(install_loc)) == ['manual', 'osu']
+
+
+def test_game_index_refresh(tmp_path) -> None:
+
+    """
+    Test that GameIndex only loads a snapshot again and notifies about it when the launcher files changed.
+    """
+
+    heroic_path: str = os.path.join(tmp_path, 'heroic')
+    install_loc: dict[str, str] = create_heroic_dir(heroic_path)
+    game_index = GameIndex()
+
+    changed_keys: list[tuple[str, object]] = []
+    game_index.changed.connect(lambda key, origin: changed_keys.append((key, origin)))
+
+    snapshot: GameIndexSnapshot = game_index.get_snapshot(install_loc)
+
+    assert game_index.get_snapshot(install_loc, refresh=True) is snapshot
+    assert changed_keys == [(GameIndex.get_key(install_loc), None)]
+
+    game_config_file: str = os.path.join(heroic_path, 'GamesConfig', 'osu.json')
+    write_json(game_config_file, {'osu': {'wineVersion': {'name': 'Proton - GE-Proton9-20'}}})
+    os.utime(game_config_file, ns=(1, 1))
+
+    assert game_index.get_snapshot(install_loc) is snapshot
+    new_snapshot: GameIndexSnapshot = game_index.get_snapshot(install_loc, refresh=True, origin='dialog')
+
+    assert new_snapshot is not snapshot
+    assert sorted(new_snapshot.compat_tool_records) == ['GE-Proton9-20', 'Proton - GE-Proton9-20', 'Wine - Wine-GE-Proton8-26', 'Wine-GE-Proton8-26']
+    assert changed_keys == [(GameIndex.get_key(install_loc), None), (GameIndex.get_key(install_loc), 'dialog')]
+
+
+def test_game_index_unsupported_launcher() -> None:
+
+    """
+    Test that GameIndex returns no games for launchers without game support.
+    """
+
+    install_loc: dict[str, str] = {'install_dir': '~/.local/share/bottles/runners/', 'launcher': 'bottles'}
+
+    assert GameIndex().get_snapshot(install_loc) is None
+    assert GameIndex().get_games(install_loc) == []
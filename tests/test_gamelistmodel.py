@@ -0,0 +1,101 @@
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItemModel, QStandardItem
+from PySide6.QtWidgets import QApplication
+
+from pupgui2.datastructures import SteamApp
+from pupgui2.constants import PROTONDB_NOT_FOUND, PROTONDB_REQUEST_FAILED
+from pupgui2.gamelistmodel import SORT_ROLE, STEAM_COLUMN_NAME, STEAM_COLUMN_COMPAT_TOOL, STEAM_COLUMN_PROTONDB, SteamGameListModel, SearchIndexProxyModel
+
+
+def test_steam_game_list_model() -> None:
+
+    """
+    Test that SteamGameListModel shows the games passed to it, queues compatibility tool changes and updates ProtonDB ratings by app id.
+    """
+
+    app = QApplication.instance() or QApplication()
+
+    games: list[SteamApp] = []
+    for app_id, name, ctool in [(620, 'Portal 2', None), (730, 'Counter-Strike 2', 'GE-Proton9-1'), (440, 'Team Fortress 2', 'Custom-Proton')]:
+        game = SteamApp()
+        game.app_id = app_id
+        game.game_name = name
+        game.compat_tool = ctool
+        games.append(game)
+
+    model = SteamGameListModel(lambda game: 'Verified', lambda game: ('Unknown', 'awacy_unknown.png'))
+    model.set_games(games, ['GE-Proton9-1'])
+
+    changes: list[tuple[str, SteamApp]] = []
+    model.compat_tool_changed.connect(lambda ctool_name, game: changes.append((ctool_name, game)))
+
+    assert model.rowCount() == 3
+    assert model.index(1, STEAM_COLUMN_NAME).data() == 'Counter-Strike 2'
+    assert model.index(1, STEAM_COLUMN_NAME).data(Qt.UserRole) == 'https://store.steampowered.com/app/730'
+    assert model.index(0, STEAM_COLUMN_COMPAT_TOOL).data() == '-'
+
+    # Tools that are not installed anymore can still be selected for the game which uses them
+    assert model.get_compat_tool_choices(0) == ['-', 'GE-Proton9-1']
+    assert model.get_compat_tool_choices(2) == ['-', 'GE-Proton9-1', 'Custom-Proton']
+
+    assert model.flags(model.index(0, STEAM_COLUMN_COMPAT_TOOL)) & Qt.ItemIsEditable
+    assert not model.flags(model.index(0, STEAM_COLUMN_NAME)) & Qt.ItemIsEditable
+
+    assert model.setData(model.index(0, STEAM_COLUMN_COMPAT_TOOL), 'GE-Proton9-1')
+    assert not model.setData(model.index(1, STEAM_COLUMN_COMPAT_TOOL), 'GE-Proton9-1')  # Unchanged
+    assert model.index(0, STEAM_COLUMN_COMPAT_TOOL).data() == 'GE-Proton9-1'
+    assert model.get_compat_tool(0) == 'GE-Proton9-1'
+    assert changes == [('GE-Proton9-1', games[0])]
+
+    assert model.index(2, STEAM_COLUMN_PROTONDB).data(Qt.UserRole) is None
+    assert model.index(2, STEAM_COLUMN_PROTONDB).data() == 'click'
+    games[2].protondb_summary = {'error': PROTONDB_NOT_FOUND}
+    model.update_game(games[2])
+    assert model.index(2, STEAM_COLUMN_PROTONDB).data() == 'not found'
+    assert model.index(2, STEAM_COLUMN_PROTONDB).data(Qt.UserRole) is None
+    games[2].protondb_summary = {'error': PROTONDB_REQUEST_FAILED}
+    model.update_game(games[2])
+    assert model.index(2, STEAM_COLUMN_PROTONDB).data() == 'error'
+    games[2].protondb_summary = {'tier': 'gold'}
+    model.update_game(games[2])
+    assert model.index(2, STEAM_COLUMN_PROTONDB).data() == 'gold'
+    assert model.index(2, STEAM_COLUMN_PROTONDB).data(SORT_ROLE) == 'gold'
+    assert model.index(2, STEAM_COLUMN_PROTONDB).data(Qt.UserRole) == 'https://protondb.com/app/440'
+
+    QApplication.shutdown(app)
+
+
+def test_search_index_proxy_model() -> None:
+
+    """
+    Test that SearchIndexProxyModel filters rows by their normalized search key and notices changed rows.
+    """
+
+    app = QApplication.instance() or QApplication()
+
+    model = QStandardItemModel(0, 2)
+    for app_id, name in [(620, 'Portal 2'), (730, 'Counter-Strike 2'), (440, 'Pokémon Café')]:
+        model.appendRow([QStandardItem(str(app_id)), QStandardItem(name)])
+
+    proxy = SearchIndexProxyModel()
+    proxy.setSourceModel(model)
+
+    assert proxy.rowCount() == 3
+
+    proxy.set_search_text('pokemon')
+    assert proxy.rowCount() == 1
+    assert proxy.index(0, 1).data() == 'Pokémon Café'
+
+    proxy.set_search_text('73')  # AppID column is searched as well
+    assert proxy.rowCount() == 1
+
+    model.item(0, 0).setText('7300')
+    assert proxy.rowCount() == 2
+
+    model.appendRow([QStandardItem('1730'), QStandardItem('Half-Life')])
+    assert proxy.rowCount() == 3
+
+    proxy.set_search_text('')
+    assert proxy.rowCount() == 4
+
+    QApplication.shutdown(app)
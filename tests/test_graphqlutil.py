@@ -0,0 +1,80 @@
+import json
+
+import requests
+import pytest_responses
+
+from responses import RequestsMock
+
+from pytest_mock import MockerFixture
+
+from pupgui2.constants import GITHUB_GRAPHQL_API
+from pupgui2.graphqlutil import parse_releases_url, prefetch_github_releases, get_prefetched_releases
+from pupgui2.util import fetch_project_releases, fetch_project_release_data
+
+
+ge_releases_url: str = 'https://api.github.com/repos/GloriousEggroll/proton-ge-custom/releases'
+lutris_releases_url: str = 'https://api.github.com/repos/lutris/wine/releases'
+
+
+def graphql_release(tag: str, is_latest: bool = False, is_draft: bool = False) -> dict:
+    return {
+        'tagName': tag, 'publishedAt': '2024-05-01T10:00:00Z', 'isDraft': is_draft, 'isPrerelease': False, 'isLatest': is_latest,
+        'releaseAssets': {'nodes': [{'name': f'{tag}.tar.gz', 'downloadUrl': f'https://github.com/download/{tag}.tar.gz', 'size': 1234}]}
+    }
+
+
+def test_parse_releases_url() -> None:
+
+    """
+    Test that parse_releases_url only accepts GitHub REST releases urls.
+    """
+
+    assert parse_releases_url(ge_releases_url) == ('GloriousEggroll', 'proton-ge-custom')
+    assert parse_releases_url('https://gitlab.com/api/v4/projects/43488626/releases') is None
+    assert parse_releases_url('https://github.com/Scrumplex/Steam-Play-None/archive/refs/heads/main.tar.gz') is None
+
+
+def test_prefetch_github_releases(responses: RequestsMock, mocker: MockerFixture) -> None:
+
+    """
+    Test that prefetch_github_releases fetches the releases of several repositories with one request,
+    and that fetch_project_releases and fetch_project_release_data use them without asking the REST API.
+    """
+
+    mocker.patch('pupgui2.graphqlutil._releases_cache', {})
+
+    graphql_mock = responses.post(GITHUB_GRAPHQL_API, json={'data': {
+        'r0': {'releases': {'nodes': [graphql_release('GE-Proton9-5', is_latest=True), graphql_release('GE-Proton9-6-rc', is_draft=True), graphql_release('GE-Proton9-4')]}},
+        'r1': None,  # e.g. repository does not exist anymore
+    }})
+
+    assert prefetch_github_releases([ge_releases_url, lutris_releases_url, ge_releases_url], 'token')
+    assert graphql_mock.call_count == 1
+
+    request_body: dict = json.loads(responses.calls[0].request.body)
+    assert 'proton-ge-custom' in request_body['query'] and 'lutris' in request_body['query']
+    assert responses.calls[0].request.headers['Authorization'] == 'bearer token'
+
+    assert get_prefetched_releases(lutris_releases_url) is None
+    assert fetch_project_releases(ge_releases_url, requests.Session(), count=50) == ['GE-Proton9-5', 'GE-Proton9-4']
+
+    release_data: dict = fetch_project_release_data(ge_releases_url, '.tar.gz', requests.Session())
+    assert release_data == {'version': 'GE-Proton9-5', 'date': '2024-05-01', 'download': 'https://github.com/download/GE-Proton9-5.tar.gz', 'size': 1234}
+    assert fetch_project_release_data(ge_releases_url, '.tar.gz', requests.Session(), tag='GE-Proton9-4')['version'] == 'GE-Proton9-4'
+
+    # Already prefetched releases are not requested again
+    assert prefetch_github_releases([ge_releases_url], 'token')
+    assert graphql_mock.call_count == 1
+
+
+def test_prefetch_github_releases_without_token(responses: RequestsMock, mocker: MockerFixture) -> None:
+
+    """
+    Test that prefetch_github_releases does nothing without a GitHub token, the GraphQL API requires one.
+    """
+
+    mocker.patch('pupgui2.graphqlutil._releases_cache', {})
+
+    assert not prefetch_github_releases([ge_releases_url], '')
+    assert len(responses.calls) == 0
+    assert get_prefetched_releases(ge_releases_url) is None
@@ -1,5 +1,10 @@
+import os
+import json
+
 import pytest
 
+from pytest_mock import MockerFixture
+
 from pupgui2.constants import POSSIBLE_INSTALL_LOCATIONS
 
 from pupgui2.heroicutil import *
@@ -14,3 +19,43 @@ def test_is_heroic_launcher(launcher: str, expected_heroic_launcher: bool) -> No
     result: bool = is_heroic_launcher(launcher)
 
     assert result == expected_heroic_launcher
+
+
+def write_json(path: str, content: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(content, f)
+
+
+def test_get_heroic_game_list(tmp_path, mocker: MockerFixture) -> None:
+
+    """
+    Test that get_heroic_game_list combines the Heroic store files and reads each of them only once.
+    """
+
+    heroic_path: str = os.path.join(tmp_path, 'heroic')
+    write_json(os.path.join(heroic_path, 'gog_store', 'library.json'), {'games': [
+        {'runner': 'gog', 'app_name': '1207658924', 'title': 'Unreal Tournament', 'is_installed': False},
+        {'runner': 'gog', 'app_name': '1207658930', 'title': 'Not Installed', 'is_installed': False},
+    ]})
+    write_json(os.path.join(heroic_path, 'gog_store', 'installed.json'), {'installed': [
+        {'appName': '1207658924', 'install_path': '/games/ut', 'platform': 'windows'},
+    ]})
+    write_json(os.path.join(heroic_path, 'GamesConfig', '1207658924.json'), {'1207658924': {'wineVersion': {'name': 'Proton - GE-Proton9-5'}}})
+    write_json(os.path.join(tmp_path, 'legendary', 'installed.json'), {'Fortnite': {'title': 'Fortnite', 'install_path': '/games/fn', 'platform': 'Windows'}})
+
+    load_json_file_spy = mocker.spy(heroic_json_file_cache, 'load_file')
+
+    games: list[HeroicGame] = get_heroic_game_list(heroic_path)
+
+    assert [(game.app_name, game.is_installed, game.install_path, game.platform) for game in games] == [
+        ('1207658924', True, '/games/ut', 'Windows'),
+        ('1207658930', False, '', ''),
+        ('Fortnite', True, '/games/fn', 'Windows'),
+    ]
+    assert games[0].wine_info == {'name': 'Proton - GE-Proton9-5'}
+    assert games[2].wine_info == {}
+    assert load_json_file_spy.call_count == 3  # gog_store/library.json, gog_store/installed.json, legendary/installed.json
+
+    get_heroic_game_list(heroic_path)
+    assert load_json_file_spy.call_count == 3
@@ -0,0 +1,53 @@
+import os
+import json
+
+from pytest_mock import MockerFixture
+
+from pupgui2.datastructures import BasicCompatTool
+from pupgui2.installedctoolsworker import *
+
+
+def test_collect_installed_ctools_heroic(tmp_path, mocker: MockerFixture) -> None:
+
+    """
+    Test that collect_installed_ctools counts the Heroic games using each tool and lists the Heroic DXVK versions.
+    """
+
+    heroic_path: str = os.path.join(tmp_path, 'heroic')
+    install_dir: str = os.path.join(heroic_path, 'tools', 'proton')
+    for tool_dir in [os.path.join(install_dir, 'GE-Proton9-5'), os.path.join(install_dir, 'GE-Proton9-4'), os.path.join(heroic_path, 'tools', 'dxvk', 'dxvk-2.4')]:
+        os.makedirs(tool_dir)
+
+    os.makedirs(os.path.join(heroic_path, 'sideload_apps'))
+    with open(os.path.join(heroic_path, 'sideload_apps', 'library.json'), 'w') as f:
+        json.dump({'games': [{'runner': 'sideload', 'app_name': 'osu', 'title': 'osu!', 'is_installed': True}]}, f)
+    os.makedirs(os.path.join(heroic_path, 'GamesConfig'))
+    with open(os.path.join(heroic_path, 'GamesConfig', 'osu.json'), 'w') as f:
+        json.dump({'osu': {'wineVersion': {'name': 'Proton - GE-Proton9-5'}}}, f)
+
+    mocker.patch('pupgui2.installedctoolsworker.get_install_location_from_directory_name', return_value={'install_dir': install_dir, 'launcher': 'heroicproton'})
+
+    ctools: list[BasicCompatTool] = collect_installed_ctools(install_dir)
+
+    assert [(ct.displayname, ct.no_games) for ct in ctools] == [('GE-Proton9-4', 0), ('GE-Proton9-5', 1), ('dxvk-2.4', -1)]
+
+
+def test_installed_ctools_worker_drops_stale_snapshots(tmp_path, mocker: MockerFixture) -> None:
+
+    """
+    Test that InstalledCtoolsWorker only emits the snapshot of the latest request.
+    """
+
+    mocker.patch('pupgui2.installedctoolsworker.get_install_location_from_directory_name', return_value={'install_dir': str(tmp_path), 'launcher': ''})
+
+    worker = InstalledCtoolsWorker()
+    snapshots: list[InstalledCtoolsSnapshot] = []
+    worker.snapshot_ready.connect(snapshots.append)
+
+    worker.generation = 2  # A second request was made while the first one was running
+    worker._collect(1, str(tmp_path))
+    worker._collect(2, str(tmp_path))
+
+    assert [snapshot.generation for snapshot in snapshots] == [2]
+    assert snapshots[0].install_dir == str(tmp_path)
+    assert worker.is_current(snapshots[0])
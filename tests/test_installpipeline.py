@@ -0,0 +1,71 @@
+import os
+import zipfile
+import importlib
+
+import pytest
+
+from responses import RequestsMock
+
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.fakeupstream import FakeUpstreamServer, FakeUpstreamAdapter, create_tool_archive, get_sha512sum, use_fake_upstream
+
+
+class DummyMainWindow:
+    """ Dummy MainWindow object for the ctmods. Works thanks to duck typing. """
+
+    def __init__(self) -> None:
+        self.web_access_tokens = {}
+
+
+@pytest.mark.parametrize('archive_format', ['tar.gz', 'tar.xz', 'tar.zst', 'tar', 'zip'])
+def test_create_tool_archive(tmp_path, archive_format: str) -> None:
+    archive = create_tool_archive(str(tmp_path / f'tool.{archive_format}'), archive_format, 'tool-1.0', 4096, 8)
+
+    assert os.path.getsize(archive) > 0
+    if archive_format == 'zip':
+        assert len(zipfile.ZipFile(archive).namelist()) == 8
+    else:
+        assert get_sha512sum(archive).endswith(f'  tool.{archive_format}\n')
+
+
+def test_get_tool_from_fake_upstream(tmp_path, responses: RequestsMock) -> None:
+    """
+    Install GE-Proton and a Proton-tkg CI build with their ctmods, from a local server instead of GitHub.
+    """
+    app = QApplication.instance() or QApplication()
+
+    archive_dir, cache_dir = tmp_path / 'archives', tmp_path / 'cache'
+    archive_dir.mkdir()
+    cache_dir.mkdir()
+
+    ge_archive = create_tool_archive(str(archive_dir / 'GE-Proton9-5.tar.gz'), 'tar.gz', 'GE-Proton9-5', 4096, 8)
+    ge_checksum = archive_dir / 'GE-Proton9-5.sha512sum'
+    ge_checksum.write_text(get_sha512sum(ge_archive))
+
+    tkg_zst = create_tool_archive(str(archive_dir / 'wine-tkg-valve.tar.zst'), 'tar.zst', 'usr', 4096, 8)
+    tkg_zip = str(archive_dir / 'wine-tkg-build.zip')
+    with zipfile.ZipFile(tkg_zip, 'w') as zf:
+        zf.write(tkg_zst, os.path.basename(tkg_zst))
+
+    with FakeUpstreamServer() as server, use_fake_upstream(server, str(cache_dir)):
+        responses.add_passthru(server.base_url)
+        server.add_github_release('GloriousEggroll/proton-ge-custom', 'GE-Proton9-5', [ge_archive, str(ge_checksum)])
+        server.add_github_artifact('Frogging-Family/wine-tkg-git', 123456, 'wine-tkg-build', tkg_zip)
+
+        for ctmod_name, tag, installed_dir in [('ctmod_00protonge', 'GE-Proton9-5', 'GE-Proton9-5'), ('ctmod_protontkg', '123456', 'wine-tkg-valve')]:
+            ctmod = importlib.import_module(f'pupgui2.resources.ctmods.{ctmod_name}')
+            installer = ctmod.CtInstaller(DummyMainWindow())
+            installer.rs.mount('https://', FakeUpstreamAdapter(server.base_url))
+
+            install_dir, temp_dir = tmp_path / ctmod_name / 'install', tmp_path / ctmod_name / 'tmp'
+            install_dir.mkdir(parents=True)
+            temp_dir.mkdir()
+
+            assert installer.get_tool(tag, str(install_dir), str(temp_dir))
+            assert len(list((install_dir / installed_dir / 'files').rglob('file*'))) == 8
+
+        assert '/github.com/GloriousEggroll/proton-ge-custom/releases/download/GE-Proton9-5/GE-Proton9-5.sha512sum' in server.requested_paths
+        assert '/nightly.link/Frogging-Family/wine-tkg-git/actions/runs/123456/wine-tkg-build.zip' in server.requested_paths
+
+    QApplication.shutdown(app)
@@ -0,0 +1,77 @@
+import os
+import sqlite3
+
+from contextlib import closing
+
+from pupgui2.datastructures import LutrisGame
+from pupgui2.lutrisutil import *
+
+
+def create_lutris_dir(lutris_dir: str, games: list[tuple], game_configs: dict[str, str]) -> dict[str, str]:
+
+    """
+    Create a Lutris data directory with a pga.db containing games and game config .yml files.
+    Return the install location for it.
+    """
+
+    os.makedirs(os.path.join(lutris_dir, 'runners', 'wine'))
+    os.makedirs(os.path.join(lutris_dir, 'games'))
+
+    with closing(sqlite3.connect(os.path.join(lutris_dir, 'pga.db'))) as con:
+        con.execute('CREATE TABLE games (slug TEXT, name TEXT, runner TEXT, installer_slug TEXT, installed_at INTEGER, directory TEXT)')
+        con.executemany('INSERT INTO games VALUES (?, ?, ?, ?, ?, ?)', games)
+        con.commit()
+
+    for file_name, content in game_configs.items():
+        with open(os.path.join(lutris_dir, 'games', file_name), 'w') as f:
+            f.write(content)
+
+    return {'install_dir': os.path.join(lutris_dir, 'runners', 'wine'), 'launcher': 'lutris', 'config_dir': os.path.join(lutris_dir, 'config')}
+
+
+def test_get_lutris_game_list(tmp_path) -> None:
+
+    """
+    Test that get_lutris_game_list reads games from pga.db and uses the game config for games without an install directory.
+    """
+
+    install_loc: dict[str, str] = create_lutris_dir(str(tmp_path), [
+        ('osu', 'osu!', 'wine', 'osu-standard', 1700000000, '/games/osu'),
+        ('manual-game', 'Manual Game', 'wine', None, 1700000001, None),
+        ('portal-2', 'Portal 2', 'steam', None, 1700000002, None),
+    ], {
+        'osu-standard-1700000000.yml': 'game:\n  exe: /games/osu/osu!.exe\nwine:\n  version: lutris-GE-Proton8-26-x86_64\n',
+        'manual-game-1700000001.yml': 'game:\n  exe: /games/manual/bin/game.exe\n  working_dir: /games/manual\n',
+        'portal-2-1700000002.yml': 'game:\n  appid: 620\n',
+    })
+
+    games: list[LutrisGame] = get_lutris_game_list(install_loc)
+
+    assert [(game.slug, game.runner, game.install_dir) for game in games] == [
+        ('osu', 'wine', '/games/osu'),
+        ('manual-game', 'wine', '/games/manual'),
+        ('portal-2', 'steam', ''),
+    ]
+    assert is_lutris_game_using_wine(games[0], 'lutris-GE-Proton8-26-x86_64')
+    assert not is_lutris_game_using_wine(games[1], 'lutris-GE-Proton8-26-x86_64')
+
+
+def test_lutris_game_config_index(tmp_path) -> None:
+
+    """
+    Test that LutrisGame.get_game_config uses the game configs read by get_lutris_game_list until the list is read again.
+    """
+
+    install_loc: dict[str, str] = create_lutris_dir(str(tmp_path), [('osu', 'osu!', 'wine', 'osu-standard', 1700000000, '/games/osu')], {
+        'osu-standard-1700000000.yml': 'wine:\n  version: wine-ge-8-26\n',
+    })
+
+    game: LutrisGame = get_lutris_game_list(install_loc)[0]
+
+    game_config_file: str = os.path.join(tmp_path, 'games', 'osu-standard-1700000000.yml')
+    with open(game_config_file, 'w') as f:
+        f.write('wine:\n  version: lutris-GE-Proton8-26-x86_64\n')
+    os.utime(game_config_file, ns=(1, 1))
+
+    assert game.get_game_config() == {'wine': {'version': 'wine-ge-8-26'}}
+    assert get_lutris_game_list(install_loc)[0].get_game_config() == {'wine': {'version': 'lutris-GE-Proton8-26-x86_64'}}
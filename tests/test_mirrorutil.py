@@ -0,0 +1,122 @@
+import os
+import hashlib
+import threading
+
+import requests
+import pytest_responses
+
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+from responses import RequestsMock
+
+from pytest_mock import MockerFixture
+
+from pupgui2.mirrorutil import get_mirror_url, verify_checksum, create_mirror_server
+from pupgui2.networkutil import download_file
+
+
+archive_url: str = 'https://github.com/GloriousEggroll/proton-ge-custom/releases/download/GE-Proton9-5/GE-Proton9-5.tar.gz'
+archive_content: bytes = b'GE-Proton9-5 archive'
+
+
+def start_server(server: ThreadingHTTPServer) -> str:
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def test_get_mirror_url() -> None:
+
+    """
+    Test that get_mirror_url maps upstream urls to the mirror, but only for hosts the mirror fetches from.
+    """
+
+    assert get_mirror_url(archive_url, 'http://192.168.1.10:8484/') == 'http://192.168.1.10:8484/github.com/GloriousEggroll/proton-ge-custom/releases/download/GE-Proton9-5/GE-Proton9-5.tar.gz'
+    assert get_mirror_url('https://api.github.com/repos/lutris/wine/releases?per_page=50', 'http://mirror') == 'http://mirror/api.github.com/repos/lutris/wine/releases?per_page=50'
+    assert get_mirror_url(archive_url, '') == ''
+    assert get_mirror_url('https://example.com/file.tar.gz', 'http://mirror') == ''
+
+
+def test_verify_checksum(tmp_path) -> None:
+
+    """
+    Test that verify_checksum detects SHA512 and SHA256 checksums in checksum files.
+    """
+
+    file_path: str = os.path.join(tmp_path, 'GE-Proton9-5.tar.gz')
+    with open(file_path, 'wb') as f:
+        f.write(archive_content)
+
+    sha512: str = hashlib.sha512(archive_content).hexdigest()
+
+    assert verify_checksum(file_path, f'{sha512}  GE-Proton9-5.tar.gz\n')
+    assert verify_checksum(file_path, hashlib.sha256(archive_content).hexdigest())
+    assert not verify_checksum(file_path, f'{"0" * 128}  GE-Proton9-5.tar.gz\n')
+    assert verify_checksum(file_path, '')
+
+
+def test_download_file_from_mirror(responses: RequestsMock, mocker: MockerFixture, tmp_path) -> None:
+
+    """
+    Test that download_file uses a plain HTTP server as mirror, and falls back to upstream on a miss or a checksum mismatch.
+    """
+
+    mirror_dir: str = os.path.join(tmp_path, 'mirror')
+    os.makedirs(os.path.join(mirror_dir, 'github.com/GloriousEggroll/proton-ge-custom/releases/download/GE-Proton9-5'))
+    with open(os.path.join(mirror_dir, 'github.com', archive_url.split('github.com/')[1]), 'wb') as f:
+        f.write(archive_content)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(SimpleHTTPRequestHandler, directory=mirror_dir))
+    mocker.patch('pupgui2.networkutil.config_mirror_url', return_value=start_server(server))
+
+    responses.add_passthru('http://127.0.0.1')
+    upstream_mock = responses.get(archive_url, body=b'upstream archive')
+
+    destination: str = os.path.join(tmp_path, 'download', 'GE-Proton9-5.tar.gz')
+    checksum: str = f'{hashlib.sha512(archive_content).hexdigest()}  GE-Proton9-5.tar.gz'
+
+    try:
+        assert download_file(archive_url, destination, checksum=checksum)
+        assert open(destination, 'rb').read() == archive_content
+        assert upstream_mock.call_count == 0
+
+        # Mirror has a different file than upstream
+        assert download_file(archive_url, destination, checksum=f'{"0" * 128}  GE-Proton9-5.tar.gz')
+        assert open(destination, 'rb').read() == b'upstream archive'
+        assert upstream_mock.call_count == 1
+
+        # Mirror does not have the file
+        other_archive_url: str = archive_url.replace('9-5', '9-4')
+        other_upstream_mock = responses.get(other_archive_url, body=b'upstream archive 9-4')
+        assert download_file(other_archive_url, destination)
+        assert open(destination, 'rb').read() == b'upstream archive 9-4'
+        assert other_upstream_mock.call_count == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_mirror_server(responses: RequestsMock, tmp_path) -> None:
+
+    """
+    Test that the server of 'protonup-qt serve-cache' fetches archives from upstream only once and refuses unknown hosts.
+    """
+
+    server = create_mirror_server('127.0.0.1', 0, cache_dir=str(tmp_path))
+    mirror_base: str = start_server(server)
+
+    responses.add_passthru('http://127.0.0.1')
+    upstream_mock = responses.get(archive_url, body=archive_content)
+
+    try:
+        for _ in range(2):
+            response = requests.get(get_mirror_url(archive_url, mirror_base))
+            assert response.status_code == 200
+            assert response.content == archive_content
+
+        assert upstream_mock.call_count == 1
+        assert requests.get(f'{mirror_base}/example.com/file.tar.gz').status_code == 404
+        assert requests.get(f'{mirror_base}/github.com/../../etc/passwd').status_code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+from pupgui2 import gameindex
+from pupgui2.ctloader import CtLoader
+from pupgui2.pupgui2 import MainWindow, PupguiApp
+
+
+@pytest.fixture
+def main_window(monkeypatch):
+
+    monkeypatch.setenv('PUPGUI2_DISABLE_GAMEPAD', '1')
+    monkeypatch.setattr(CtLoader, 'ctmods', [])  # Don't reuse the ctmods loaded by other tests
+    monkeypatch.setattr(CtLoader, 'ctobjs', [])
+    monkeypatch.setattr(gameindex, '_game_index', None)  # Created for the QApplication of another test
+    app = PupguiApp([])
+
+    main_window = MainWindow()
+    yield main_window
+
+    main_window.ui.close()
+    app.aboutToQuit.emit()  # Stops the install thread and the other workers
+    app.processEvents()
+
+    assert not main_window.install_thread.isRunning()
+
+    PupguiApp.shutdown(app)
+
+
+def test_main_window(main_window: MainWindow) -> None:
+
+    """
+    Test that the MainWindow can be constructed, i.e. that ProtonUp-Qt starts.
+    """
+
+    assert main_window.ui.isVisible()
+    assert main_window.install_thread.isRunning()
+
+
+def test_main_window_install_to_several_locations_progress(main_window: MainWindow) -> None:
+
+    """
+    Test that a tool installed to several locations is only shown as installed once InstallWineThread copied it to all of them.
+    """
+
+    main_window.pending_downloads.append({ 'name': 'GE-Proton', 'version': 'GE-Proton9-5', 'install_dir': '/steam', 'install_dirs': ['/steam', '/heroic'] })
+    main_window.ctmod_download_progress_percent(1)
+    main_window.ctmod_download_progress_percent(100)  # The ctmod finished installing to the staging directory
+
+    assert main_window.ui.statusBar().currentMessage() == 'Installing GE-Proton GE-Proton9-5...'
+
+    emit_thread = threading.Thread(target=main_window.install_thread.download_progress_percent.emit, args=(100,))
+    emit_thread.start()
+    emit_thread.join()
+
+    assert main_window.ui.statusBar().currentMessage() == 'Installing GE-Proton GE-Proton9-5...'  # Queued to the GUI thread
+
+    PupguiApp.processEvents()
+
+    assert main_window.ui.statusBar().currentMessage() == 'Installed GE-Proton GE-Proton9-5.'
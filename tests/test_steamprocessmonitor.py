@@ -0,0 +1,62 @@
+import os
+
+from pytest_mock import MockerFixture
+
+from pupgui2.steamprocessmonitor import *
+
+
+def write_pid_file(pid_file: str, pid: int, mtime: int) -> None:
+    with open(pid_file, 'w') as f:
+        f.write(f'{pid}\n')
+    os.utime(pid_file, ns=(mtime, mtime))
+
+
+def test_find_steam_pid(tmp_path, mocker: MockerFixture) -> None:
+
+    """
+    Test that find_steam_pid verifies the pid from the pid file and only scans /proc if there is no pid file.
+    """
+
+    pid_file: str = os.path.join(tmp_path, 'steam.pid')
+    mocker.patch('pupgui2.steamprocessmonitor.is_steam_process', side_effect=lambda pid: pid == 1234)
+    find_steam_pid_in_proc = mocker.patch('pupgui2.steamprocessmonitor.find_steam_pid_in_proc', return_value=4321)
+
+    assert find_steam_pid([pid_file]) == 4321
+
+    write_pid_file(pid_file, 1234, 1)
+    assert find_steam_pid([pid_file]) == 1234
+
+    write_pid_file(pid_file, 1235, 2)  # Stale pid file
+    assert find_steam_pid([pid_file]) == 0
+    assert find_steam_pid_in_proc.call_count == 1
+
+
+def test_steam_process_monitor(tmp_path, mocker: MockerFixture) -> None:
+
+    """
+    Test that SteamProcessMonitor caches the state and emits running_changed when the pid file changes or Steam exits.
+    """
+
+    pid_file: str = os.path.join(tmp_path, 'steam.pid')
+    running_pids: set[int] = {os.getpid()}
+    is_steam_process = mocker.patch('pupgui2.steamprocessmonitor.is_steam_process', side_effect=lambda pid: pid in running_pids)
+    write_pid_file(pid_file, os.getpid(), 1)
+
+    monitor = SteamProcessMonitor([pid_file])
+    states: list[bool] = []
+    monitor.running_changed.connect(states.append)
+
+    assert monitor.is_running()
+    assert monitor.is_running()
+    assert is_steam_process.call_count == 1
+
+    running_pids.clear()
+    monitor.refresh()  # Called when the pidfd becomes readable
+    assert not monitor.is_running()
+
+    running_pids.add(1234)
+    write_pid_file(pid_file, 1234, 2)
+    monitor.poll()
+
+    assert monitor.is_running()
+    assert states == [False, True]
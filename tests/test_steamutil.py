@@ -1,6 +1,15 @@
+import os
+
 import pytest
 
-from pupgui2.steamutil import calc_shortcut_app_id
+from pytest_mock import MockerFixture
+from responses import RequestsMock
+
+from pupgui2.cacheutil import JsonFileCache
+from pupgui2.constants import PROTONDB_API_URL, PROTONDB_NOT_FOUND
+from pupgui2.datastructures import BasicCompatTool, CTType, RuntimeType, SteamApp
+from pupgui2.steamutil import calc_shortcut_app_id, get_steam_ct_game_index, get_steam_games_for_ctool, get_ctool_runtime_type
+from pupgui2.steamutil import get_protondb_status_thread, get_protondb_status, load_cached_protondb_status
 
 
 @pytest.mark.parametrize(
@@ -15,3 +24,85 @@ def test_calc_shortcut_app_id(shortcut_dict: dict[str, str], expected_appid: int
     result: int = calc_shortcut_app_id(shortcut_dict.get('name', ''), shortcut_dict.get('exe', ''))
 
     assert result == expected_appid
+
+
+def create_steam_app(app_id: int, compat_tool: str = '', app_type: str = 'game', eac: bool = False, battleye: bool = False) -> SteamApp:
+
+    app = SteamApp()
+    app.app_id = app_id
+    app.compat_tool = compat_tool
+    app.app_type = app_type
+    app.anticheat_runtimes = { RuntimeType.EAC: eac, RuntimeType.BATTLEYE: battleye }
+
+    return app
+
+
+def test_get_steam_games_for_ctool() -> None:
+
+    """
+    Test that the reverse index built by get_steam_ct_game_index finds games by compatibility tool name and anti-cheat runtime.
+    """
+
+    apps: list[SteamApp] = [
+        create_steam_app(1, 'GE-Proton9-5', eac=True),
+        create_steam_app(2, 'GE-Proton9-5'),
+        create_steam_app(3, 'proton_experimental', battleye=True),
+        create_steam_app(4, 'Proton EasyAntiCheat Runtime', eac=True),
+        create_steam_app(5, 'GE-Proton9-5', app_type='tool'),
+    ]
+
+    ct_game_index = get_steam_ct_game_index(apps)
+
+    ge_proton = BasicCompatTool('GE-Proton9-5', '', 'GE-Proton9-5', CTType.CUSTOM)
+    eac_runtime = BasicCompatTool('Proton EasyAntiCheat Runtime', '', '', CTType.STEAM_RT)
+    battleye_runtime = BasicCompatTool('Proton BattlEye Runtime', '', '', CTType.STEAM_RT)
+
+    assert [app.app_id for app in get_steam_games_for_ctool(ct_game_index, ge_proton)] == [1, 2]
+    assert [app.app_id for app in get_steam_games_for_ctool(ct_game_index, eac_runtime)] == [4, 1]
+    assert [app.app_id for app in get_steam_games_for_ctool(ct_game_index, battleye_runtime)] == [3]
+
+
+@pytest.mark.parametrize(
+    'ctool, expected_runtime_type', [
+        pytest.param(BasicCompatTool('Proton EasyAntiCheat Runtime', '', '', CTType.STEAM_RT), RuntimeType.EAC, id = 'EAC Runtime'),
+        pytest.param(BasicCompatTool('Proton BattlEye Runtime', '', '', CTType.STEAM_RT), RuntimeType.BATTLEYE, id = 'BattlEye Runtime'),
+        pytest.param(BasicCompatTool('Proton EasyAntiCheat Runtime', '', '', CTType.CUSTOM), None, id = 'Not a Steam Runtime'),
+        pytest.param(BasicCompatTool('GE-Proton9-5', '', 'GE-Proton9-5', CTType.CUSTOM), None, id = 'GE-Proton'),
+    ]
+)
+def test_get_ctool_runtime_type(ctool: BasicCompatTool, expected_runtime_type: RuntimeType | None) -> None:
+
+    assert get_ctool_runtime_type(ctool) == expected_runtime_type
+
+
+def test_get_protondb_status_unknown_game_cached(tmp_path, responses: RequestsMock, mocker: MockerFixture) -> None:
+
+    """
+    Test that games unknown to ProtonDB.com are cached as not found, so they are only fetched again when refreshed.
+    """
+
+    mocker.patch('pupgui2.steamutil._protondb_cache', JsonFileCache(os.path.join(tmp_path, 'protondb.json'), ttl=60))
+    signal = mocker.Mock()
+
+    game = create_steam_app(4000)
+    responses.get(PROTONDB_API_URL.format(game_id='4000'), status=404)
+
+    assert not load_cached_protondb_status(game)
+
+    get_protondb_status_thread(game, signal)
+
+    signal.emit.assert_called_once_with(game)
+    assert game.protondb_summary == {'error': PROTONDB_NOT_FOUND}
+    assert load_cached_protondb_status(game)
+
+    mocker.patch('pupgui2.steamutil._protondb_pending', set())
+    mock_submit = mocker.patch('pupgui2.steamutil._protondb_executor.submit')
+
+    get_protondb_status(game, signal)
+
+    mock_submit.assert_not_called()
+    assert signal.emit.call_count == 2
+
+    get_protondb_status(game, signal, refresh=True)
+
+    mock_submit.assert_called_once()
@@ -0,0 +1,65 @@
+import os
+import subprocess
+
+from pytest_mock import MockerFixture
+
+from pupgui2.datastructures import HardwarePlatform
+from pupgui2.systemprofile import *
+
+
+STEAMOS_OS_RELEASE: str = '''NAME="SteamOS"
+PRETTY_NAME="SteamOS"
+VERSION_CODENAME=holo
+ID=steamos
+ID_LIKE=arch
+VERSION_ID=3.5.19
+VARIANT_ID=steamdeck
+'''
+
+
+def write_etc_file(etc_dir: str, name: str, content: str) -> None:
+    os.makedirs(etc_dir, exist_ok=True)
+    with open(os.path.join(etc_dir, name), 'w') as f:
+        f.write(content)
+
+
+def test_load_system_profile_steam_deck(tmp_path, mocker: MockerFixture) -> None:
+
+    """
+    Test that load_system_profile detects a Steam Deck from os-release without spawning a process outside of Flatpak.
+    """
+
+    mocker.patch('pupgui2.systemprofile.IS_FLATPAK', False)
+    run = mocker.patch('pupgui2.systemprofile.subprocess.run')
+    write_etc_file(str(tmp_path), 'os-release', STEAMOS_OS_RELEASE)
+
+    profile: SystemProfile = load_system_profile(str(tmp_path))
+
+    assert profile.platform == HardwarePlatform.STEAM_DECK
+    assert profile.is_steam_os
+    assert profile.release['NAME'] == 'SteamOS'
+    assert format_release(profile.host_release) == 'SteamOS 3.5.19'
+    assert 'zst' in profile.decompressors
+    assert run.call_count == 0
+
+
+def test_load_system_profile_flatpak(tmp_path, mocker: MockerFixture) -> None:
+
+    """
+    Test that load_system_profile reads lsb-release and os-release of the host with a single flatpak-spawn call.
+    """
+
+    mocker.patch('pupgui2.systemprofile.IS_FLATPAK', True)
+    run = mocker.patch('pupgui2.systemprofile.subprocess.run', return_value=subprocess.CompletedProcess([], 0, stdout='DISTRIB_ID=Arch\n\x1e\nNAME="Arch Linux"\nVERSION_ID=rolling\n'))
+    write_etc_file(str(tmp_path), 'os-release', 'NAME="Freedesktop SDK"\nVERSION="23.08 (Flatpak runtime)"\n')
+
+    profile: SystemProfile = load_system_profile(str(tmp_path))
+
+    assert profile.platform == HardwarePlatform.DESKTOP
+    assert not profile.is_steam_os
+    assert profile.distinfo.startswith('distrib_id=arch')
+    assert format_release(profile.release) == 'Freedesktop SDK 23.08 (Flatpak runtime)'
+    assert format_release(profile.host_release) == 'Arch Linux rolling'
+    assert run.call_count == 1
+    assert run.call_args.args[0][:2] == ['flatpak-spawn', '--host']
+    assert '(Host)' in format_system_profile(profile)
@@ -1,5 +1,7 @@
 import os
+import random
 import pathlib
+import subprocess
 
 import pytest
 import pytest_responses
@@ -13,7 +15,7 @@ from pytest_mock import MockerFixture
 
 from pupgui2.util import *
 from pupgui2.constants import POSSIBLE_INSTALL_LOCATIONS, AWACY_GAME_LIST_URL, LOCAL_AWACY_GAME_LIST, GITLAB_API, GITHUB_API
-from pupgui2.datastructures import SteamApp, LutrisGame, HeroicGame, Launcher, SteamUser
+from pupgui2.datastructures import SteamApp, LutrisGame, HeroicGame, Launcher, SteamUser, CTType, InstalledCtoolEntry
 
 
 github_api_ratelimit_url: str = 'https://api.github.com/rate_limit/'
@@ -436,3 +438,310 @@ def test_get_combobox_index_by_value(combobox_values: list[str], value: str, exp
     assert result == expected_index
 
     QApplication.shutdown(app)
+
+
+@pytest.mark.parametrize(
+    'old_texts, new_texts', [
+        pytest.param(['GE-Proton9-4', 'GE-Proton9-5'], ['GE-Proton9-20', 'GE-Proton9-4', 'GE-Proton9-5'], id = 'Insert'),
+        pytest.param(['GE-Proton9-20', 'GE-Proton9-4 (unused)', 'GE-Proton9-5'], ['GE-Proton9-20', 'GE-Proton9-5'], id = 'Remove'),
+        pytest.param(['GE-Proton9-4 (unused)', 'GE-Proton9-5'], ['GE-Proton9-4', 'GE-Proton9-5 (unused)'], id = 'Rename'),
+        pytest.param(['a', 'b', 'c'], ['x', 'a', 'd', 'c', 'y'], id = 'Mixed'),
+        pytest.param([], ['a', 'b'], id = 'Empty'),
+    ]
+)
+def test_update_list_widget_texts(old_texts: list[str], new_texts: list[str]) -> None:
+
+    """
+    Test that update_list_widget_texts makes the list show the new texts and keeps unchanged items.
+    """
+
+    app = QApplication.instance() or QApplication()
+
+    list_widget: QListWidget = QListWidget()
+    list_widget.addItems(old_texts)
+    old_items = {list_widget.item(i).text(): list_widget.item(i) for i in range(list_widget.count())}
+
+    update_list_widget_texts(list_widget, new_texts)
+
+    assert [list_widget.item(i).text() for i in range(list_widget.count())] == new_texts
+    assert all(list_widget.item(i) is old_items[text] for i, text in enumerate(new_texts) if text in old_items)
+
+    QApplication.shutdown(app)
+
+
+@pytest.mark.parametrize(
+    'text, expected', [
+        pytest.param('Team Fortress 2', 'team fortress 2', id = 'Lowercase'),
+        pytest.param('Pokémon Café', 'pokemon cafe', id = 'Accents'),
+        pytest.param('STRASSE', 'strasse', id = 'Casefold'),
+        pytest.param(None, '', id = 'None'),
+    ]
+)
+def test_normalize_search_text(text: str, expected: str) -> None:
+
+    """
+    Test that normalize_search_text lowercases text and strips accents, so searching is case- and accent-insensitive.
+    """
+
+    result: str = normalize_search_text(text)
+
+    assert result == expected
+
+
+def test_available_install_directories_cached(mocker: MockerFixture) -> None:
+
+    """
+    Test that available_install_directories only searches the install locations again after it was invalidated.
+    """
+
+    is_valid_launcher_installation_mock = mocker.patch('pupgui2.util.is_valid_launcher_installation')
+    is_valid_launcher_installation_mock.side_effect = lambda loc: loc['launcher'] == 'lutris'
+    mocker.patch('pupgui2.util.config_custom_install_location', return_value={'install_dir': None, 'display_name': '', 'launcher': ''})
+
+    invalidate_available_install_directories()
+
+    result: list[str] = available_install_directories()
+    call_count: int = is_valid_launcher_installation_mock.call_count
+
+    assert result == [os.path.expanduser(loc['install_dir']) for loc in POSSIBLE_INSTALL_LOCATIONS if loc['launcher'] == 'lutris']
+    assert call_count == len(POSSIBLE_INSTALL_LOCATIONS)
+
+    result.clear()  # Callers get a copy and must not be able to modify the cache
+    assert len(available_install_directories()) > 0
+    assert is_valid_launcher_installation_mock.call_count == call_count
+
+    invalidate_available_install_directories()
+    available_install_directories()
+    assert is_valid_launcher_installation_mock.call_count == call_count * 2
+
+    invalidate_available_install_directories()
+
+
+def test_get_install_location_watch_dirs(tmp_path, mocker: MockerFixture) -> None:
+
+    """
+    Test that only existing launcher root directories are watched, and missing ones are not replaced by their (busy) parent directories.
+    """
+
+    os.makedirs(os.path.join(tmp_path, 'Steam'))
+    mocker.patch('pupgui2.util.POSSIBLE_INSTALL_LOCATIONS', [
+        {'install_dir': os.path.join(tmp_path, 'Steam/compatibilitytools.d/'), 'launcher': 'steam'},
+        {'install_dir': os.path.join(tmp_path, 'lutris/runners/wine/'), 'launcher': 'lutris'},
+    ])
+    mocker.patch('pupgui2.util.config_custom_install_location', return_value={'install_dir': None, 'display_name': '', 'launcher': ''})
+
+    assert get_install_location_watch_dirs() == [os.path.join(tmp_path, 'Steam')]
+    assert get_missing_install_location_dirs() == [os.path.join(tmp_path, 'lutris/runners')]
+
+    os.makedirs(os.path.join(tmp_path, 'lutris/runners'))
+
+    assert get_install_location_watch_dirs() == [os.path.join(tmp_path, 'Steam'), os.path.join(tmp_path, 'lutris/runners')]
+    assert get_missing_install_location_dirs() == []
+
+
+class StagingTestInstaller:
+
+    """
+    Installs a fake tool like GE-Proton does, into runners/proton for Lutris.
+    """
+
+    def __init__(self) -> None:
+        self.install_dirs: list[str] = []
+
+    def get_extract_dir(self, install_dir: str) -> str:
+        if get_launcher_from_installdir(install_dir) == Launcher.LUTRIS:
+            return os.path.abspath(os.path.join(install_dir, '../../runners/proton'))
+        return install_dir
+
+    def get_tool(self, version: str, install_dir: str, temp_dir: str) -> bool:
+        self.install_dirs.append(install_dir)
+        tool_dir: str = os.path.join(self.get_extract_dir(install_dir), version)
+        os.makedirs(os.path.join(tool_dir, 'files'))
+        with open(os.path.join(tool_dir, 'proton'), 'w') as f:
+            f.write('#!/usr/bin/env python3\n')
+        os.symlink('proton', os.path.join(tool_dir, 'files', 'proton-link'))
+        return True
+
+
+def test_install_tool_to_locations(tmp_path) -> None:
+
+    """
+    Test that install_tool_to_locations installs a tool once and puts it into the extract directory of each install location.
+    """
+
+    steam_dir: str = os.path.join(tmp_path, 'home/.local/share/Steam/compatibilitytools.d/')
+    lutris_dir: str = os.path.join(tmp_path, 'home/.local/share/lutris/runners/wine/')
+    for install_dir in [steam_dir, lutris_dir]:
+        os.makedirs(install_dir)
+
+    installer = StagingTestInstaller()
+    result: bool = install_tool_to_locations(installer, 'GE-Proton9-5', [steam_dir, lutris_dir], str(tmp_path))
+
+    assert result
+    assert len(installer.install_dirs) == 1
+    assert installer.install_dirs[0].startswith(get_ctool_staging_dir(steam_dir))
+
+    tool_dirs: list[str] = [os.path.join(steam_dir, 'GE-Proton9-5'), os.path.join(tmp_path, 'home/.local/share/lutris/runners/proton/GE-Proton9-5')]
+    for tool_dir in tool_dirs:
+        assert open(os.path.join(tool_dir, 'proton')).read() == '#!/usr/bin/env python3\n'
+        assert os.readlink(os.path.join(tool_dir, 'files', 'proton-link')) == 'proton'
+
+    # Each launcher gets its own copy of the files
+    assert os.stat(os.path.join(tool_dirs[0], 'proton')).st_ino != os.stat(os.path.join(tool_dirs[1], 'proton')).st_ino
+
+    assert not os.path.exists(os.path.join(lutris_dir, 'GE-Proton9-5'))
+    assert not os.path.exists(get_ctool_staging_dir(steam_dir))
+
+
+def test_install_tool_to_locations_failed(tmp_path, mocker: MockerFixture) -> None:
+
+    """
+    Test that install_tool_to_locations reports a failed installation and does not try every location again.
+    """
+
+    installer = StagingTestInstaller()
+    mocker.patch.object(installer, 'get_tool', return_value=False)
+
+    steam_dir: str = os.path.join(tmp_path, 'Steam/compatibilitytools.d/')
+    result: bool = install_tool_to_locations(installer, 'GE-Proton9-5', [steam_dir, os.path.join(tmp_path, 'heroic/tools/proton/')], str(tmp_path), staging_dir=os.path.join(tmp_path, 'staging'))
+
+    assert not result
+    assert installer.get_tool.call_count == 1
+    assert not os.path.exists(steam_dir)
+
+
+def test_get_ctool_inventory(tmp_path) -> None:
+
+    """
+    Test that get_ctool_inventory lists tool folders with their version and is only read again when the install directory, a folder without a version or a VERSION.txt changes.
+    """
+
+    install_dir: str = os.path.join(tmp_path, 'compatibilitytools.d')
+    for folder in ['GE-Proton9-5', 'Luxtorpeda']:
+        os.makedirs(os.path.join(install_dir, folder))
+    with open(os.path.join(install_dir, 'GE-Proton9-5', 'VERSION.txt'), 'w') as f:
+        f.write('GE-Proton9-5\n')
+    with open(os.path.join(install_dir, 'README.txt'), 'w') as f:
+        f.write('Not a tool')
+
+    inventory: tuple[InstalledCtoolEntry, ...] = get_ctool_inventory(install_dir)
+
+    assert sorted((entry.name, entry.version, entry.ct_type) for entry in inventory) == [('GE-Proton9-5', 'GE-Proton9-5', CTType.CUSTOM), ('Luxtorpeda', '', CTType.CUSTOM)]
+    assert get_ctool_inventory(install_dir + '/') is inventory
+    assert sorted(list_installed_ctools(install_dir)) == ['GE-Proton9-5 - GE-Proton9-5', 'Luxtorpeda']
+    assert sorted(ct.get_displayname() for ct in get_installed_ctools(install_dir)) == ['GE-Proton9-5 GE-Proton9-5', 'Luxtorpeda']
+
+    with open(os.path.join(install_dir, 'Luxtorpeda', 'VERSION.txt'), 'w') as f:
+        f.write('v70')
+    os.utime(os.path.join(install_dir, 'Luxtorpeda'), ns=(1, 1))
+
+    assert sorted(list_installed_ctools(install_dir)) == ['GE-Proton9-5 - GE-Proton9-5', 'Luxtorpeda - v70']
+
+    # Tool updated in place, the folders don't change
+    install_dir_mtime: int = os.stat(install_dir).st_mtime_ns
+    with open(os.path.join(install_dir, 'Luxtorpeda', 'VERSION.txt'), 'w') as f:
+        f.write('v71')
+    os.utime(os.path.join(install_dir, 'Luxtorpeda', 'VERSION.txt'), ns=(2, 2))
+    os.utime(os.path.join(install_dir, 'Luxtorpeda'), ns=(1, 1))
+    os.utime(install_dir, ns=(install_dir_mtime, install_dir_mtime))
+
+    assert sorted(list_installed_ctools(install_dir)) == ['GE-Proton9-5 - GE-Proton9-5', 'Luxtorpeda - v71']
+    assert get_ctool_inventory(os.path.join(tmp_path, 'missing')) == ()
+
+
+def generate_ctool_names(count: int, seed: int = 0) -> list[str]:
+
+    """
+    Generate count compatibility tool names of different formats (with duplicates).
+    """
+
+    rnd = random.Random(seed)
+    formats = [
+        lambda: f'GE-Proton{rnd.randint(7, 12)}-{rnd.randint(1, 40)}',
+        lambda: f'Proton-{rnd.randint(5, 10)}.{rnd.randint(0, 21)}',
+        lambda: f'Wine-GE-Proton{rnd.randint(7, 9)}-{rnd.randint(1, 30)}',
+        lambda: f'lutris-GE-Proton{rnd.randint(7, 9)}-{rnd.randint(1, 30)}-x86_64',
+        lambda: f'wine-tkg-git-{rnd.randint(7, 9)}.{rnd.randint(0, 22)}.r{rnd.randint(0, 30)}.g{rnd.getrandbits(28):07x}',
+        lambda: f'dxvk-{rnd.randint(1, 2)}.{rnd.randint(0, 10)}{rnd.choice(["", ".1", "-async"])}',
+        lambda: rnd.choice(['Luxtorpeda', 'Boxtron', 'SteamTinkerLaunch', 'Proton-stl', 'Roberta']),
+    ]
+
+    return [rnd.choice(formats)() for _ in range(count)]
+
+
+def test_sort_compatibility_tool_names_properties() -> None:
+
+    """
+    Test that sort_compatibility_tool_names keeps every name (including duplicates) and its result does not depend on the input order.
+    """
+
+    names: list[str] = generate_ctool_names(5000)
+    sorted_names: list[str] = sort_compatibility_tool_names(names)
+
+    assert sorted(sorted_names) == sorted(names)
+    assert sort_compatibility_tool_names(sorted_names) == sorted_names
+    assert sort_compatibility_tool_names(random.Random(1).sample(names, len(names))) == sorted_names
+    assert sort_compatibility_tool_names(names, reverse=True) == sorted_names[::-1]
+
+    ge_proton_versions: list[tuple[int, int]] = [tuple(map(int, name[len('GE-Proton'):].split('-'))) for name in sorted_names if name.startswith('GE-Proton')]
+    assert ge_proton_versions == sorted(ge_proton_versions)
+
+    proton_versions: list[tuple[int, int]] = [tuple(map(int, name[len('Proton-'):].split('.'))) for name in sorted_names if name.startswith('Proton-') and name != 'Proton-stl']
+    assert proton_versions == sorted(proton_versions)
+
+
+@pytest.mark.parametrize(
+    'unsorted, expected', [
+        pytest.param(['GE-Proton10-1', 'GE-Proton9-20', 'GE-Proton9-5'], ['GE-Proton9-5', 'GE-Proton9-20', 'GE-Proton10-1'], id='GE-Proton'),
+        pytest.param(['GE-Proton9-5', 'Proton-9.0', 'Luxtorpeda', 'Proton-10.0'], ['Luxtorpeda', 'Proton-9.0', 'Proton-10.0', 'GE-Proton9-5'], id='Groups'),
+        pytest.param(['wine-tkg-git-7.15.r10.g1234abc', 'wine-tkg-git-7.15.r2.gd2ac4d50'], ['wine-tkg-git-7.15.r2.gd2ac4d50', 'wine-tkg-git-7.15.r10.g1234abc'], id='tkg'),
+        pytest.param(['dxvk-2.10', 'dxvk-2.4', 'dxvk-1.10.3'], ['dxvk-1.10.3', 'dxvk-2.4', 'dxvk-2.10'], id='DXVK'),
+        pytest.param(['Proton-7.0', 'Proton-6.10', 'Luxtorpeda', 'Boxtron'], ['Boxtron', 'Luxtorpeda', 'Proton-6.10', 'Proton-7.0'], id='Former key collisions'),
+    ]
+)
+def test_sort_compatibility_tool_names(unsorted: list[str], expected: list[str]) -> None:
+
+    """
+    Test that sort_compatibility_tool_names sorts versions naturally and groups Valve Proton and GE-Proton.
+    """
+
+    assert sort_compatibility_tool_names(unsorted) == expected
+
+
+def test_run_host_probe(tmp_path) -> None:
+
+    """
+    Test that run_host_probe looks up executables and checks files and directories with a single shell.
+    """
+
+    file_path: str = os.path.join(tmp_path, 'file with spaces')
+    with open(file_path, 'w') as f:
+        f.write('')
+
+    missing_path: str = os.path.join(tmp_path, 'missing')
+    paths: list[tuple[str, bool]] = [(file_path, True), (str(tmp_path), False), (missing_path, False)]
+    found_executables, existing_paths = run_host_probe(['sh', 'pupgui2-missing-executable'], paths, proc_prefix=[])
+
+    assert found_executables['sh'].endswith('/sh')
+    assert found_executables['pupgui2-missing-executable'] is None
+    assert existing_paths == {file_path: True, str(tmp_path): True, missing_path: False}
+    assert run_host_probe([], [(str(tmp_path), True)], proc_prefix=[])[1] == {str(tmp_path): False}
+
+
+def test_host_which_all_flatpak(mocker: MockerFixture) -> None:
+
+    """
+    Test that host_which_all resolves all executables with one flatpak-spawn call and caches them for the session.
+    """
+
+    mocker.patch('pupgui2.util.IS_FLATPAK', True)
+    mocker.patch.dict('pupgui2.util._host_which_cache', clear=True)
+    run = mocker.patch('pupgui2.util.subprocess.run', return_value=subprocess.CompletedProcess([], 0, stdout='/usr/bin/git\n\n'))
+
+    assert host_which_all(['git', 'xdotool']) == {'git': '/usr/bin/git', 'xdotool': None}
+    assert host_which_all(['xdotool', 'git']) == {'xdotool': None, 'git': '/usr/bin/git'}
+    assert host_which('git') == '/usr/bin/git'
+
+    assert run.call_count == 1
+    assert run.call_args.args[0][:2] == ['flatpak-spawn', '--host']
+    assert run.call_args.args[0][-2:] == ['w:git', 'w:xdotool']